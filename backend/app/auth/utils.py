@@ -1,5 +1,6 @@
 # backend/app/auth/token.py
 
+import logging
 from datetime import datetime, timedelta
 from jose import JWTError, jwt
 from fastapi import HTTPException, status
@@ -11,6 +12,8 @@ from sqlalchemy.orm import Session
 from app.models.user import User
 from app.models.follow import Follow
 
+logger = logging.getLogger(__name__)
+
 
 
 # 비밀번호 해싱 설정
@@ -34,10 +37,9 @@ def create_access_token(data: dict) -> str:
             settings.JWT_SECRET_KEY,
             algorithm=settings.JWT_ALGORITHM
         )
-        print("✅ 생성된 JWT:", encoded_jwt)  # ✅ 이 위치로 이동
         return encoded_jwt
     except Exception as e:
-        print(f"❌ JWT 생성 오류: {str(e)}")
+        logger.exception("JWT 생성 오류")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="토큰 생성 중 오류가 발생했습니다."
@@ -60,7 +62,7 @@ def verify_token(token: str) -> int:
             )
         return user_id
     except JWTError as e:
-        print(f"❌ JWT 검증 실패: {str(e)}")
+        logger.info("JWT 검증 실패: %s", e)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="인증 정보가 만료되었거나 유효하지 않습니다",
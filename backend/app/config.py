@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
@@ -12,6 +14,30 @@ class Settings(BaseSettings):
     db_user: str = "root"
     db_password: str = "rootpw"
     db_name: str = "carering"
+    database_url: Optional[str] = None  # 지정하면 위 값 대신 사용 (예: sqlite:///./dev.db)
+    db_echo: bool = False               # 모든 SQL 출력 (디버깅용, 느린 쿼리는 slow_query_ms로 확인)
+
+    # 📮 Redis 설정
+    redis_url: str = "redis://localhost:6379"
+    redis_max_connections: int = 512   # 비동기 풀 상한 (다 쓰면 redis_pool_timeout 동안 빈 연결을 기다림)
+    redis_pool_timeout: float = 5.0
+
+    # ⚡ 목록 API 빠른 JSON 경로 (orjson 직렬화, 응답 모델 재검증 생략)
+    fast_json: bool = True
+    fast_json_validate: bool = False  # 개발 중 응답 모양 검증용
+
+    # 🔎 요청별 SQL 집계 (app/utils/query_stats.py)
+    sql_stats_headers: bool = False   # 개발용: X-DB-Queries / X-DB-Time-Ms 응답 헤더
+    n_plus_one_threshold: int = 5     # 같은 SQL이 요청 안에서 이만큼 반복되면 N+1로 표시
+    slow_query_ms: float = 200        # 이보다 오래 걸린 SQL은 느린 쿼리로 기록 (app/utils/slow_queries.py)
+    slow_query_explain: bool = True   # 느린 SELECT의 EXPLAIN 자동 수집
+
+    # 🗄️ 공개 GET 응답 캐시 (app/utils/response_cache.py)
+    response_cache: bool = True
+
+    # 📝 로깅 (app/utils/log.py)
+    log_level: str = "INFO"
+    log_sample_rate: float = 1.0   # WARNING 미만 로그를 남기는 비율 (0~1)
 
     # ✅ 기타 설정
     secret_key: str = "super-secret-value-123"
@@ -1,3 +1,5 @@
+import logging
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
@@ -9,6 +11,8 @@ from app.database import get_db
 from app.models.user import User
 from app.config import settings  # ✅ 설정 객체 import
 
+logger = logging.getLogger(__name__)
+
 # OAuth2 스킴 설정
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")  # 프론트의 로그인 경로에 따라 조정
 
@@ -17,10 +21,9 @@ def get_current_user(
     token: str = Depends(oauth2_scheme),
     db: Session = Depends(get_db)
 ) -> User:
-    print("📦 Token received in dependency:", token)
-
+    # 토큰 원문은 로그에 남기지 않음
     if not token or "." not in token:
-        print("❌ Invalid token format")
+        logger.info("Invalid token format")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="유효하지 않은 토큰 형식입니다."
@@ -28,27 +31,24 @@ def get_current_user(
 
     try:
         payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])  # ✅ 수정
-        print("✅ Token payload:", payload)
         user_id: int = payload.get("user_id")
         if user_id is None:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="토큰에 사용자 정보가 없습니다.")
     except JWTError as e:
-        print("❌ JWT decoding failed:", str(e))
+        logger.info("JWT decoding failed: %s", e)
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="토큰 검증 실패")
 
     user = db.query(User).filter(User.id == user_id).first()
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="사용자를 찾을 수 없습니다.")
 
-    print("🙆 인증된 유저 반환:", user.email)
+    logger.debug("Authenticated user", extra={"user_id": user.id})
     return user
 
 async def get_token(websocket: WebSocket) -> int:
     token = websocket.query_params.get("token")
-    print("📦 WebSocket received token:", token)
-
     if not token or "." not in token:
-        print("❌ Invalid token format in WebSocket")
+        logger.info("Invalid token format in WebSocket")
         raise WebSocketException(
             code=status.WS_1008_POLICY_VIOLATION,
             reason="유효하지 않은 토큰 형식입니다."
@@ -56,7 +56,6 @@ async def get_token(websocket: WebSocket) -> int:
 
     try:
         payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
-        print("✅ WebSocket Token payload:", payload)
         user_id: int = payload.get("user_id")
         if user_id is None:
             raise WebSocketException(
@@ -65,7 +64,7 @@ async def get_token(websocket: WebSocket) -> int:
             )
         return user_id
     except JWTError as e:
-        print("❌ JWT decoding failed in WebSocket:", str(e))
+        logger.info("JWT decoding failed in WebSocket: %s", e)
         raise WebSocketException(
             code=status.WS_1008_POLICY_VIOLATION,
             reason="토큰 검증 실패"
@@ -1,5 +1,6 @@
 import os
 import asyncio
+from contextlib import asynccontextmanager
 from typing import Optional
 from fastapi import FastAPI, HTTPException, Depends, APIRouter
 from fastapi.middleware.cors import CORSMiddleware
@@ -13,17 +14,46 @@ from socketio import ASGIApp
 
 from app.sockets import sio
 from app.websocket_routes import router as websocket_router
-from app.websocket_client import subscribe_to_redis
-from app.routes import mood, widget_layout, upload, basic_info, lifestyle, user, message, follow, favorite, login, post, comment, search, medicines, customization
+from app.redis_subscriber import bridge
+from app import presence
+from app.reminders import reminder_scheduler
+from app.routes import mood, widget_layout, upload, basic_info, lifestyle, user, message, follow, favorite, login, post, comment, search, medicines, customization, realtime, profile, batch, medication_plan, metrics, presence as presence_routes
 from app.auth.utils import hash_password, verify_token
 from app.database import Base, engine, SessionLocal, get_db
+from app.utils.media import ensure_media_dirs
+from app.utils.redis import close_redis
+from app.utils.query_stats import QueryStatsMiddleware, instrument_engine
+from app.utils.slow_queries import slow_query_log
+from app.utils.metrics import MetricsMiddleware
+from app.utils.log import RequestIdMiddleware, setup_logging, shutdown_logging
+from app.config import settings
 from app.models import User, Comment, Post, BasicInfo, Lifestyle
 from app.routes.login import create_access_token
 from app.dependencies import get_current_user
 from app.schemas import CommentCreate
 
+# ✅ 앱 수명 주기: import 시점에는 외부 연결을 만들지 않고, 여기서 시작/정리
+# (DB 스키마는 Alembic 마이그레이션으로 관리: alembic upgrade head)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    setup_logging()              # JSON 로그 → 큐 → 백그라운드 스레드에서 stdout
+    ensure_media_dirs()
+    bridge.start()               # Redis → 실시간 브릿지
+    presence.start_heartbeat()
+    reminder_scheduler.start()
+    try:
+        yield
+    finally:
+        await bridge.stop()
+        await presence.stop_heartbeat()
+        await reminder_scheduler.stop()
+        await close_redis()
+        slow_query_log.shutdown()
+        engine.dispose()
+        shutdown_logging()
+
 # ✅ FastAPI 인스턴스 생성
-fastapi_app = FastAPI()
+fastapi_app = FastAPI(lifespan=lifespan)
 
 # ✅ CORS 설정
 fastapi_app.add_middleware(
@@ -32,15 +62,23 @@ fastapi_app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag", "X-DB-Queries", "X-DB-Time-Ms", "X-DB-N-Plus-One", "X-Request-ID", "X-Cache"],
 )
 
-# ✅ DB 테이블 생성
-Base.metadata.create_all(bind=engine)
+# ✅ 요청별 SQL 횟수 / DB 시간 집계 (개발에서는 응답 헤더로도 표시)
+instrument_engine(engine)
+slow_query_log.install(engine)   # SQL 지문별 p50/p95/max + 느린 쿼리 EXPLAIN (/metrics/slow-queries)
+fastapi_app.add_middleware(QueryStatsMiddleware, headers=settings.sql_stats_headers)
 
-# ✅ 정적 디렉토리 마운트
-os.makedirs("media/profiles", exist_ok=True)
-fastapi_app.mount("/media", StaticFiles(directory="media"), name="media")
-fastapi_app.mount("/static", StaticFiles(directory="static"), name="static")
+# ✅ 라우트별 요청 수 / 지연 히스토그램 / 처리 중 요청 수 (/metrics)
+fastapi_app.add_middleware(MetricsMiddleware)
+
+# ✅ 요청 ID (X-Request-ID): 로그 레코드에 붙고 응답 헤더로 돌려줌 — 가장 바깥에서 설정
+fastapi_app.add_middleware(RequestIdMiddleware)
+
+# ✅ 정적 디렉토리 마운트 (디렉토리는 lifespan에서 생성하므로 여기서는 확인하지 않음)
+fastapi_app.mount("/media", StaticFiles(directory="media", check_dir=False), name="media")
+fastapi_app.mount("/static", StaticFiles(directory="static", check_dir=False), name="static")
 
 # ✅ 회원가입 API
 class SignupRequest(BaseModel):
@@ -66,11 +104,6 @@ async def signup(data: SignupRequest):
     finally:
         db.close()
 
-# ✅ Redis Subscriber 백그라운드 실행
-@fastapi_app.on_event("startup")
-async def startup_event():
-    asyncio.create_task(subscribe_to_redis())
-
 # ✅ 라우터 등록
 fastapi_app.include_router(login.router)
 fastapi_app.include_router(user.router, prefix="/users", tags=["users"])
@@ -85,10 +118,15 @@ fastapi_app.include_router(websocket_router)
 fastapi_app.include_router(mood.router)
 fastapi_app.include_router(search.router)
 fastapi_app.include_router(medicines.router)
+fastapi_app.include_router(medication_plan.router)
 fastapi_app.include_router(customization.router)
+fastapi_app.include_router(profile.router)
+fastapi_app.include_router(batch.router)
 fastapi_app.include_router(widget_layout.router)
 fastapi_app.include_router(upload.router)
+fastapi_app.include_router(realtime.router)
+fastapi_app.include_router(presence_routes.router)
+fastapi_app.include_router(metrics.router)
 
-# ✅ 최종 SocketIO 통합
-sio = socketio.AsyncServer(cors_allowed_origins="*", allow_credentials=True)
+# ✅ 최종 SocketIO 통합 (app.sockets의 이벤트 핸들러가 등록된 서버 사용)
 app = ASGIApp(sio, other_asgi_app=fastapi_app)
\ No newline at end of file
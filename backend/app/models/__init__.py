@@ -7,6 +7,9 @@ from .message import Message  # ✅ 새로 추가한 모델
 from .follow import Follow
 from .comment_like import CommentLike  # 또는 models.py라면 from .models import CommentLike
 from .mood import Mood  # ← 이것이 있어야 Base.metadata.create_all 이 먹힘
+from .conversation_read import ConversationRead
+from .medication_plan import MedicationPlan, MedicationDose
+from .reminder_delivery import ReminderDelivery
 __all__ = [
     "User",
     "BasicInfo",
@@ -16,5 +19,9 @@ __all__ = [
     "Message",
     "Follow",
     "CommentLike",
-   "Mood"
+   "Mood",
+    "ConversationRead",
+    "MedicationPlan",
+    "MedicationDose",
+    "ReminderDelivery"
 ]
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, func
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Index, func
 from sqlalchemy.orm import relationship
 from sqlalchemy.ext.hybrid import hybrid_property
 from app.database import Base
@@ -18,6 +18,10 @@ class Comment(Base):
     user = relationship("User", back_populates="comments")
     post = relationship("Post", back_populates="comments")
     likes = relationship("CommentLike", back_populates="comment") 
+
+    # 게시글별 댓글을 작성순으로 커서 페이지네이션하기 위한 인덱스
+    __table_args__ = (Index("ix_comments_post_created_id", "post_id", "created_at", "id"),)
+
     # 닉네임 접근용 하이브리드 속성
     @hybrid_property
     def user_name(self):
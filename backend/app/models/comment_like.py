@@ -7,7 +7,7 @@ class CommentLike(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
-    comment_id = Column(Integer, ForeignKey("comments.id"))
+    comment_id = Column(Integer, ForeignKey("comments.id"), index=True)
 
     __table_args__ = (UniqueConstraint('user_id', 'comment_id', name='unique_user_comment_like'),)
 
@@ -0,0 +1,14 @@
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, UniqueConstraint
+from datetime import datetime
+from app.database import Base
+
+class ConversationRead(Base):
+    __tablename__ = "conversation_reads"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)   # 읽은 사람
+    peer_id = Column(Integer, ForeignKey("users.id"), nullable=False)   # 대화 상대 (메시지 보낸 사람)
+    last_read_message_id = Column(Integer, nullable=False, default=0)   # 여기까지 읽음 (단조 증가)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (UniqueConstraint('user_id', 'peer_id', name='unique_conversation_read'),)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, DateTime, func
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Index, func
 from app.database import Base
 
 class Follow(Base):
@@ -7,4 +7,10 @@ class Follow(Base):
     id = Column(Integer, primary_key=True, index=True)
     follower_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     following_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
-    created_at = Column(DateTime, default=func.now())
\ No newline at end of file
+    created_at = Column(DateTime, default=func.now())
+
+    # 팔로잉 목록/여부는 (follower_id, following_id), 팔로워 수는 following_id로 조회
+    __table_args__ = (
+        Index("ix_follows_follower_following", "follower_id", "following_id"),
+        Index("ix_follows_following_id", "following_id"),
+    )
@@ -6,7 +6,7 @@ class Lifestyle(Base):
     __tablename__ = "lifestyle"
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     medical_history = Column(String(255), nullable=False)
     health_goals = Column(String(255), nullable=False)
     diet_tracking = Column(String(255), nullable=False)
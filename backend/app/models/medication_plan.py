@@ -0,0 +1,49 @@
+# app/models/medication_plan.py
+# ✅ 반복 복용 계획 + 복용 기록(예외) 모델
+#
+# 복용 일정은 계획(반복 규칙) 하나로 저장하고, 날짜 범위가 요청될 때 펼친다 (app/utils/recurrence.py).
+# 개별 복용 행은 복용함/건너뜀처럼 기록이 생긴 경우에만 만든다.
+
+from sqlalchemy import Column, Integer, String, Date, Time, DateTime, JSON, ForeignKey, Index, UniqueConstraint
+from sqlalchemy.orm import relationship
+from datetime import datetime
+from app.database import Base
+
+class MedicationPlan(Base):
+    __tablename__ = "medication_plans"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    title = Column(String(100), nullable=False)
+    frequency = Column(String(10), nullable=False)            # daily / weekly / interval
+    interval_days = Column(Integer, nullable=False, default=1)  # interval: N일마다
+    weekdays = Column(JSON, nullable=True)                    # weekly: [0(월) ~ 6(일)]
+    times = Column(JSON, nullable=False)                      # ["08:00", "20:00"]
+    start_date = Column(Date, nullable=False)
+    end_date = Column(Date, nullable=True)                    # NULL이면 종료일 없음
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    doses = relationship("MedicationDose", back_populates="plan", cascade="all, delete-orphan")
+
+    __table_args__ = (
+        Index("ix_medication_plans_user_start", "user_id", "start_date"),
+    )
+
+
+class MedicationDose(Base):
+    __tablename__ = "medication_doses"
+
+    id = Column(Integer, primary_key=True, index=True)
+    plan_id = Column(Integer, ForeignKey("medication_plans.id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    date = Column(Date, nullable=False)
+    time = Column(Time, nullable=False)
+    status = Column(String(10), nullable=False)               # taken / skipped
+    recorded_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    plan = relationship("MedicationPlan", back_populates="doses")
+
+    __table_args__ = (
+        UniqueConstraint("plan_id", "date", "time", name="unique_medication_dose"),
+        Index("ix_medication_doses_user_date", "user_id", "date"),
+    )
@@ -1,5 +1,5 @@
 # models.py
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, Integer, String, Date, Time, ForeignKey, Index
 # ✅ 수정된 코드
 from app.database import Base
 
@@ -7,7 +7,13 @@ class Medicine(Base):
     __tablename__ = 'medicines'
 
     id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=True)  # 이전 데이터는 NULL
     name = Column(String(100))  # ✅ 길이 지정
-    date = Column(String(20)) 
-    time = Column(String(20), nullable=False)   # ✅ 길이 명시
-    title = Column(String(100), nullable=False) # ✅ 길이 명시
\ No newline at end of file
+    date = Column(Date)
+    time = Column(Time, nullable=False)
+    title = Column(String(100), nullable=False) # ✅ 길이 명시
+
+    # ✅ 캘린더(사용자 + 날짜 범위) 조회용
+    __table_args__ = (
+        Index("ix_medicines_user_date", "user_id", "date"),
+    )
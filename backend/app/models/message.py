@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, Text, DateTime, Boolean
+from sqlalchemy import Column, Integer, ForeignKey, Text, DateTime, Boolean, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.database import Base
@@ -16,4 +16,11 @@ class Message(Base):
 
     # 관계 설정: 사용자 모델과 연결
     sender = relationship("User", foreign_keys=[sender_id], back_populates="sent_messages")
-    receiver = relationship("User", foreign_keys=[receiver_id], back_populates="received_messages")
\ No newline at end of file
+    receiver = relationship("User", foreign_keys=[receiver_id], back_populates="received_messages")
+
+    # 대화 조회(보낸/받은/양방향)는 (sender_id, receiver_id) + timestamp 정렬,
+    # 안 읽은 개수와 대화 목록의 "받은 메시지" 쪽은 receiver_id로 시작하는 인덱스 사용
+    __table_args__ = (
+        Index("ix_messages_sender_receiver_ts", "sender_id", "receiver_id", "timestamp"),
+        Index("ix_messages_receiver_sender_read", "receiver_id", "sender_id", "is_read"),
+    )
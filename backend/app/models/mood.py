@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.database import Base
@@ -13,4 +13,10 @@ class Mood(Base):
     image = Column(String(255), nullable=True)  # ✅ 길이 명시
     created_at = Column(DateTime, default=datetime.utcnow)
 
-    user = relationship("User", back_populates="moods")
\ No newline at end of file
+    user = relationship("User", back_populates="moods")
+
+    # 사용자별 최신 무드 조회 / 12시간 지난 무드 정리
+    __table_args__ = (
+        Index("ix_moods_user_created", "user_id", "created_at"),
+        Index("ix_moods_created_at", "created_at"),
+    )
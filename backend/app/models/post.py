@@ -10,19 +10,20 @@ class Post(Base):
     id = Column(Integer, primary_key=True, index=True)
     image = Column(LargeBinary, nullable=True)
     # 작성자 정보
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     user = relationship("User", back_populates="posts")  # 사용자 관계
 
     # 글/이미지/시간
     phrase = Column(String(500), nullable=True)               # 글 내용
-    text = Column(String, nullable=True)                      # 호환성 유지
+    text = Column(Text, nullable=True)                        # 호환성 유지
     hashtags = Column(String(500), nullable=True)             # 해시태그
     image_url = Column(String(1000), nullable=True)           # 이미지 URL
-    image = Column(String, nullable=True)                     # 호환성 유지
+    image = Column(Text, nullable=True)                       # 호환성 유지 (MySQL VARCHAR는 길이 필수)
     location = Column(String(255), nullable=True)             # 위치 정보
     person_tag = Column(String(255), nullable=True)           # 사람 태그
     disclosure = Column(String(50), nullable=True, default="public")  # 공개 범위
     likes = Column(Integer, default=0)
+    comment_count = Column(Integer, nullable=False, default=0, server_default="0")  # 댓글 수 (작성/삭제 시 갱신)
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
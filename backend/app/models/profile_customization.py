@@ -9,5 +9,6 @@ class ProfileCustomization(Base):
     user_id = Column(Integer, ForeignKey("users.id"), unique=True)
     background_url = Column(String(255), nullable=True)
     widgets_json = Column(Text, nullable=True)
+    version = Column(Integer, nullable=False, default=1, server_default="1")  # 수정될 때마다 +1 (ETag / 캐시 키)
 
     user = relationship("User", back_populates="customization")
\ No newline at end of file
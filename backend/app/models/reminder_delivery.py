@@ -0,0 +1,23 @@
+# app/models/reminder_delivery.py
+# ✅ 복용 알림 전송 기록
+#
+# source_key(예: "plan:3:2025-07-01T08:00", "medicine:12")가 유니크라서
+# 여러 워커가 같은 알림을 동시에 보내려 해도 먼저 INSERT한 쪽만 전송한다.
+
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
+from datetime import datetime
+from app.database import Base
+
+class ReminderDelivery(Base):
+    __tablename__ = "reminder_deliveries"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    source_key = Column(String(64), nullable=False, unique=True)
+    due_at = Column(DateTime, nullable=False)
+    status = Column(String(10), nullable=False, default="sent")   # sent / failed
+    sent_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("ix_reminder_deliveries_user_due", "user_id", "due_at"),
+    )
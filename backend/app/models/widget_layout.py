@@ -1,9 +1,14 @@
-from sqlalchemy import Column, Integer, ForeignKey, JSON
+from sqlalchemy import Column, Integer, ForeignKey, JSON, DateTime, UniqueConstraint
+from datetime import datetime
 from app.database import Base
 
 class WidgetLayout(Base):
     __tablename__ = "widget_layouts"
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    layout_json = Column(JSON, nullable=False)
\ No newline at end of file
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)  # 사용자당 한 행 (아래 유니크 제약)
+    layout_json = Column(JSON, nullable=False)
+    version = Column(Integer, nullable=False, default=1, server_default="1")  # 수정될 때마다 +1 (ETag)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (UniqueConstraint("user_id", name="uq_widget_layouts_user_id"),)
@@ -0,0 +1,143 @@
+# app/presence.py
+# ✅ 멀티 디바이스 / 멀티 워커 접속 상태(presence) 관리
+#
+# Redis 해시 presence:{user_id} 에 연결 ID → "워커ID|마지막 하트비트" 를 저장하고,
+# 키 TTL을 하트비트로 갱신한다. 모든 연결이 사라지면 키가 만료되므로
+# 온라인 여부는 EXISTS 한 번(O(1))으로 확인할 수 있다.
+# 실제 소켓 객체는 이 워커의 local 레지스트리에만 보관한다.
+
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+from typing import Dict, Iterable, List, Optional
+
+from fastapi import WebSocket
+
+from app.utils.redis import get_async_redis
+
+logger = logging.getLogger(__name__)
+
+PRESENCE_TTL = 60            # 하트비트가 없으면 이 시간(초) 후 오프라인
+HEARTBEAT_INTERVAL = 20      # 워커 단위 하트비트 주기(초)
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+# user_id → {conn_id: WebSocket (Socket.IO 연결은 None)}
+local_connections: Dict[int, Dict[str, Optional[WebSocket]]] = {}
+
+_heartbeat_task: Optional[asyncio.Task] = None
+
+
+def _key(user_id: int) -> str:
+    return f"presence:{user_id}"
+
+
+def _value() -> str:
+    return f"{WORKER_ID}|{time.time():.0f}"
+
+
+# ✅ 연결 등록 / 해제
+#    Redis 기록이 성공한 뒤에만 local 레지스트리에 넣는다.
+#    (실패하면 호출자가 conn_id를 못 받아 해제하지 못하므로, 남은 소켓이 fan-out 목록에 영원히 남음)
+async def register(user_id: int, websocket: Optional[WebSocket] = None, conn_id: Optional[str] = None) -> str:
+    conn_id = conn_id or uuid.uuid4().hex
+
+    r = get_async_redis()
+    async with r.pipeline(transaction=False) as pipe:
+        pipe.hset(_key(user_id), conn_id, _value())
+        pipe.expire(_key(user_id), PRESENCE_TTL)
+        await pipe.execute()
+
+    return register_local(user_id, websocket, conn_id)
+
+
+def register_local(user_id: int, websocket: Optional[WebSocket] = None, conn_id: Optional[str] = None) -> str:
+    # Redis 기록 없이 이 워커의 전달 대상으로만 등록 (Redis 장애 시 /ws가 사용).
+    # 다음 하트비트가 local 레지스트리를 Redis에 다시 기록하므로 복구되면 온라인으로 보인다.
+    conn_id = conn_id or uuid.uuid4().hex
+    local_connections.setdefault(user_id, {})[conn_id] = websocket
+    return conn_id
+
+
+async def unregister(user_id: int, conn_id: str):
+    conns = local_connections.get(user_id)
+    if conns is not None:
+        conns.pop(conn_id, None)
+        if not conns:
+            local_connections.pop(user_id, None)
+    await get_async_redis().hdel(_key(user_id), conn_id)
+
+
+def local_sockets(user_id: int) -> List[WebSocket]:
+    return [ws for ws in local_connections.get(user_id, {}).values() if ws is not None]
+
+
+def drop_local_socket(user_id: int, websocket: WebSocket):
+    conns = local_connections.get(user_id, {})
+    for conn_id, ws in list(conns.items()):
+        if ws is websocket:
+            conns.pop(conn_id, None)
+    if not conns:
+        local_connections.pop(user_id, None)
+
+
+# ✅ 조회
+async def is_online(user_id: int) -> bool:
+    return bool(await get_async_redis().exists(_key(user_id)))
+
+
+async def get_presence(user_ids: Iterable[int]) -> Dict[int, Dict[str, object]]:
+    user_ids = list(dict.fromkeys(user_ids))
+    r = get_async_redis()
+    async with r.pipeline(transaction=False) as pipe:
+        for uid in user_ids:
+            pipe.hvals(_key(uid))
+        rows = await pipe.execute()
+
+    cutoff = time.time() - PRESENCE_TTL
+    result = {}
+    for uid, values in zip(user_ids, rows):
+        devices = 0
+        last_seen = None
+        for raw in values:
+            seen = float(raw.rsplit("|", 1)[-1])
+            if seen >= cutoff:  # 죽은 워커가 남긴 연결은 제외
+                devices += 1
+                last_seen = max(last_seen or seen, seen)
+        result[uid] = {"online": devices > 0, "devices": devices, "last_seen": last_seen}
+    return result
+
+
+# ✅ 워커 하트비트: 이 워커의 모든 연결을 한 번의 파이프라인으로 갱신
+async def _heartbeat_loop():
+    while True:
+        await asyncio.sleep(HEARTBEAT_INTERVAL)
+        if not local_connections:
+            continue
+        try:
+            value = _value()
+            r = get_async_redis()
+            async with r.pipeline(transaction=False) as pipe:
+                for user_id, conns in list(local_connections.items()):
+                    for conn_id in conns:
+                        pipe.hset(_key(user_id), conn_id, value)
+                    pipe.expire(_key(user_id), PRESENCE_TTL)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning("Presence heartbeat error: %s", e)
+
+
+def start_heartbeat():
+    global _heartbeat_task
+    if _heartbeat_task is None:
+        _heartbeat_task = asyncio.create_task(_heartbeat_loop(), name="presence-heartbeat")
+
+
+async def stop_heartbeat():
+    global _heartbeat_task
+    if _heartbeat_task is not None:
+        _heartbeat_task.cancel()
+        await asyncio.gather(_heartbeat_task, return_exceptions=True)
+        _heartbeat_task = None
@@ -1,27 +1,227 @@
-import redis
+# app/redis_subscriber.py
+# ✅ Redis(chat_channel / post_channel) → Socket.IO 룸 + 네이티브 WebSocket 브릿지
+#
+# - 하나의 asyncio 소비 태스크가 메시지를 배치로 꺼내고, JSON 디코딩은 메시지당 한 번만 수행
+# - 리더 → 디스패처 사이는 크기 제한 큐로 연결되어 느린 클라이언트가 있으면 리더가 대기 (backpressure)
+# - 연결이 끊기면 지터가 섞인 지수 백오프로 재접속
+# - 수신/전달/드롭 수, 큐 깊이, 지연(lag)을 snapshot()으로 노출
+
+import asyncio
 import json
-from app.sockets import sio  # ✅ Socket.IO Server import
+import logging
+import random
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import redis.asyncio as aioredis
+
+from app.config import settings
+from app.sockets import sio
+from app import presence
+from app.routes.comment import active_connections as comment_connections
+
+logger = logging.getLogger(__name__)
+
+CHANNELS = ("chat_channel", "post_channel")
+
+BATCH_SIZE = 100          # 한 번에 꺼내는 최대 메시지 수
+QUEUE_MAXSIZE = 1000      # 리더 → 디스패처 큐 크기 (가득 차면 리더가 대기)
+SEND_TIMEOUT = 2.0        # 네이티브 WebSocket 한 건 전송 제한 시간(초)
+BACKOFF_BASE = 0.5        # 재접속 백오프 시작값(초)
+BACKOFF_MAX = 30.0        # 재접속 백오프 상한(초)
 
-r = redis.Redis(host="localhost", port=6379, decode_responses=True)
 
-def listen_to_redis():
-    pubsub = r.pubsub()
-    pubsub.subscribe('chat_channel', 'post')
+class RedisBridge:
+    def __init__(self, redis_url: Optional[str] = None, channels=CHANNELS):
+        self.redis_url = redis_url or settings.redis_url
+        self.channels = tuple(channels)
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._lag_ms: List[float] = []
+        self.metrics: Dict[str, Any] = {
+            "received": 0,
+            "dispatched": 0,
+            "dropped": 0,
+            "decode_errors": 0,
+            "dispatch_errors": 0,
+            "reconnects": 0,
+            "batches": 0,
+            "last_lag_ms": 0.0,
+            "max_lag_ms": 0.0,
+            "connected": False,
+        }
 
-    for message in pubsub.listen():
-        if message['type'] == 'message':
+    # ✅ FastAPI startup 훅에서 호출
+    def start(self):
+        if self._tasks:
+            return
+        self._queue = asyncio.Queue(maxsize=QUEUE_MAXSIZE)
+        self._tasks = [
+            asyncio.create_task(self._reader(), name="redis-bridge-reader"),
+            asyncio.create_task(self._dispatcher(), name="redis-bridge-dispatcher"),
+        ]
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self.metrics["connected"] = False
+
+    def snapshot(self) -> Dict[str, Any]:
+        lags = sorted(self._lag_ms)
+        data = dict(self.metrics)
+        data["queue_depth"] = self._queue.qsize() if self._queue else 0
+        data["p50_lag_ms"] = round(lags[len(lags) // 2], 3) if lags else 0.0
+        data["p99_lag_ms"] = round(lags[min(len(lags) - 1, int(len(lags) * 0.99))], 3) if lags else 0.0
+        return data
+
+    # ------------------------
+    # 읽기: Redis → 큐
+    # ------------------------
+
+    async def _reader(self):
+        attempt = 0
+        while True:
+            client = aioredis.from_url(self.redis_url)
+            pubsub = client.pubsub()
             try:
-                if message['channel'] == 'chat_channel':
-                    data = json.loads(message['data'])
-                    receiver_id = data.get("receiver_id")
-                    content = data.get("content")
-                    # ✅ Socket.IO emit으로 전송
-                    sio.emit("receive_message", {"content": content}, room=str(receiver_id))
-
-                elif message['channel'] == 'post':
-                    data = json.loads(message['data'])
-                    post_id = data.get("post_id")
-                    # ✅ 게시글 알림도 Socket.IO emit으로 전송
-                    sio.emit("new_post", {"type": "new_post", "post_id": post_id}, room="feed")
+                await pubsub.subscribe(*self.channels)
+                self.metrics["connected"] = True
+                attempt = 0
+                logger.info("Redis bridge subscribed: %s", ", ".join(self.channels))
+
+                while True:
+                    first = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if first is None:
+                        continue
+                    batch = [first]
+                    while len(batch) < BATCH_SIZE:
+                        nxt = await pubsub.get_message(ignore_subscribe_messages=True, timeout=0.0)
+                        if nxt is None:
+                            break
+                        batch.append(nxt)
+
+                    self.metrics["batches"] += 1
+                    for raw in batch:
+                        item = self._decode(raw)
+                        if item is not None:
+                            await self._queue.put(item)  # 큐가 가득 차면 여기서 대기
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
-                print("❌ Error in Redis message handling:", e)
\ No newline at end of file
+                self.metrics["connected"] = False
+                self.metrics["reconnects"] += 1
+                delay = min(BACKOFF_MAX, BACKOFF_BASE * (2 ** attempt))
+                delay = random.uniform(delay / 2, delay)  # 지터: 여러 워커의 동시 재접속 방지
+                attempt += 1
+                logger.warning("Redis bridge error: %s (retry in %.1fs)", e, delay)
+                await asyncio.sleep(delay)
+            finally:
+                try:
+                    await pubsub.aclose()
+                    await client.aclose()
+                except Exception:
+                    pass
+
+    def _decode(self, raw: Dict[str, Any]) -> Optional[Tuple[str, Dict[str, Any], float]]:
+        self.metrics["received"] += 1
+        channel = raw["channel"]
+        if isinstance(channel, bytes):
+            channel = channel.decode()
+        try:
+            data = json.loads(raw["data"])
+        except (TypeError, ValueError):
+            self.metrics["decode_errors"] += 1
+            return None
+        if not isinstance(data, dict):
+            self.metrics["decode_errors"] += 1
+            return None
+        return channel, data, time.monotonic()
+
+    # ------------------------
+    # 전달: 큐 → Socket.IO / 네이티브 WebSocket
+    # ------------------------
+
+    async def _dispatcher(self):
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < BATCH_SIZE and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            for channel, data, received_at in batch:
+                try:
+                    if channel == "chat_channel":
+                        await self._dispatch_chat(data)
+                    elif channel == "post_channel":
+                        await self._dispatch_post(data)
+                    self.metrics["dispatched"] += 1
+                except Exception:
+                    self.metrics["dispatch_errors"] += 1
+                    logger.exception("Error in Redis message handling")
+                self._record_lag((time.monotonic() - received_at) * 1000)
+
+    def _record_lag(self, lag_ms: float):
+        self.metrics["last_lag_ms"] = round(lag_ms, 3)
+        self.metrics["max_lag_ms"] = max(self.metrics["max_lag_ms"], round(lag_ms, 3))
+        self._lag_ms.append(lag_ms)
+        if len(self._lag_ms) > 1000:
+            del self._lag_ms[:500]
+
+    async def _dispatch_chat(self, data: Dict[str, Any]):
+        room = data.get("room")
+        if not room:
+            return  # {"user", "msg"} 형태는 Go 서버 전용
+        event = data.get("type") or "receive_message"
+        if event == "typing":
+            # Socket.IO typing 이벤트는 기존 클라이언트 규약대로 senderId만 전달
+            sio_event = "stop_typing" if data.get("state") == "stopped" else "typing"
+            await sio.emit(sio_event, data.get("senderId"), room=room)
+        else:
+            await sio.emit(event, data, room=room)
+
+        user_id = room[len("user_"):]
+        if room.startswith("user_") and user_id.isdigit():
+            # ✅ 이 워커에 붙어 있는 해당 유저의 모든 디바이스로 전달
+            sockets = presence.local_sockets(int(user_id))
+            if sockets:
+                alive = await self._send_many(sockets, json.dumps(data))
+                for ws in sockets:
+                    if ws not in alive:
+                        presence.drop_local_socket(int(user_id), ws)
+
+    async def _dispatch_post(self, data: Dict[str, Any]):
+        event = data.get("type")
+        if not event:
+            return
+        await sio.emit(event, data, room="feed")
+
+        if event == "new_comment":
+            comment = data.get("comment") or {}
+            post_id = comment.get("post_id")
+            clients = comment_connections.get(post_id)
+            if clients:
+                # 전송 중에 새로 붙은 소켓이 빠지지 않도록 목록을 바꾸지 않고 실패한 소켓만 제거
+                sockets = list(clients)
+                alive = await self._send_many(sockets, json.dumps(comment))
+                for ws in sockets:
+                    if ws not in alive and ws in clients:
+                        clients.remove(ws)
+
+    async def _send_many(self, sockets, text: str):
+        # 한 번 직렬화한 텍스트를 동시에 전송하고, 시간 내 못 받는 소켓은 드롭
+        results = await asyncio.gather(
+            *(asyncio.wait_for(ws.send_text(text), SEND_TIMEOUT) for ws in sockets),
+            return_exceptions=True,
+        )
+        alive = []
+        for ws, result in zip(sockets, results):
+            if isinstance(result, BaseException):
+                self.metrics["dropped"] += 1
+            else:
+                alive.append(ws)
+        return alive
+
+
+# ✅ 워커당 하나의 브릿지 인스턴스
+bridge = RedisBridge()
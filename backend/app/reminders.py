@@ -0,0 +1,378 @@
+# app/reminders.py
+# ✅ 복용 알림 스케줄러 (워커 내부, 최소 힙 타이머)
+#
+# - 앞으로 WINDOW 동안의 복용 시각을 DB에서 한 번 읽어 최소 힙에 넣고,
+#   가장 이른 알림 시각까지만 잠든다 (매분 DB 폴링 없음).
+# - 창이 끝나기 REFRESH_MARGIN 전에 다음 창을 읽어 온다.
+# - 계획 생성/삭제, 복용 기록은 라우트에서 바로 힙에 반영한다 (삽입 O(log n)).
+# - 취소는 항목만 무효 표시하고 힙에서 꺼낼 때 건너뛴다 (지연 삭제, O(1)).
+#   무효 항목이 절반을 넘으면 힙을 다시 만든다.
+# - 전송 시 reminder_deliveries에 먼저 INSERT(유니크 키)해서 워커 간 중복을 막고,
+#   chat_channel로 user_{id} 룸에 medication_reminder 이벤트를 보낸다.
+# - 워커를 나눠 맡지 않는다: 모든 워커가 같은 창을 읽고 같은 알림을 INSERT 하려 하며,
+#   중복 전송 방지는 전적으로 source_key 유니크 제약에 기대고 있다 (알림 하나당 커밋 하나).
+#   워커 수만큼 읽기/INSERT 시도가 늘어나므로 워커가 많아지면 샤딩이나 전용 프로세스가 필요하다.
+# - 기록(INSERT)이나 전송이 실패한 알림은 RETRY_BASE부터 두 배씩 늘린 간격으로 다시 힙에 넣고
+#   MAX_ATTEMPTS번까지 재시도한다. 이미 기록한 알림은 재시도 때 INSERT 없이 전송만 한다.
+# - 창 로딩과 힙에서 꺼낼 때 모두 GRACE보다 오래된 알림은 건너뛴다 (장애 뒤 밀린 알림을 몰아 보내지 않음).
+# 날짜/시각은 서버 로컬 시간 기준으로 저장되어 있으므로 그대로 비교한다.
+
+import asyncio
+import heapq
+import itertools
+import json
+import logging
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import or_
+from sqlalchemy.exc import IntegrityError
+
+from app.database import SessionLocal
+from app.models.medicines import Medicine
+from app.models.medication_plan import MedicationPlan, MedicationDose
+from app.models.reminder_delivery import ReminderDelivery
+from app.utils.recurrence import plan_occurrences
+from app.utils.redis import publish_to_redis
+
+logger = logging.getLogger(__name__)
+
+WINDOW = timedelta(hours=6)              # 한 번에 힙에 올리는 기간
+REFRESH_MARGIN = timedelta(minutes=10)   # 창이 끝나기 이만큼 전에 다음 창 로딩
+GRACE = timedelta(minutes=10)            # 재시작 직후 이만큼 지난 알림까지는 보냄
+RETRY_BASE = 5.0                         # 첫 재시도까지 대기(초), 이후 두 배씩
+RETRY_MAX = 300.0
+MAX_ATTEMPTS = 6
+
+Key = str
+
+
+class _Reminder:
+    __slots__ = ("key", "user_id", "due_at", "payload", "cancelled", "attempts", "delivery_id")
+
+    def __init__(self, key: Key, user_id: int, due_at: datetime, payload: dict):
+        self.key = key
+        self.user_id = user_id
+        self.due_at = due_at
+        self.payload = payload
+        self.cancelled = False
+        self.attempts = 0
+        self.delivery_id: Optional[int] = None   # 이 워커가 기록한 reminder_deliveries 행
+
+
+def plan_key(plan_id: int, day: date, t) -> Key:
+    return f"plan:{plan_id}:{day.isoformat()}T{t.strftime('%H:%M')}"
+
+
+def plan_reminders(plan: MedicationPlan, start: datetime, end: datetime) -> List[_Reminder]:
+    reminders = []
+    for day, t, _ in plan_occurrences(plan, start.date(), end.date() + timedelta(days=1)):
+        due_at = datetime.combine(day, t)
+        if start <= due_at < end:
+            reminders.append(_Reminder(plan_key(plan.id, day, t), plan.user_id, due_at, {
+                "plan_id": plan.id,
+                "title": plan.title,
+                "date": day.isoformat(),
+                "time": t.strftime("%H:%M"),
+            }))
+    return reminders
+
+
+def medicine_reminder(med: Medicine) -> _Reminder:
+    return _Reminder(f"medicine:{med.id}", med.user_id, datetime.combine(med.date, med.time), {
+        "medicine_id": med.id,
+        "title": med.title,
+        "date": med.date.isoformat(),
+        "time": med.time.strftime("%H:%M"),
+    })
+
+
+class ReminderScheduler:
+    def __init__(self):
+        self._heap: List[Tuple[float, int, _Reminder]] = []
+        self._entries: Dict[Key, _Reminder] = {}
+        self._by_plan: Dict[int, Set[Key]] = {}
+        self._seq = itertools.count()
+        self._cancelled = 0
+        self._window_end: Optional[datetime] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self.stats = {"scheduled": 0, "cancelled": 0, "delivered": 0, "duplicates": 0, "retried": 0, "failed": 0,
+                      "expired": 0, "loads": 0}
+
+    # ✅ FastAPI startup / shutdown 훅에서 호출
+    def start(self):
+        if self._task is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run(), name="medication-reminders")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        self._loop = None
+
+    def snapshot(self) -> dict:
+        return {
+            **self.stats,
+            "pending": len(self._entries),
+            "heap_size": len(self._heap),
+            "window_end": self._window_end.isoformat() if self._window_end else None,
+        }
+
+    # ------------------------
+    # 라우트(스레드풀)에서 호출하는 진입점: 이벤트 루프로 넘겨서 반영
+    # ------------------------
+
+    def _call_in_loop(self, fn, *args):
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(fn, *args)
+
+    def schedule_plan(self, plan: MedicationPlan, only_key: Optional[Key] = None):
+        if self._loop is None:
+            return
+        # 다음 창 로딩과 겹쳐도 빠지지 않도록 한 창 더 앞까지 넣음 (같은 키는 한 번만 들어감)
+        end = (self._window_end or datetime.now()) + WINDOW
+        reminders = plan_reminders(plan, datetime.now(), end)
+        if only_key is not None:
+            reminders = [r for r in reminders if r.key == only_key]
+        self._call_in_loop(self._push_many, reminders, plan.id)
+
+    def schedule_medicine(self, med: Medicine):
+        if self._loop is None or med.user_id is None or med.date is None:
+            return
+        reminder = medicine_reminder(med)
+        if datetime.now() <= reminder.due_at < (self._window_end or datetime.now()) + WINDOW:
+            self._call_in_loop(self._push_many, [reminder], None)
+
+    def cancel_plan(self, plan_id: int):
+        self._call_in_loop(self._cancel_plan, plan_id)
+
+    def cancel(self, key: Key):
+        self._call_in_loop(self._cancel, key)
+
+    # ------------------------
+    # 힙 조작 (이벤트 루프 안에서만)
+    # ------------------------
+
+    def _push_many(self, reminders: List[_Reminder], plan_id: Optional[int] = None, at: Optional[float] = None):
+        earliest = self._heap[0][0] if self._heap else None
+        for reminder in reminders:
+            if reminder.key in self._entries:
+                continue
+            self._entries[reminder.key] = reminder
+            if plan_id is not None:
+                self._by_plan.setdefault(plan_id, set()).add(reminder.key)
+            heapq.heappush(self._heap, (at or reminder.due_at.timestamp(), next(self._seq), reminder))
+            self.stats["scheduled"] += 1
+        # 새 항목이 가장 이르면 대기 중인 루프를 깨워서 잠드는 시간을 다시 계산
+        if self._heap and self._wakeup is not None and (earliest is None or self._heap[0][0] < earliest):
+            self._wakeup.set()
+
+    def _cancel(self, key: Key):
+        reminder = self._entries.pop(key, None)
+        if reminder is None:
+            return
+        reminder.cancelled = True
+        self._cancelled += 1
+        self.stats["cancelled"] += 1
+        if self._cancelled > len(self._heap) // 2:
+            self._heap = [item for item in self._heap if not item[2].cancelled]
+            heapq.heapify(self._heap)
+            self._cancelled = 0
+
+    def _cancel_plan(self, plan_id: int):
+        for key in self._by_plan.pop(plan_id, set()):
+            self._cancel(key)
+
+    def _schedule_retries(self, reminders: List[_Reminder]):
+        now = datetime.now().timestamp()
+        for reminder in reminders:
+            reminder.attempts += 1
+            if reminder.attempts >= MAX_ATTEMPTS:
+                self.stats["failed"] += 1
+                logger.error("Reminder dropped after %d attempts", reminder.attempts,
+                             extra={"source_key": reminder.key})
+                continue
+            self.stats["retried"] += 1
+            delay = min(RETRY_BASE * 2 ** (reminder.attempts - 1), RETRY_MAX)
+            self._push_many([reminder], reminder.payload.get("plan_id"), at=now + delay)
+
+    def _pop_due(self, now: float) -> List[_Reminder]:
+        due = []
+        oldest = now - GRACE.total_seconds()
+        while self._heap and self._heap[0][0] <= now:
+            at, _, reminder = heapq.heappop(self._heap)
+            if reminder.cancelled:
+                self._cancelled -= 1
+                continue
+            self._entries.pop(reminder.key, None)
+            plan_id = reminder.payload.get("plan_id")
+            if plan_id is not None:
+                keys = self._by_plan.get(plan_id)
+                if keys is not None:
+                    keys.discard(reminder.key)
+                    if not keys:
+                        self._by_plan.pop(plan_id, None)
+            if at < oldest:
+                # 루프가 멈춰 있던 사이 GRACE를 넘긴 알림은 한꺼번에 보내지 않고 버림 (재시도는 예정 시각 기준)
+                self.stats["expired"] += 1
+                logger.warning("Reminder expired before delivery", extra={"source_key": reminder.key})
+                continue
+            due.append(reminder)
+        return due
+
+    # ------------------------
+    # 메인 루프
+    # ------------------------
+
+    async def _run(self):
+        while True:
+            try:
+                now = datetime.now()
+                if self._window_end is None or now >= self._window_end - REFRESH_MARGIN:
+                    # DB 장애나 루프 정지로 창 끝이 오래 지났어도 GRACE보다 이전 알림은 읽지 않음
+                    load_from = max(self._window_end or now - GRACE, now - GRACE)
+                    load_to = max(load_from, now) + WINDOW
+                    reminders, by_plan = await asyncio.to_thread(self._load_window, load_from, load_to)
+                    for plan_id, items in by_plan.items():
+                        self._push_many(items, plan_id)
+                    self._push_many(reminders)
+                    self._window_end = load_to
+                    self.stats["loads"] += 1
+
+                due = self._pop_due(datetime.now().timestamp())
+                if due:
+                    # 힙에서 이미 꺼냈고 창도 지나갔으므로, 못 보낸 알림은 여기서 다시 넣지 않으면 사라짐
+                    try:
+                        retry = await asyncio.to_thread(self._deliver, due)
+                    except Exception:
+                        logger.exception("Reminder delivery error")
+                        retry = due
+                    self._schedule_retries(retry)
+
+                next_refresh = (self._window_end - REFRESH_MARGIN).timestamp()
+                next_due = self._heap[0][0] if self._heap else next_refresh
+                timeout = max(0.0, min(next_due, next_refresh) - datetime.now().timestamp())
+
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Reminder scheduler error")
+                await asyncio.sleep(5)
+
+    # ------------------------
+    # DB 작업 (스레드에서 실행)
+    # ------------------------
+
+    def _load_window(self, start: datetime, end: datetime):
+        db = SessionLocal()
+        try:
+            plans = db.query(MedicationPlan).filter(
+                MedicationPlan.start_date <= end.date(),
+                or_(MedicationPlan.end_date.is_(None), MedicationPlan.end_date >= start.date())
+            ).all()
+            medicines = db.query(Medicine).filter(
+                Medicine.user_id.isnot(None),
+                Medicine.date >= start.date(),
+                Medicine.date <= end.date()
+            ).all()
+
+            # 이미 보냈거나 복용 기록이 있는 알림은 제외
+            sent = {key for (key,) in db.query(ReminderDelivery.source_key).filter(
+                ReminderDelivery.due_at >= start,
+                ReminderDelivery.due_at < end
+            )}
+            recorded = {
+                plan_key(plan_id, d, t)
+                for plan_id, d, t in db.query(MedicationDose.plan_id, MedicationDose.date, MedicationDose.time).filter(
+                    MedicationDose.date >= start.date(),
+                    MedicationDose.date <= end.date()
+                )
+            }
+        finally:
+            db.close()
+
+        skip = sent | recorded
+        by_plan = {}
+        for plan in plans:
+            items = [r for r in plan_reminders(plan, start, end) if r.key not in skip]
+            if items:
+                by_plan[plan.id] = items
+        reminders = [
+            r for r in (medicine_reminder(med) for med in medicines)
+            if start <= r.due_at < end and r.key not in skip
+        ]
+        return reminders, by_plan
+
+    def _deliver(self, due: List[_Reminder]) -> List[_Reminder]:
+        """Sends due reminders and returns the ones to retry (nothing is lost on a DB/Redis error)."""
+        retry = []
+        db = SessionLocal()
+        try:
+            for reminder in due:
+                if reminder.delivery_id is None:
+                    # 먼저 기록(유니크 키)한 워커만 전송
+                    delivery = ReminderDelivery(
+                        user_id=reminder.user_id,
+                        source_key=reminder.key,
+                        due_at=reminder.due_at,
+                        status="sent",
+                    )
+                    db.add(delivery)
+                    try:
+                        db.commit()
+                    except IntegrityError:
+                        db.rollback()
+                        self.stats["duplicates"] += 1
+                        continue
+                    except Exception as e:
+                        db.rollback()
+                        logger.warning("Reminder claim error: %s", e, extra={"source_key": reminder.key})
+                        retry.append(reminder)
+                        continue
+                    reminder.delivery_id = delivery.id
+
+                try:
+                    publish_to_redis("chat_channel", json.dumps({
+                        "type": "medication_reminder",
+                        "room": f"user_{reminder.user_id}",
+                        **reminder.payload,
+                    }))
+                except Exception as e:
+                    logger.warning("Reminder publish error: %s", e, extra={"source_key": reminder.key})
+                    self._set_status(db, reminder, "failed")
+                    retry.append(reminder)
+                    continue
+
+                self.stats["delivered"] += 1
+                if reminder.attempts:
+                    self._set_status(db, reminder, "sent")
+        finally:
+            db.close()
+        return retry
+
+    def _set_status(self, db, reminder: _Reminder, status: str):
+        # 기록용일 뿐이므로 실패해도 재시도 흐름에는 영향 없음
+        try:
+            db.query(ReminderDelivery).filter(ReminderDelivery.id == reminder.delivery_id).update(
+                {ReminderDelivery.status: status, ReminderDelivery.sent_at: datetime.utcnow()},
+                synchronize_session=False
+            )
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.warning("Reminder status update error: %s", e, extra={"source_key": reminder.key})
+
+
+# ✅ 워커당 하나의 스케줄러
+reminder_scheduler = ReminderScheduler()
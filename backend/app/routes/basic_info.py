@@ -9,12 +9,12 @@ from app.database import get_db
 from app.models.basic_info import BasicInfo
 from app.models.user import User
 from app.dependencies import get_current_user
+from app.utils.response_cache import cached_response, invalidate
 
 router = APIRouter()
 
-# ✅ 이미지 저장 경로 초기화
+# ✅ 이미지 저장 경로 (디렉토리는 앱 시작 시 app/utils/media.py에서 생성)
 MEDIA_DIR = "media/profiles"
-os.makedirs(MEDIA_DIR, exist_ok=True)
 
 @router.post("/basic-info")
 async def create_or_update_basic_info(
@@ -61,6 +61,7 @@ async def create_or_update_basic_info(
 
     db.commit()
     db.refresh(info)
+    invalidate(f"user:{current_user.id}")
 
     return {
         "message": "Basic info saved or updated",
@@ -99,6 +100,7 @@ def get_my_basic_info(
     }
 
 @router.get("/basic-info/{user_id}")
+@cached_response(ttl=300, tags=("user:{user_id}",))
 def get_basic_info(user_id: int, db: Session = Depends(get_db)):
     info = db.query(BasicInfo).filter(BasicInfo.user_id == user_id).first()
     if not info:
@@ -0,0 +1,123 @@
+# app/routes/batch.py
+# ✅ 여러 GET 요청을 한 번에 처리 (/batch)
+#
+# 모바일 화면이 한꺼번에 보내던 작은 GET들을 앱 내부에서 ASGI로 직접 실행한다.
+# - HTTP 왕복 없이 같은 FastAPI 앱의 라우트를 그대로 호출 (인증 헤더 전달)
+# - 하위 요청들은 DB 세션 하나를 공유 (get_db가 shared_session을 사용)
+# - 같은 경로가 여러 번 오면 요청 범위 캐시로 한 번만 실행
+# - 요청 수 / 전체 응답 크기 / 워커 전체 동시 실행 수를 제한
+
+import asyncio
+import json
+import logging
+from typing import Dict, List, Tuple
+from urllib.parse import urlsplit
+
+from fastapi import APIRouter, HTTPException, Request
+
+from app.database import SessionLocal, shared_session
+from app.schemas.batch import BatchRequest, BatchResponse
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+MAX_BATCH_REQUESTS = 20              # 한 번에 받을 수 있는 하위 요청 수
+MAX_BATCH_RESPONSE_BYTES = 1 << 20   # 전체 응답 본문 상한 (1MB)
+MAX_CONCURRENT_SUBREQUESTS = 8       # 워커 전체에서 동시에 실행되는 하위 요청 수
+FORWARDED_HEADERS = (b"authorization", b"accept-language", b"user-agent")
+
+_subrequest_slots = asyncio.Semaphore(MAX_CONCURRENT_SUBREQUESTS)
+
+
+async def _call_app(app, request: Request, path: str) -> Tuple[int, bytes, str]:
+    url = urlsplit(path)
+    headers = [(k, v) for k, v in request.scope["headers"] if k in FORWARDED_HEADERS]
+    scope = {
+        "type": "http",
+        "asgi": request.scope.get("asgi", {"version": "3.0"}),
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": request.scope.get("scheme", "http"),
+        "server": request.scope.get("server"),
+        "client": request.scope.get("client"),
+        "root_path": "",
+        "path": url.path,
+        "raw_path": url.path.encode(),
+        "query_string": url.query.encode(),
+        "headers": headers,
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    status = 500
+    content_type = ""
+    chunks: List[bytes] = []
+
+    async def send(message):
+        nonlocal status, content_type
+        if message["type"] == "http.response.start":
+            status = message["status"]
+            for k, v in message.get("headers", []):
+                if k.lower() == b"content-type":
+                    content_type = v.decode()
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    async with _subrequest_slots:
+        await app(scope, receive, send)
+    return status, b"".join(chunks), content_type
+
+
+def _decode_body(raw: bytes, content_type: str):
+    if not raw:
+        return None
+    if content_type.startswith("application/json"):
+        return json.loads(raw)
+    return raw.decode(errors="replace")
+
+
+@router.post("/batch", response_model=BatchResponse)
+async def run_batch(batch: BatchRequest, request: Request):
+    if len(batch.requests) > MAX_BATCH_REQUESTS:
+        raise HTTPException(status_code=413, detail=f"At most {MAX_BATCH_REQUESTS} requests per batch")
+    for item in batch.requests:
+        if not item.path.startswith("/") or urlsplit(item.path).path.rstrip("/") == "/batch":
+            raise HTTPException(status_code=400, detail=f"Invalid batch path: {item.path}")
+
+    cache: Dict[str, Tuple[int, bytes, str]] = {}
+    results = []
+    total_bytes = 0
+
+    db = SessionLocal()
+    token = shared_session.set(db)
+    try:
+        # 세션을 공유하므로 하위 요청은 순서대로 실행 (세션은 동시 사용 불가)
+        for item in batch.requests:
+            if total_bytes >= MAX_BATCH_RESPONSE_BYTES:
+                results.append({"id": item.id, "path": item.path, "status": 413,
+                                "body": {"detail": "Batch response size limit reached"}})
+                continue
+
+            if item.path not in cache:
+                try:
+                    cache[item.path] = await _call_app(request.app, request, item.path)
+                except Exception:
+                    logger.exception("Batch sub-request failed: %s", item.path)
+                    db.rollback()
+                    cache[item.path] = (500, b'{"detail":"Internal Server Error"}', "application/json")
+
+            status, raw, content_type = cache[item.path]
+            total_bytes += len(raw)
+            if total_bytes > MAX_BATCH_RESPONSE_BYTES:
+                results.append({"id": item.id, "path": item.path, "status": 413,
+                                "body": {"detail": "Batch response size limit reached"}})
+                continue
+            results.append({"id": item.id, "path": item.path, "status": status,
+                            "body": _decode_body(raw, content_type)})
+    finally:
+        shared_session.reset(token)
+        db.close()
+
+    return {"results": results}
@@ -1,22 +1,26 @@
-from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisconnect, Query, Response
+from sqlalchemy import and_, or_
 from sqlalchemy.orm import Session
-from typing import Dict, List
+from typing import Dict, List, Optional
 import json
+import logging
 
 from app.database import get_db
-from app.models import Comment, CommentLike, User
+from app.models import Comment, CommentLike, User, Post
 from app.schemas import CommentCreate, CommentResponse  # ✅ import
 from app.models.user import User
 from app.dependencies import get_current_user
-import redis
+from app.utils.pagination import encode_cursor, decode_cursor
+from app.utils.fast_json import fast_response, COMMENTS_ADAPTER
+from app.utils.redis import publish_to_redis
+from app.utils.response_cache import invalidate
 import json
 
-# Redis 클라이언트 설정 (파일 상단에 위치)
-redis_client = redis.Redis(host='localhost', port=6379, decode_responses=True)
+logger = logging.getLogger(__name__)
 
 def broadcast_to_go(user: str, message: str):
     payload = json.dumps({"user": user, "msg": message})
-    redis_client.publish("chat_channel", payload)
+    publish_to_redis("chat_channel", payload)
 
 router = APIRouter()
 
@@ -33,23 +37,23 @@ async def handle_comment_ws(websocket: WebSocket, post_id: int):
         while True:
             await websocket.receive_text()  # 클라이언트 ping
     except WebSocketDisconnect:
-        active_connections[post_id].remove(websocket)
-        print(f"🔌 WebSocket disconnected: post_id={post_id}")
+        clients = active_connections.get(post_id, [])
+        if websocket in clients:  # 전송 실패로 이미 빠졌을 수 있음
+            clients.remove(websocket)
+        logger.debug("Comment WebSocket disconnected", extra={"post_id": post_id})
 
 # 댓글 실시간 전송
 async def notify_comment_clients(post_id: int, comment_data: dict):
     if post_id not in active_connections:
         return
 
-    living_clients = []
-    for ws in active_connections[post_id]:
+    clients = active_connections[post_id]
+    for ws in list(clients):
         try:
             await ws.send_text(json.dumps(comment_data))
-            living_clients.append(ws)
         except:
-            pass  # 실패한 클라이언트 무시
-
-    active_connections[post_id] = living_clients
+            if ws in clients:
+                clients.remove(ws)  # 실패한 클라이언트만 제거 (전송 중 새로 붙은 소켓은 유지)
 
 # WebSocket 라우트
 @router.websocket("/ws/comments/{post_id}")
@@ -74,8 +78,13 @@ async def create_comment(
         post_id=post_id
     )
     db.add(new_comment)
+    # ✅ 비정규화된 댓글 수를 같은 트랜잭션에서 원자적으로 증가
+    db.query(Post).filter(Post.id == post_id).update(
+        {Post.comment_count: Post.comment_count + 1}, synchronize_session=False
+    )
     db.commit()
     db.refresh(new_comment)
+    invalidate(f"post:{post_id}")
 
     await notify_comment_clients(post_id, {
         "id": new_comment.id,
@@ -107,30 +116,70 @@ def delete_comment(
     # 3. 댓글 좋아요 먼저 삭제
     db.query(CommentLike).filter(CommentLike.comment_id == comment_id).delete()
 
-    # 4. 댓글 삭제
+    # 4. 댓글 삭제 + 게시글의 댓글 수 감소
     db.delete(comment)
+    db.query(Post).filter(Post.id == comment.post_id, Post.comment_count > 0).update(
+        {Post.comment_count: Post.comment_count - 1}, synchronize_session=False
+    )
     db.commit()
+    invalidate(f"post:{comment.post_id}")
 
     # 5. Redis 또는 Go 서버로 삭제 이벤트 브로드캐스트
     broadcast_to_go(current_user.nickname, f"deleted comment {comment_id}")
 
     return {"message": "Comment deleted"}
 
-# ✅ 댓글 목록 조회 API
+COMMENT_PAGE_SIZE = 50
+COMMENT_PAGE_MAX = 200
+
+# ✅ 댓글 한 페이지를 작성자 정보와 함께 한 번의 쿼리로 조회 (키셋 페이지네이션)
+def fetch_comment_page(db: Session, post_id: int, limit: int = COMMENT_PAGE_SIZE, cursor: Optional[str] = None):
+    query = db.query(
+        Comment.id, Comment.user_id, Comment.content, Comment.created_at,
+        User.nickname, User.profile_image
+    ).join(User, User.id == Comment.user_id).filter(Comment.post_id == post_id)
+
+    if cursor:
+        after_created, after_id = decode_cursor(cursor)
+        query = query.filter(or_(
+            Comment.created_at > after_created,
+            and_(Comment.created_at == after_created, Comment.id > after_id)
+        ))
+
+    # limit + 1개를 읽어서 다음 페이지 존재 여부 확인
+    rows = query.order_by(Comment.created_at, Comment.id).limit(limit + 1).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id)
+
+    items = [
+        {
+            "id": row.id,
+            "user_id": row.user_id,
+            "user_name": row.nickname,
+            "user_nickname": row.nickname,
+            "user_profile_image": row.profile_image,
+            "content": row.content,
+            "created_at": row.created_at,
+        }
+        for row in rows
+    ]
+    return items, next_cursor
+
+# ✅ 댓글 목록 조회 API (다음 페이지 커서는 X-Next-Cursor 헤더로 전달)
 @router.get("/posts/{post_id}/comments", response_model=List[CommentResponse])
-def get_comments(post_id: int, db: Session = Depends(get_db)):
-    comments = db.query(Comment).filter(Comment.post_id == post_id).all()
-    result = []
-    for comment in comments:
-        result.append({
-            "id": comment.id,
-            "user_id": comment.user_id,
-            "user_name": comment.user.nickname,
-            "user_profile_image": comment.user.profile_image,
-            "content": comment.content,
-            "created_at": comment.created_at.isoformat(),
-        })
-    return result
+def get_comments(
+    post_id: int,
+    response: Response,
+    limit: int = Query(COMMENT_PAGE_SIZE, ge=1, le=COMMENT_PAGE_MAX),
+    cursor: Optional[str] = Query(None),
+    db: Session = Depends(get_db)
+):
+    items, next_cursor = fetch_comment_page(db, post_id, limit, cursor)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return fast_response(items, COMMENTS_ADAPTER, response)
 
 # FastAPI 예시 (추정 경로)
 @router.post("/comments/{comment_id}/like")
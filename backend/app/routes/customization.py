@@ -1,38 +1,58 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
 from sqlalchemy.orm import Session
 from app.models.profile_customization import ProfileCustomization
 from app.dependencies import get_db, get_current_user
 from app.schemas.customization import CustomizationSchema
+from app.utils.profile_cache import cached_read, bump_version, content_etag
 import json
 
 router = APIRouter()
 
+CACHE_NAMESPACE = "customization"
 
 
-@router.get("/users/{user_id}/customization", response_model=CustomizationSchema)
-def get_customization(user_id: int, db: Session = Depends(get_db)):
+def load_customization(db: Session, user_id: int):
     instance = db.query(ProfileCustomization).filter_by(user_id=user_id).first()
     if not instance:
-        return CustomizationSchema(backgroundUrl=None, widgets=[])
+        return 0, CustomizationSchema(backgroundUrl=None, widgets=[]).model_dump()
 
     widgets = json.loads(instance.widgets_json or "[]")
-    return CustomizationSchema(
+    return instance.version, CustomizationSchema(
         backgroundUrl=instance.background_url,
         widgets=widgets
-    )
+    ).model_dump()
+
+
+# ✅ 캐시된 버전의 ETag가 맞으면 DB 조회 없이 304
+@router.get("/users/{user_id}/customization", response_model=CustomizationSchema)
+def get_customization(
+    user_id: int,
+    db: Session = Depends(get_db),
+    if_none_match: Optional[str] = Header(None)
+):
+    return cached_read(CACHE_NAMESPACE, user_id, if_none_match, lambda: load_customization(db, user_id))
 
 @router.put("/users/me/customization")
 def save_customization(
     customization: CustomizationSchema,
+    response: Response,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
     instance = db.query(ProfileCustomization).filter_by(user_id=current_user.id).first()
     if not instance:
-        instance = ProfileCustomization(user_id=current_user.id)
+        instance = ProfileCustomization(user_id=current_user.id, version=1)
         db.add(instance)
+    else:
+        instance.version = ProfileCustomization.version + 1
 
     instance.background_url = customization.backgroundUrl
     instance.widgets_json = json.dumps([widget.dict() for widget in customization.widgets])  # ✅ 직렬화 핵심
     db.commit()
+    db.refresh(instance)
+
+    bump_version(CACHE_NAMESPACE, current_user.id, instance.version)
+    response.headers["ETag"] = content_etag(CACHE_NAMESPACE, current_user.id, instance.version)
     return {"success": True}
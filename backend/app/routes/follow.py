@@ -4,7 +4,9 @@ from app.database import get_db
 from app.models import Follow, User
 from app.schemas.follow import FollowResponse
 from app.dependencies import get_current_user
-import traceback
+import logging
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/follow", tags=["Follow"])
 
@@ -15,8 +17,6 @@ def get_my_follow_data(
     current_user: User = Depends(get_current_user)
 ):
     try:
-        print(f"✅ current_user = {current_user.id} ({current_user.nickname})")
-
         follower_count = db.query(Follow).filter(Follow.following_id == current_user.id).count()
         following_count = db.query(Follow).filter(Follow.follower_id == current_user.id).count()
 
@@ -27,8 +27,7 @@ def get_my_follow_data(
         )
 
     except Exception:
-        print("❌ Exception in /follow/me")
-        traceback.print_exc()
+        logger.exception("Exception in /follow/me")
         raise HTTPException(status_code=500, detail="Internal Server Error")
 
 
@@ -54,8 +53,7 @@ def get_follow_data(
             is_following=is_following
         )
     except Exception:
-        print(f"❌ Error in /follow/{user_id}")
-        traceback.print_exc()
+        logger.exception("Error in /follow/%s", user_id)
         raise HTTPException(status_code=500, detail="Internal Server Error")
 
 
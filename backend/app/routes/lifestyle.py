@@ -11,12 +11,12 @@ from app.models.lifestyle import Lifestyle
 from app.models.user import User
 from app.schemas.lifestyle import LifestyleRequest
 from app.dependencies import get_current_user
+from app.utils.response_cache import cached_response, invalidate
 
 router = APIRouter()
 
-# ✅ 이미지 저장 경로 초기화
+# ✅ 이미지 저장 경로 (디렉토리는 앱 시작 시 app/utils/media.py에서 생성)
 MEDIA_DIR = "media/profiles"
-os.makedirs(MEDIA_DIR, exist_ok=True)
 
 # ✅ 기본 정보 생성
 @router.post("/basic-info")
@@ -55,6 +55,7 @@ async def create_basic_info(
     db.add(new_info)
     db.commit()
     db.refresh(new_info)
+    invalidate(f"user:{current_user.id}")
 
     return {
         "message": "Basic info saved",
@@ -111,6 +112,7 @@ def save_lifestyle(
     db.add(new_lifestyle)
     db.commit()
     db.refresh(new_lifestyle)
+    invalidate(f"user:{current_user.id}")
     return {"message": "Lifestyle info saved", "id": new_lifestyle.id}
 
 # backend - /lifestyle/me
@@ -133,6 +135,7 @@ def get_my_lifestyle(
     return info
 # 🔸 특정 사용자 라이프스타일 조회
 @router.get("/lifestyle/{user_id}")
+@cached_response(ttl=300, tags=("user:{user_id}",))
 def get_lifestyle(user_id: int, db: Session = Depends(get_db)):
     lifestyle = db.query(Lifestyle).filter(Lifestyle.user_id == user_id).first()
     if not lifestyle:
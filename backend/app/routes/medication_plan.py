@@ -0,0 +1,185 @@
+# app/routes/medication_plan.py
+# ✅ 반복 복용 계획 API
+#
+# 복용 1회마다 행을 만드는 대신 계획 하나만 저장하고,
+# 조회 시 요청 범위만큼 펼친 뒤 복용 기록(taken / skipped)을 덮어씌운다.
+
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.dependencies import get_current_user
+from app.models.user import User
+from app.models.medication_plan import MedicationPlan, MedicationDose
+from app.routes.medicines import month_range
+from app.schemas.medication_plan import (
+    MedicationPlanCreate, MedicationPlanOut, DoseOut, DoseStatusUpdate, DoseDaySummary
+)
+from app.utils.recurrence import expand, occurrence_dates, parse_times
+from app.reminders import reminder_scheduler, plan_key
+
+router = APIRouter(prefix="/medication-plans", tags=["medication-plans"])
+
+MAX_RANGE_DAYS = 92   # 한 번에 펼칠 수 있는 최대 기간 (약 3개월)
+
+
+def _active_plans(db: Session, user_id: int, start: date, end: date) -> List[MedicationPlan]:
+    return db.query(MedicationPlan).filter(
+        MedicationPlan.user_id == user_id,
+        MedicationPlan.start_date < end,
+        or_(MedicationPlan.end_date.is_(None), MedicationPlan.end_date >= start)
+    ).all()
+
+
+def _dose_statuses(db: Session, user_id: int, start: date, end: date):
+    rows = db.query(MedicationDose.plan_id, MedicationDose.date, MedicationDose.time, MedicationDose.status).filter(
+        MedicationDose.user_id == user_id,
+        MedicationDose.date >= start,
+        MedicationDose.date < end
+    ).all()
+    return {(plan_id, d, t): status for plan_id, d, t, status in rows}
+
+
+def _check_range(start: date, end: date):
+    if end <= start:
+        raise HTTPException(status_code=400, detail="end must be after start")
+    if (end - start).days > MAX_RANGE_DAYS:
+        raise HTTPException(status_code=400, detail=f"Range must be at most {MAX_RANGE_DAYS} days")
+
+
+@router.post("", response_model=MedicationPlanOut)
+def create_plan(
+    plan: MedicationPlanCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    if plan.frequency == "weekly" and not plan.weekdays:
+        raise HTTPException(status_code=400, detail="weekly plans need weekdays")
+
+    db_plan = MedicationPlan(**plan.dict(), user_id=current_user.id)
+    db.add(db_plan)
+    db.commit()
+    db.refresh(db_plan)
+    reminder_scheduler.schedule_plan(db_plan)
+    return db_plan
+
+@router.get("", response_model=List[MedicationPlanOut])
+def list_plans(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+    return db.query(MedicationPlan).filter(
+        MedicationPlan.user_id == current_user.id
+    ).order_by(MedicationPlan.start_date).all()
+
+@router.delete("/{plan_id}")
+def delete_plan(plan_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+    plan = db.query(MedicationPlan).filter(
+        MedicationPlan.id == plan_id,
+        MedicationPlan.user_id == current_user.id
+    ).first()
+    if not plan:
+        raise HTTPException(status_code=404, detail="Plan not found")
+    db.delete(plan)
+    db.commit()
+    reminder_scheduler.cancel_plan(plan_id)
+    return {"message": "Plan deleted"}
+
+# ✅ 기간 내 복용 목록: 계획 조회 1번 + 기록 조회 1번 후 메모리에서 펼침
+@router.get("/doses", response_model=List[DoseOut])
+def get_doses(
+    start: date = Query(...),
+    end: date = Query(..., description="포함하지 않음"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    _check_range(start, end)
+    plans = _active_plans(db, current_user.id, start, end)
+    statuses = _dose_statuses(db, current_user.id, start, end)
+    return [
+        {
+            "plan_id": plan.id,
+            "title": plan.title,
+            "date": d,
+            "time": t,
+            "status": statuses.get((plan.id, d, t), "pending"),
+        }
+        for d, t, plan in expand(plans, start, end)
+    ]
+
+# ✅ 월간 캘린더: 날짜별 복용 횟수 / 복용함 / 건너뜀
+@router.get("/calendar", response_model=List[DoseDaySummary])
+def get_plan_calendar(
+    year: int = Query(...),
+    month: int = Query(...),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    start, end = month_range(year, month)
+    plans = _active_plans(db, current_user.id, start, end)
+
+    counts = defaultdict(int)
+    for plan in plans:
+        per_day = len(parse_times(plan.times))
+        for d in occurrence_dates(plan, start, end):
+            counts[d] += per_day
+
+    marked = defaultdict(lambda: {"taken": 0, "skipped": 0})
+    for (plan_id, d, t), status in _dose_statuses(db, current_user.id, start, end).items():
+        marked[d][status] += 1
+
+    return [
+        {"date": d, "count": counts[d], **marked.get(d, {"taken": 0, "skipped": 0})}
+        for d in sorted(counts)
+    ]
+
+# ✅ 복용 기록: 복용함 / 건너뜀은 예외 행으로 저장, pending이면 삭제
+@router.put("/{plan_id}/doses", response_model=DoseOut)
+def set_dose_status(
+    plan_id: int,
+    update: DoseStatusUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    plan = db.query(MedicationPlan).filter(
+        MedicationPlan.id == plan_id,
+        MedicationPlan.user_id == current_user.id
+    ).first()
+    if not plan:
+        raise HTTPException(status_code=404, detail="Plan not found")
+
+    dose_time = update.time.replace(second=0, microsecond=0)
+    scheduled = update.date in occurrence_dates(plan, update.date, update.date + timedelta(days=1))
+    if not scheduled or dose_time not in parse_times(plan.times):
+        raise HTTPException(status_code=400, detail="No dose scheduled at this date and time")
+
+    dose = db.query(MedicationDose).filter(
+        MedicationDose.plan_id == plan_id,
+        MedicationDose.date == update.date,
+        MedicationDose.time == dose_time
+    ).first()
+    if update.status == "pending":
+        if dose:
+            db.delete(dose)
+    elif dose:
+        dose.status = update.status
+    else:
+        db.add(MedicationDose(
+            plan_id=plan_id,
+            user_id=current_user.id,
+            date=update.date,
+            time=dose_time,
+            status=update.status
+        ))
+    db.commit()
+
+    # 기록된 복용은 알림 취소, pending으로 되돌리면 다시 예약
+    key = plan_key(plan_id, update.date, dose_time)
+    if update.status == "pending":
+        reminder_scheduler.schedule_plan(plan, only_key=key)
+    else:
+        reminder_scheduler.cancel(key)
+
+    return {"plan_id": plan_id, "title": plan.title, "date": update.date, "time": dose_time, "status": update.status}
@@ -1,46 +1,90 @@
-from fastapi import APIRouter, Depends, Query
+from datetime import date as date_type
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from app.database import get_db
+from app.dependencies import get_current_user
+from app.models.user import User
 from app.schemas import medicine
 from app.models import medicines  # ✅ models.medicines 모듈 import
+from app.reminders import reminder_scheduler
 
 router = APIRouter()
 
+
+def month_range(year: int, month: int):
+    if not 1 <= month <= 12:
+        raise HTTPException(status_code=400, detail="month must be between 1 and 12")
+    if not 1 <= year <= 9998:  # 12월의 끝(다음 해 1월 1일)도 date 범위 안이어야 함
+        raise HTTPException(status_code=400, detail="year must be between 1 and 9998")
+    start = date_type(year, month, 1)
+    end = date_type(year + 1, 1, 1) if month == 12 else date_type(year, month + 1, 1)
+    return start, end
+
+
 # ✅ 약 추가
 @router.post("/medicines", response_model=medicine.MedicineOut)
-def create_medicine(med: medicine.MedicineCreate, db: Session = Depends(get_db)):
-    db_med = medicines.Medicine(**med.dict())
+def create_medicine(
+    med: medicine.MedicineCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    db_med = medicines.Medicine(**med.dict(), user_id=current_user.id)
     db.add(db_med)
     db.commit()
     db.refresh(db_med)
+    reminder_scheduler.schedule_medicine(db_med)
     return db_med
 
+# ✅ 월간 캘린더: 날짜별 개수와 가장 이른 복용 시간 (그룹 쿼리 한 번)
+@router.get("/medicines/calendar", response_model=List[medicine.MedicineDaySummary])
+def get_medicine_calendar(
+    year: int = Query(...),
+    month: int = Query(...),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    start, end = month_range(year, month)
+    rows = db.query(
+        medicines.Medicine.date,
+        func.count(medicines.Medicine.id),
+        func.min(medicines.Medicine.time)
+    ).filter(
+        medicines.Medicine.user_id == current_user.id,
+        medicines.Medicine.date >= start,
+        medicines.Medicine.date < end
+    ).group_by(medicines.Medicine.date).order_by(medicines.Medicine.date).all()
+    return [{"date": d, "count": count, "first_time": first_time} for d, count, first_time in rows]
+
 # ✅ 날짜별 약 조회 (기존 방식 유지)
 @router.get("/medicines/{date}", response_model=List[medicine.MedicineOut])
-def get_medicines_by_path_date(date: str, db: Session = Depends(get_db)):
-    return db.query(medicines.Medicine).filter(medicines.Medicine.date == date).all()
+def get_medicines_by_path_date(
+    date: date_type,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    return db.query(medicines.Medicine).filter(
+        medicines.Medicine.user_id == current_user.id,
+        medicines.Medicine.date == date
+    ).order_by(medicines.Medicine.time).all()
 
 # ✅ query string 기반 날짜 또는 월별 조회
 @router.get("/medicines", response_model=List[medicine.MedicineOut])
 def get_medicines(
-    date: Optional[str] = Query(None),
+    date: Optional[date_type] = Query(None),
     year: Optional[int] = Query(None),
     month: Optional[int] = Query(None),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
 ):
+    query = db.query(medicines.Medicine).filter(medicines.Medicine.user_id == current_user.id)
     if date:
-        return db.query(medicines.Medicine).filter(medicines.Medicine.date == date).all()
+        return query.filter(medicines.Medicine.date == date).order_by(medicines.Medicine.time).all()
     elif year and month:
-        start = f"{year}-{str(month).zfill(2)}-01"
-        end_month = month + 1
-        end_year = year
-        if end_month > 12:
-            end_month = 1
-            end_year += 1
-        end = f"{end_year}-{str(end_month).zfill(2)}-01"
-        return db.query(medicines.Medicine).filter(
+        start, end = month_range(year, month)
+        return query.filter(
             medicines.Medicine.date >= start,
             medicines.Medicine.date < end
-        ).all()
-    return []
\ No newline at end of file
+        ).order_by(medicines.Medicine.date, medicines.Medicine.time).all()
+    return []
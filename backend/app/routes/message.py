@@ -2,18 +2,26 @@ from typing import List
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session, joinedload
 from datetime import datetime
-import traceback
+import logging
 import json # Ensure json is imported for dumps
 
 from app.database import get_db
 from app.models import Message, User, Follow
 from app.schemas.user import UserSchema, UserInfo # Ensure UserInfo is imported
-from app.schemas.message import MessageUser, MessageSchema, MessageCreate, MessageResponse
+from app.schemas.message import MessageUser, MessageSchema, MessageCreate, MessageResponse, ReadReceiptRequest
 from app.dependencies import get_current_user
 from app.utils.redis import publish_to_redis
+from app.utils.read_receipts import advance_read_marker, unread_counts
+from app.utils import unread_counter
+from app.utils.fast_json import fast_response, MESSAGES_ADAPTER, MESSAGE_USERS_ADAPTER
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/messages", tags=["Messages"])
 
+# 메시지 목록 응답(MessageSchema)에 필요한 컬럼만 조회
+MESSAGE_COLUMNS = (Message.id, Message.sender_id, Message.receiver_id, Message.content, Message.timestamp)
+
 # ✅ 메시지 전송 가능한 사용자 목록 (내가 팔로우한 사용자만)
 @router.get("/available-users/mutual")
 def get_mutual_follow_users(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
@@ -55,6 +63,7 @@ def get_message_users(
 
     seen_users = set()
     message_users = []
+    unread_by_user = unread_counts(db, current_user.id)  # ✅ 상대별 안 읽은 개수를 한 번의 쿼리로
 
     for msg in messages:
         # Determine the other participant in the conversation
@@ -65,24 +74,17 @@ def get_message_users(
 
         seen_users.add(target_user.id)
 
-        # Count unread messages from this specific user to the current user
-        unread_count = db.query(Message).filter(
-            Message.receiver_id == current_user.id,
-            Message.sender_id == target_user.id,
-            Message.is_read == False
-        ).count()
-
-        message_users.append(MessageUser(
-            user_id=target_user.id,
-            username=target_user.nickname,
-            profile_image=target_user.profile_image,
-            last_message=msg.content,
+        message_users.append({
+            "user_id": target_user.id,
+            "username": target_user.nickname,
+            "profile_image": target_user.profile_image,
+            "last_message": msg.content,
             # Format timestamp for display
-            time=msg.timestamp.strftime("%I:%M %p"),
-            unread_count=unread_count
-        ))
+            "time": msg.timestamp.strftime("%I:%M %p"),
+            "unread_count": unread_by_user.get(target_user.id, 0)
+        })
 
-    return message_users
+    return fast_response(message_users, MESSAGE_USERS_ADAPTER)
 
 # ✅ 메시지 전송
 @router.post("/send", response_model=MessageResponse)
@@ -128,7 +130,13 @@ def send_message(
         sender_payload = dict(message_payload)
         sender_payload["room"] = sender_room
         publish_to_redis("chat_channel", json.dumps(sender_payload))
-        print(f"✅ Message from {current_user.id} to {data.receiver_id} published to Redis (sender/receiver room)")
+        logger.debug("Message published", extra={"sender_id": current_user.id, "receiver_id": data.receiver_id})
+
+        # 5. 받는 사람의 안 읽은 메시지 배지 갱신 + 푸시
+        unread_counter.push_total(
+            data.receiver_id,
+            unread_counter.increment(db, data.receiver_id, current_user.id)
+        )
 
         # 4. Return the saved message response
         return MessageResponse(
@@ -142,7 +150,7 @@ def send_message(
 
     except Exception as e:
         db.rollback() # Rollback transaction on error
-        traceback.print_exc() # Print full stack trace for debugging
+        logger.exception("Failed to save and publish message")
         raise HTTPException(status_code=500, detail=f"메시지 저장 및 전송 실패: {str(e)}")
 
 # ✅ 받은 메시지 조회 (특정 사용자로부터)
@@ -155,11 +163,11 @@ def get_received_messages(
     """
     Retrieves messages received by the current user from a specific sender.
     """
-    messages = db.query(Message).filter(
+    rows = db.query(*MESSAGE_COLUMNS).filter(
         Message.sender_id == user_id,
         Message.receiver_id == current_user.id
     ).order_by(Message.timestamp).all()
-    return messages
+    return fast_response([dict(row._mapping) for row in rows], MESSAGES_ADAPTER)
 
 # ✅ 보낸 메시지 조회 (특정 수신자에게)
 @router.get("/sent/{receiver_id}", response_model=List[MessageSchema])
@@ -171,11 +179,11 @@ def get_sent_messages(
     """
     Retrieves messages sent by the current user to a specific receiver.
     """
-    messages = db.query(Message).filter(
+    rows = db.query(*MESSAGE_COLUMNS).filter(
         Message.sender_id == current_user.id,
         Message.receiver_id == receiver_id
     ).order_by(Message.timestamp).all()
-    return messages
+    return fast_response([dict(row._mapping) for row in rows], MESSAGES_ADAPTER)
 
 # ✅ 모든 대화 메시지 조회 (특정 상대방과의 대화)
 @router.get("/chat/{other_user_id}", response_model=List[MessageSchema])
@@ -188,13 +196,55 @@ def get_conversation_messages(
     Retrieves all messages exchanged between the current user and another specific user,
     ordered by timestamp.
     """
-    messages = db.query(Message).filter(
+    rows = db.query(*MESSAGE_COLUMNS).filter(
         ((Message.sender_id == current_user.id) & (Message.receiver_id == other_user_id)) |
         ((Message.sender_id == other_user_id) & (Message.receiver_id == current_user.id))
     ).order_by(Message.timestamp).all()
-    return messages
+    return fast_response([dict(row._mapping) for row in rows], MESSAGES_ADAPTER)
+
+# ✅ 읽음 이벤트는 배치당 한 번만 보낸 사람의 room으로 publish
+def publish_read_receipt(reader_id: int, peer_id: int, last_read_message_id: int):
+    publish_to_redis("chat_channel", json.dumps({
+        "type": "read_receipt",
+        "room": f"user_{peer_id}",
+        "reader_id": reader_id,
+        "last_read_message_id": last_read_message_id,
+    }))
+
+# ✅ 읽음 위치가 바뀐 뒤 해당 상대의 안 읽은 수를 배지 카운터에 반영하고 푸시
+def sync_unread_badge(db: Session, user_id: int, peer_id: int) -> int:
+    remaining = unread_counts(db, user_id, [peer_id]).get(peer_id, 0)
+    unread_counter.push_total(user_id, unread_counter.set_for_peer(db, user_id, peer_id, remaining))
+    return remaining
+
+# ✅ 안 읽은 메시지 총합 (메시지 탭 배지)
+@router.get("/unread-count")
+def get_unread_count(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    return {"unread_count": unread_counter.get_total(db, current_user.id)}
 
-# ✅ 읽음 처리
+# ✅ 읽음 처리 (배치): 클라이언트는 화면에 보인 마지막 메시지 ID만 보내면 됨
+@router.post("/read")
+def mark_read_up_to(
+    data: ReadReceiptRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Advances the current user's read position in the conversation with peer_id.
+    The position only moves forward, so late or duplicate requests are no-ops.
+    """
+    advanced, marker = advance_read_marker(db, current_user.id, data.peer_id, data.last_read_message_id)
+    if advanced:
+        publish_read_receipt(current_user.id, data.peer_id, marker)
+        unread = sync_unread_badge(db, current_user.id, data.peer_id)
+    else:
+        unread = unread_counts(db, current_user.id, [data.peer_id]).get(data.peer_id, 0)
+    return {"status": "success", "last_read_message_id": marker, "unread_count": unread}
+
+# ✅ 읽음 처리 (특정 상대의 메시지 전체)
 @router.patch("/read/{sender_id}")
 def mark_messages_as_read(
     sender_id: int,
@@ -202,15 +252,14 @@ def mark_messages_as_read(
     current_user: User = Depends(get_current_user)
 ):
     """
-    Marks all unread messages from a specific sender to the current user as read.
+    Marks all messages received so far from a specific sender as read
+    by moving the read position to the latest one.
     """
-    updated_count = db.query(Message).filter(
-        Message.sender_id == sender_id,
-        Message.receiver_id == current_user.id,
-        Message.is_read == False
-    ).update({Message.is_read: True}, synchronize_session="fetch") # Use "fetch" to ensure updates are flushed
-    db.commit()
-    return {"status": "success", "messages_marked_as_read": updated_count}
+    advanced, marker = advance_read_marker(db, current_user.id, sender_id)
+    if advanced:
+        publish_read_receipt(current_user.id, sender_id, marker)
+        sync_unread_badge(db, current_user.id, sender_id)
+    return {"status": "success", "last_read_message_id": marker}
 
 # ✅ 채팅 전체 삭제 (특정 상대방과의 모든 대화)
 @router.delete("/{user_id}")
@@ -227,25 +276,30 @@ def delete_chat(
         ((Message.sender_id == user_id) & (Message.receiver_id == current_user.id))
     ).delete(synchronize_session="fetch")
     db.commit()
+    # 삭제된 메시지가 배지에 남지 않도록 양쪽 카운터를 다음 조회 때 재구성
+    unread_counter.invalidate(current_user.id)
+    unread_counter.invalidate(user_id)
     return {"status": "success", "messages_deleted": deleted_count}
 
-# ✅ 메시지 ID 기반으로 단일 메시지 읽음 처리
+# ✅ 메시지 ID 기반으로 단일 메시지 읽음 처리 (구버전 클라이언트 호환, 가능하면 POST /messages/read 사용)
 @router.post("/{message_id}/read")
 def mark_single_message_as_read(
     message_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    message = db.query(Message).filter(
+    sender_id = db.query(Message.sender_id).filter(
         Message.id == message_id,
         Message.receiver_id == current_user.id
-    ).first()
+    ).scalar()
 
-    if not message:
+    if sender_id is None:
         raise HTTPException(status_code=404, detail="Message not found or unauthorized")
 
-    message.is_read = True
-    db.commit()
+    advanced, marker = advance_read_marker(db, current_user.id, sender_id, message_id)
+    if advanced:
+        publish_read_receipt(current_user.id, sender_id, marker)
+        sync_unread_badge(db, current_user.id, sender_id)
     return {"status": "success", "message_id": message_id}
 
 # 메시지 삭제 API 라우트
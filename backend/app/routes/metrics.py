@@ -0,0 +1,66 @@
+import re
+from collections import Counter
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+
+from app import presence
+from app.database import engine
+from app.routes.comment import active_connections as comment_connections
+from app.sockets import sio
+from app.utils.metrics import DB_POOL, REGISTRY, WEBSOCKET_CONNECTIONS
+from app.utils.slow_queries import slow_query_log
+
+router = APIRouter(tags=["Metrics"])
+
+# user_12 → user_* (사용자/게시글별 룸을 종류별로 묶음)
+_ROOM_ID = re.compile(r"\d+$")
+
+
+def _room_kind(room) -> str:
+    return _ROOM_ID.sub("*", str(room))
+
+
+def collect_db_pool():
+    pool = engine.pool
+    if not hasattr(pool, "checkedout"):
+        return {}
+    return {
+        ("size",): pool.size(),
+        ("checked_out",): pool.checkedout(),
+        ("checked_in",): pool.checkedin(),
+        ("overflow",): max(pool.overflow(), 0),
+    }
+
+
+def collect_websockets():
+    counts = Counter()
+    # Socket.IO: 네임스페이스별 룸 (sid 자신의 룸은 제외)
+    for namespace, rooms in sio.manager.rooms.items():
+        for room, members in rooms.items():
+            if room is None or room in members:
+                continue
+            counts[("socketio", _room_kind(room))] += len(members)
+    # /ws: 사용자별 연결 (presence 레지스트리)
+    counts[("ws", "user_*")] += sum(len(presence.local_sockets(uid)) for uid in list(presence.local_connections))
+    # 댓글 웹소켓(/ws/comments/{post_id}): 게시글별 연결 (Redis 브리지도 이 레지스트리로 전달)
+    counts[("comment_ws", "post_*")] += sum(len(clients) for clients in list(comment_connections.values()))
+    return counts
+
+
+DB_POOL.set_function(collect_db_pool)
+WEBSOCKET_CONNECTIONS.set_function(collect_websockets)
+
+# ✅ Prometheus 수집 엔드포인트
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+def get_metrics():
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+SLOW_QUERY_SORTS = ("total_ms", "p95_ms", "max_ms", "mean_ms", "count", "slow")
+
+# ✅ SQL 지문별 상위 목록 (느린 쿼리는 EXPLAIN 포함)
+@router.get("/metrics/slow-queries", include_in_schema=False)
+def get_slow_queries(limit: int = Query(20, ge=1, le=200), sort: str = Query("total_ms")):
+    if sort not in SLOW_QUERY_SORTS:
+        raise HTTPException(status_code=400, detail=f"sort must be one of {', '.join(SLOW_QUERY_SORTS)}")
+    return slow_query_log.report(limit=limit, sort=sort)
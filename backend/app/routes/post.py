@@ -1,7 +1,8 @@
 # post.py
 
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
-from sqlalchemy.orm import Session
+from sqlalchemy import func
+from sqlalchemy.orm import Session, defer
 from typing import List, Optional
 import os, uuid, shutil
 from datetime import datetime # Import datetime for created_at
@@ -11,22 +12,22 @@ from app.models import Post, Comment
 from app.models.user import User
 from app.models.basic_info import BasicInfo
 from app.models.lifestyle import Lifestyle
-from app.schemas.post import PostResponse
+from app.schemas.post import PostResponse, PostFeedItem
 from app.schemas.comment import CommentCreate, CommentResponse
 from app.schemas.user import UserResponse, UserUpdate, PasswordResetRequest
 from app.auth.utils import hash_password
 from app.dependencies import get_current_user
-import redis
+from app.routes.comment import fetch_comment_page
+from app.utils.fast_json import fast_response, FEED_ADAPTER
+from app.utils.redis import publish_to_redis
+from app.utils.response_cache import cached_response, invalidate
 import json
 
-# Redis 클라이언트
-redis_client = redis.Redis(host='localhost', port=6379, decode_responses=True)
-
 # Go 서버로 메시지 브로드캐스트
 # This function will be modified to send a full post object if needed
 def broadcast_post_to_go(post_data: dict):
     payload = json.dumps({"type": "new_post", "post": post_data}) # Send the full post data
-    redis_client.publish("post_channel", payload) # Changed channel to "post_channel" for clarity
+    publish_to_redis("post_channel", payload) # Changed channel to "post_channel" for clarity
 
 router = APIRouter()
 
@@ -44,6 +45,7 @@ def update_about(user_update: UserUpdate, db: Session = Depends(get_db), current
         current_user.about = user_update.about
         db.commit()
         db.refresh(current_user)
+        invalidate(f"user:{current_user.id}")
     return current_user
 
 @router.put("/reset-password")
@@ -67,7 +69,6 @@ def get_user_by_id(user_id: int, db: Session = Depends(get_db)):
 # ------------------------
 
 MEDIA_DIR = "media/profiles"
-os.makedirs(MEDIA_DIR, exist_ok=True)
 
 @router.post("/basic-info")
 def create_basic_info(
@@ -104,6 +105,7 @@ def create_basic_info(
     db.add(new_info)
     db.commit()
     db.refresh(new_info)
+    invalidate(f"user:{current_user.id}")
     return {"message": "Basic info saved", "id": new_info.id, "image_url": image_url}
 
 @router.get("/basic-info/me")
@@ -132,7 +134,6 @@ def get_lifestyle_by_user(user_id: int, db: Session = Depends(get_db)):
 # ------------------------
 
 POST_MEDIA_DIR = "media/posts"
-os.makedirs(POST_MEDIA_DIR, exist_ok=True)
 
 @router.post("/posts", response_model=PostResponse)
 def create_post(
@@ -192,42 +193,42 @@ def create_post(
     
     return new_post
 
-@router.get("/posts", response_model=List[PostResponse])
-def get_posts(db: Session = Depends(get_db)):
-    posts = db.query(Post).all()
-    enriched_posts = []
-
-    for post in posts:
-        user = db.query(User).filter(User.id == post.user_id).first()
-        user_name = user.nickname if user else "Unknown"
-
-        enriched_posts.append({
-            "id": post.id,
-            "user_id": post.user_id,
-            "phrase": post.phrase,
-            "hashtags": post.hashtags,
-            "location": post.location,
-            "person_tag": post.person_tag,
-            "disclosure": post.disclosure,
-            "image_url": post.image_url,
-            "likes": post.likes,
-            "comments": post.comments,
-            "user_name": user_name,
-            "created_at": post.created_at.isoformat() if post.created_at else None # Ensure created_at is included and formatted
+FEED_COMMENT_PREVIEWS = 3  # 피드 카드에 미리 보여줄 최근 댓글 수
+
+# ✅ 여러 게시글의 최근 댓글 N개를 윈도우 함수 한 번으로 조회 (작성자 정보 포함)
+def get_latest_comments(db: Session, post_ids: List[int], per_post: int = FEED_COMMENT_PREVIEWS):
+    if not post_ids:
+        return {}
+
+    rn = func.row_number().over(
+        partition_by=Comment.post_id,
+        order_by=(Comment.created_at.desc(), Comment.id.desc())
+    ).label("rn")
+    ranked = db.query(
+        Comment.id, Comment.post_id, Comment.user_id, Comment.content, Comment.created_at, rn
+    ).filter(Comment.post_id.in_(post_ids)).subquery()
+
+    rows = db.query(ranked, User.nickname, User.profile_image).join(
+        User, User.id == ranked.c.user_id
+    ).filter(ranked.c.rn <= per_post).order_by(ranked.c.post_id, ranked.c.rn.desc()).all()
+
+    previews = {}
+    for row in rows:
+        previews.setdefault(row.post_id, []).append({
+            "id": row.id,
+            "user_id": row.user_id,
+            "user_name": row.nickname,
+            "content": row.content,
+            "created_at": row.created_at,
+            "profile_image": row.profile_image,
         })
+    return previews
 
-    return enriched_posts
-
-@router.get("/posts/me", response_model=List[PostResponse])
-def get_my_posts(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    posts = db.query(Post).filter(Post.user_id == current_user.id).all()
-    enriched_posts = []
-
-    for post in posts:
-        basic_info = db.query(BasicInfo).filter(BasicInfo.user_id == post.user_id).first()
-        user_name = basic_info.name if basic_info else "Unknown"
-
-        enriched_posts.append({
+# ✅ (게시글, 작성자 이름) 목록 → 피드 아이템
+def build_feed_items(db: Session, rows):
+    previews = get_latest_comments(db, [post.id for post, _ in rows])
+    return [
+        {
             "id": post.id,
             "user_id": post.user_id,
             "phrase": post.phrase,
@@ -236,41 +237,39 @@ def get_my_posts(db: Session = Depends(get_db), current_user: User = Depends(get
             "person_tag": post.person_tag,
             "disclosure": post.disclosure,
             "image_url": post.image_url,
-            "likes": post.likes,
-            "comments": post.comments,
-            "user_name": user_name,
-            "created_at": post.created_at.isoformat() if post.created_at else None # Ensure created_at is included and formatted
-        })
+            "likes": post.likes or 0,
+            "comment_count": post.comment_count or 0,
+            "comments": previews.get(post.id, []),
+            "user_name": user_name or "Unknown",
+            "created_at": post.created_at,
+        }
+        for post, user_name in rows
+    ]
+
+@router.get("/posts", response_model=List[PostFeedItem])
+def get_posts(db: Session = Depends(get_db)):
+    # 피드에 필요 없는 호환용 대용량 컬럼(image, text)은 읽지 않음
+    rows = db.query(Post, User.nickname).options(defer(Post.image), defer(Post.text)).outerjoin(
+        User, User.id == Post.user_id
+    ).all()
+    return fast_response(build_feed_items(db, rows), FEED_ADAPTER)
 
-    return enriched_posts
+@router.get("/posts/me", response_model=List[PostFeedItem])
+def get_my_posts(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+    rows = db.query(Post, BasicInfo.name).options(defer(Post.image), defer(Post.text)).outerjoin(
+        BasicInfo, BasicInfo.user_id == Post.user_id
+    ).filter(Post.user_id == current_user.id).all()
+    return fast_response(build_feed_items(db, rows), FEED_ADAPTER)
 
-@router.get("/posts/user/{user_id}", response_model=List[PostResponse])
+@router.get("/posts/user/{user_id}", response_model=List[PostFeedItem])
 def get_posts_by_user(user_id: int, db: Session = Depends(get_db)):
-    posts = db.query(Post).filter(Post.user_id == user_id).all()
-    enriched_posts = []
-
-    for post in posts:
-        basic_info = db.query(BasicInfo).filter(BasicInfo.user_id == post.user_id).first()
-        user_name = basic_info.name if basic_info else "Unknown"
-
-        enriched_posts.append({
-            "id": post.id,
-            "user_id": post.user_id,
-            "phrase": post.phrase,
-            "hashtags": post.hashtags,
-            "location": post.location,
-            "person_tag": post.person_tag,
-            "disclosure": post.disclosure,
-            "image_url": post.image_url,
-            "likes": post.likes,
-            "comments": post.comments,
-            "user_name": user_name,
-            "created_at": post.created_at.isoformat() if post.created_at else None # Ensure created_at is included and formatted
-        })
-
-    return enriched_posts
+    rows = db.query(Post, BasicInfo.name).options(defer(Post.image), defer(Post.text)).outerjoin(
+        BasicInfo, BasicInfo.user_id == Post.user_id
+    ).filter(Post.user_id == user_id).all()
+    return fast_response(build_feed_items(db, rows), FEED_ADAPTER)
 
 @router.get("/posts/{post_id}", response_model=PostResponse)
+@cached_response(ttl=60, tags=("post:{post_id}",), model=PostResponse)
 def get_post_with_comments(post_id: int, db: Session = Depends(get_db)):
     post = db.query(Post).filter(Post.id == post_id).first()
     if not post:
@@ -279,9 +278,8 @@ def get_post_with_comments(post_id: int, db: Session = Depends(get_db)):
     basic_info = db.query(BasicInfo).filter(BasicInfo.user_id == post.user_id).first()
     user_name = basic_info.name if basic_info else "Unknown"
 
-    # post.comments에서 user.nickname 강제 로딩
-    for comment in post.comments:
-        _ = comment.user.nickname
+    # 댓글은 첫 페이지만 작성자 정보와 함께 조회, 나머지는 커서로 이어서 로딩
+    comments, next_cursor = fetch_comment_page(db, post.id)
 
     return {
         "id": post.id,
@@ -293,7 +291,9 @@ def get_post_with_comments(post_id: int, db: Session = Depends(get_db)):
         "disclosure": post.disclosure,
         "image_url": post.image_url,
         "likes": post.likes,
-        "comments": post.comments,
+        "comments": [{**c, "profile_image": c["user_profile_image"]} for c in comments],
+        "comment_count": post.comment_count or 0,
+        "next_comment_cursor": next_cursor,
         "user_name": user_name,  # ✅ 여기에 명시적으로 포함
         "created_at": post.created_at.isoformat() if post.created_at else None # Ensure created_at is included and formatted
     }
@@ -308,9 +308,10 @@ def delete_post(post_id: int, db: Session = Depends(get_db), current_user: User
 
     db.delete(post)
     db.commit()
+    invalidate(f"post:{post_id}")
 
     # Publish delete event to Redis
-    redis_client.publish("post_channel", json.dumps({"type": "delete_post", "post_id": post_id}))
+    publish_to_redis("post_channel", json.dumps({"type": "delete_post", "post_id": post_id}))
 
     return {"message": "Post deleted successfully"}
 
@@ -321,6 +322,7 @@ def like_post(post_id: int, db: Session = Depends(get_db), current_user: User =
         raise HTTPException(status_code=404, detail="Post not found")
     post.likes = (post.likes or 0) + 1
     db.commit()
+    invalidate(f"post:{post_id}")
     db.refresh(post) # Refresh to get the updated likes count and created_at if applicable
 
     # Broadcast updated like count to Go server
@@ -329,7 +331,7 @@ def like_post(post_id: int, db: Session = Depends(get_db), current_user: User =
         "post_id": post.id,
         "likes": post.likes
     }
-    redis_client.publish("post_channel", json.dumps(like_update_data))
+    publish_to_redis("post_channel", json.dumps(like_update_data))
 
     return {"message": "Liked post", "likes": post.likes}
 
@@ -348,8 +350,13 @@ def create_comment(
         created_at=datetime.utcnow() # Ensure created_at is set for comments
     )
     db.add(db_comment)
+    # ✅ 비정규화된 댓글 수를 같은 트랜잭션에서 원자적으로 증가
+    db.query(Post).filter(Post.id == post_id).update(
+        {Post.comment_count: Post.comment_count + 1}, synchronize_session=False
+    )
     db.commit()
     db.refresh(db_comment)
+    invalidate(f"post:{post_id}")
 
     # Prepare comment data to be broadcasted
     comment_data_to_broadcast = {
@@ -364,7 +371,7 @@ def create_comment(
     
     # ✅ Redis를 통해 Go 서버로 브로드캐스트
     # Changed channel to "post_channel" and added "type": "new_comment"
-    redis_client.publish("post_channel", json.dumps({"type": "new_comment", "comment": comment_data_to_broadcast}))
+    publish_to_redis("post_channel", json.dumps({"type": "new_comment", "comment": comment_data_to_broadcast}))
 
     return CommentResponse(
         id=db_comment.id,
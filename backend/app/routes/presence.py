@@ -0,0 +1,20 @@
+from fastapi import APIRouter, HTTPException, Query
+
+from app import presence
+
+router = APIRouter(tags=["Presence"])
+
+MAX_PRESENCE_IDS = 200
+
+# ✅ 여러 사용자의 접속 상태를 한 번에 조회 (/presence?ids=1,2,3)
+@router.get("/presence")
+async def get_presence(ids: str = Query(..., description="쉼표로 구분한 사용자 ID 목록")):
+    try:
+        user_ids = [int(x) for x in ids.split(",") if x.strip()]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="ids must be comma-separated integers")
+    if len(user_ids) > MAX_PRESENCE_IDS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_PRESENCE_IDS} ids per request")
+
+    result = await presence.get_presence(user_ids)
+    return {str(uid): state for uid, state in result.items()}
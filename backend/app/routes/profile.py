@@ -0,0 +1,164 @@
+# app/routes/profile.py
+# ✅ 프로필 화면 한 번에 조회 (/profiles/{user_id})
+#
+# 앱이 프로필을 열 때 따로 호출하던
+# /users/{id}, /basic-info/{id}, /lifestyle/{id}, /follow/{id},
+# /users/{id}/customization, /posts/user/{id} 를 한 번의 요청으로 묶는다.
+# - 사용자 + 기본 정보 + 라이프스타일: 외부 조인 한 번
+# - 팔로우: 카운트 두 개와 is_following을 스칼라 서브쿼리 한 번으로
+# - 꾸미기: 버전 캐시(profile_cache) 재사용
+# - 게시글: /posts/user/{id} 와 같은 피드 아이템
+# 가벼운 섹션(코어/팔로우/꾸미기)은 인증에서 이미 연결을 잡은 요청 세션으로 차례로 실행하고,
+# 무거운 게시글만 별도 세션으로 동시에 실행한다 → 요청당 풀 연결 최대 2개.
+# ?fields=user.nickname,posts 처럼 섹션 또는 섹션.필드 단위로 골라 받을 수 있다.
+
+import asyncio
+from typing import Callable, Dict, List, Optional, Set
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select, exists, func
+from sqlalchemy.orm import Session, defer
+from starlette.concurrency import run_in_threadpool
+
+from app.database import SessionLocal, get_db
+from app.dependencies import get_current_user
+from app.models.user import User
+from app.models.basic_info import BasicInfo
+from app.models.lifestyle import Lifestyle
+from app.models.follow import Follow
+from app.models.post import Post
+from app.routes.customization import CACHE_NAMESPACE as CUSTOMIZATION_NAMESPACE, load_customization
+from app.routes.post import build_feed_items
+from app.utils.fast_json import fast_response
+from app.utils.profile_cache import read_through
+
+router = APIRouter()
+
+SECTIONS = ("user", "basic_info", "lifestyle", "follow", "customization", "posts")
+CORE_SECTIONS = ("user", "basic_info", "lifestyle")   # 조인 한 번으로 같이 조회
+
+
+def _columns(instance, names) -> Optional[dict]:
+    if instance is None:
+        return None
+    return {name: getattr(instance, name) for name in names}
+
+
+def load_core(db: Session, user_id: int) -> Optional[dict]:
+    row = db.query(User, BasicInfo, Lifestyle).outerjoin(
+        BasicInfo, BasicInfo.user_id == User.id
+    ).outerjoin(
+        Lifestyle, Lifestyle.user_id == User.id
+    ).filter(User.id == user_id).first()
+    if row is None:
+        return None
+
+    user, info, lifestyle = row
+    return {
+        "user": _columns(user, ("id", "email", "nickname", "about", "created_at", "profile_image")),
+        "basic_info": _columns(info, ("name", "birth_date", "gender", "height", "weight", "image_url")),
+        "lifestyle": _columns(lifestyle, (
+            "id", "user_id", "medical_history", "health_goals",
+            "diet_tracking", "sleep_habits", "smoking_alcohol"
+        )),
+    }
+
+
+def load_follow(db: Session, user_id: int, viewer_id: int) -> dict:
+    follower_count = select(func.count(Follow.id)).where(Follow.following_id == user_id).scalar_subquery()
+    following_count = select(func.count(Follow.id)).where(Follow.follower_id == user_id).scalar_subquery()
+    is_following = exists().where(Follow.follower_id == viewer_id, Follow.following_id == user_id)
+    row = db.execute(select(follower_count, following_count, is_following)).one()
+    return {"follower_count": row[0], "following_count": row[1], "is_following": bool(row[2])}
+
+
+def load_posts(db: Session, user_id: int) -> List[dict]:
+    rows = db.query(Post, BasicInfo.name).options(defer(Post.image), defer(Post.text)).outerjoin(
+        BasicInfo, BasicInfo.user_id == Post.user_id
+    ).filter(Post.user_id == user_id).all()
+    return build_feed_items(db, rows)
+
+
+def load_customization_cached(db: Session, user_id: int) -> dict:
+    _, body = read_through(CUSTOMIZATION_NAMESPACE, user_id, lambda: load_customization(db, user_id))
+    return orjson.loads(body)
+
+
+def _run_with_session(fn: Callable, *args):
+    # 동시에 도는 섹션은 별도 세션 (세션은 스레드 간에 동시에 쓰면 안 됨)
+    db = SessionLocal()
+    try:
+        return fn(db, *args)
+    finally:
+        db.close()
+
+
+def load_light_sections(db: Session, user_id: int, viewer_id: int, selected) -> Dict[str, object]:
+    # 요청 세션 하나로 차례로: 조인 한 번 + 스칼라 쿼리 한 번 + (대개 캐시 적중인) 꾸미기
+    results: Dict[str, object] = {"core": load_core(db, user_id)}
+    if results["core"] is None:
+        return results
+    if "follow" in selected:
+        results["follow"] = load_follow(db, user_id, viewer_id)
+    if "customization" in selected:
+        results["customization"] = load_customization_cached(db, user_id)
+    return results
+
+
+def parse_fields(fields: Optional[str]) -> Dict[str, Optional[Set[str]]]:
+    """
+    "user.nickname,user.profile_image,posts" → {"user": {"nickname", "profile_image"}, "posts": None}
+    None means every field of the section.
+    """
+    if not fields:
+        return {section: None for section in SECTIONS}
+
+    selected: Dict[str, Optional[Set[str]]] = {}
+    for item in fields.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        section, _, field = item.partition(".")
+        if section not in SECTIONS:
+            raise HTTPException(status_code=400, detail=f"Unknown profile section: {section}")
+        if not field:
+            selected[section] = None
+        elif section not in selected or selected[section] is not None:
+            selected.setdefault(section, set()).add(field)
+    return selected
+
+
+def _pick(value, names: Optional[Set[str]]):
+    if names is None or value is None:
+        return value
+    if isinstance(value, list):
+        return [{k: v for k, v in item.items() if k in names} for item in value]
+    return {k: v for k, v in value.items() if k in names}
+
+
+@router.get("/profiles/{user_id}")
+async def get_profile(
+    user_id: int,
+    fields: Optional[str] = Query(None, description="섹션 또는 섹션.필드 목록 (쉼표 구분)"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    selected = parse_fields(fields)
+
+    # 코어 조회는 항상 실행 (존재하지 않는 사용자는 404)
+    # db는 get_current_user와 같은 요청 세션 (의존성은 요청당 한 번만 만들어짐)
+    jobs = [run_in_threadpool(load_light_sections, db, user_id, current_user.id, selected)]
+    if "posts" in selected:
+        jobs.append(run_in_threadpool(_run_with_session, load_posts, user_id))
+
+    done = await asyncio.gather(*jobs)
+    results = done[0]
+    if "posts" in selected:
+        results["posts"] = done[1]
+    core = results.pop("core")
+    if core is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    results.update(core)
+
+    return fast_response({section: _pick(results[section], names) for section, names in selected.items()})
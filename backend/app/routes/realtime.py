@@ -0,0 +1,18 @@
+from fastapi import APIRouter
+
+from app.redis_subscriber import bridge
+from app.typing_indicator import typing_tracker
+from app.reminders import reminder_scheduler
+from app.utils.query_stats import route_query_stats
+
+router = APIRouter(prefix="/realtime", tags=["Realtime"])
+
+# ✅ Redis 브릿지 상태 및 지연(lag) 지표
+@router.get("/metrics")
+def get_realtime_metrics():
+    return {
+        **bridge.snapshot(),
+        "typing": dict(typing_tracker.stats),
+        "reminders": reminder_scheduler.snapshot(),
+        "sql": route_query_stats.snapshot(),
+    }
@@ -6,7 +6,6 @@ from uuid import uuid4
 router = APIRouter()
 
 UPLOAD_DIR = "static/uploads"
-os.makedirs(UPLOAD_DIR, exist_ok=True)
 
 @router.post("/upload/image")
 async def upload_image(file: UploadFile = File(...)):
@@ -15,6 +15,7 @@ from app.schemas.user import (
      # ✅ 추가
 )
 from app.auth.utils import hash_password
+from app.utils.response_cache import cached_response, invalidate
 
 router = APIRouter()
 
@@ -34,6 +35,7 @@ def update_about(
         current_user.about = user_update.about
         db.commit()
         db.refresh(current_user)
+        invalidate(f"user:{current_user.id}")
     return current_user
 
 # ✅ 비밀번호 재설정
@@ -48,6 +50,7 @@ def reset_password(data: PasswordResetRequest, db: Session = Depends(get_db)):
 
 # ✅ 특정 사용자 정보
 @router.get("/{user_id}", response_model=UserResponse)
+@cached_response(ttl=300, tags=("user:{user_id}",), model=UserResponse)
 def get_user_by_id(user_id: int, db: Session = Depends(get_db)):
     user = db.query(User).filter(User.id == user_id).first()
     if not user:
@@ -1,28 +1,149 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from app.database import get_db
+from app.dependencies import get_current_user
 from app.models.widget_layout import WidgetLayout
-from app.schemas.widget_layout import SaveLayoutRequest
+from app.schemas.widget_layout import SaveLayoutRequest, LayoutPatchRequest, LayoutOperation
+from app.utils.etag import matches
+from app.utils.profile_cache import cached_read, bump_version, content_etag
 
 router = APIRouter()
 
-@router.post("/profile/layout/save")
-def save_layout(request: SaveLayoutRequest, db: Session = Depends(get_db)):
-    existing = db.query(WidgetLayout).filter_by(user_id=request.user_id).first()
-    if existing:
-        existing.layout_json = [section.dict() for section in request.layout]
+CACHE_NAMESPACE = "layout"
+
+
+# ✅ 레이아웃 버전 → ETag (레이아웃이 없으면 version 0)
+def layout_etag(user_id: int, version: int) -> str:
+    return content_etag(CACHE_NAMESPACE, user_id, version)
+
+
+def _check_if_match(if_match: Optional[str], user_id: int, version: int):
+    if if_match is not None and not matches(if_match, layout_etag(user_id, version)):
+        raise HTTPException(status_code=412, detail="Layout was modified by another device")
+
+
+# ✅ 저장: 읽어 둔 버전이 그대로일 때만 한 번의 조건부 UPDATE로 반영 (아니면 412)
+#    레이아웃이 없던 사용자는 INSERT, 동시에 다른 디바이스가 먼저 만들었다면 유니크 제약 위반 → 412
+#    expected_version=None이면 버전 확인 없이 덮어씀 (If-Match 없는 저장)
+def _write_layout(db: Session, user_id: int, layout: list, existing: Optional[WidgetLayout],
+                  expected_version: Optional[int]) -> int:
+    if existing is None:
+        db.add(WidgetLayout(user_id=user_id, layout_json=layout, version=1))
+        try:
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            raise HTTPException(status_code=412, detail="Layout was modified by another device")
+        return 1
+
+    query = db.query(WidgetLayout).filter(WidgetLayout.id == existing.id)
+    if expected_version is not None:
+        query = query.filter(WidgetLayout.version == expected_version)
+    updated = query.update(
+        {WidgetLayout.layout_json: layout, WidgetLayout.version: WidgetLayout.version + 1},
+        synchronize_session=False
+    )
+    if updated == 0:
+        db.rollback()
+        raise HTTPException(status_code=412, detail="Layout was modified by another device")
+    if expected_version is not None:
+        version = expected_version + 1
     else:
-        new_layout = WidgetLayout(
-            user_id=request.user_id,
-            layout_json=[section.dict() for section in request.layout]
-        )
-        db.add(new_layout)
+        version = db.query(WidgetLayout.version).filter(WidgetLayout.id == existing.id).scalar()
     db.commit()
-    return {"status": "ok"}
+    return version
 
-@router.get("/profile/layout/{user_id}")
-def get_layout(user_id: int, db: Session = Depends(get_db)):
+
+def _apply_op(layout: list, op: LayoutOperation) -> list:
+    index = next((i for i, w in enumerate(layout) if w.get("id") == op.id), None)
+
+    if op.op == "add":
+        if index is not None:
+            raise HTTPException(status_code=409, detail=f"Widget already exists: {op.id}")
+        if op.widget is None:
+            raise HTTPException(status_code=400, detail="add requires widget")
+        layout.append({**op.widget.dict(), "id": op.id})
+        return layout
+
+    if index is None:
+        raise HTTPException(status_code=404, detail=f"Widget not found: {op.id}")
+
+    widget = dict(layout[index])
+    if op.op == "remove":
+        layout.pop(index)
+        return layout
+    if op.op == "move":
+        if op.position is not None:
+            widget["position"] = op.position
+        if op.size is not None:
+            widget["size"] = op.size
+    elif op.op == "update":
+        widget["config"] = {**(widget.get("config") or {}), **(op.config or {})}
+    layout[index] = widget
+    return layout
+
+
+@router.post("/profile/layout/save")
+def save_layout(
+    request: SaveLayoutRequest,
+    response: Response,
+    db: Session = Depends(get_db),
+    if_match: Optional[str] = Header(None)
+):
+    existing = db.query(WidgetLayout).filter_by(user_id=request.user_id).first()
+    version = existing.version if existing else 0
+    _check_if_match(if_match, request.user_id, version)
+
+    layout = [section.dict() for section in request.layout]
+    version = _write_layout(db, request.user_id, layout, existing, version if if_match is not None else None)
+
+    bump_version(CACHE_NAMESPACE, request.user_id, version)
+    response.headers["ETag"] = layout_etag(request.user_id, version)
+    return {"status": "ok", "version": version}
+
+def load_layout(db: Session, user_id: int):
     layout = db.query(WidgetLayout).filter_by(user_id=user_id).first()
     if not layout:
-        return {"layout": []}
-    return {"layout": layout.layout_json}
\ No newline at end of file
+        return 0, {"layout": [], "version": 0}
+    return layout.version, {"layout": layout.layout_json, "version": layout.version}
+
+@router.get("/profile/layout/{user_id}")
+def get_layout(
+    user_id: int,
+    db: Session = Depends(get_db),
+    if_none_match: Optional[str] = Header(None)
+):
+    return cached_read(CACHE_NAMESPACE, user_id, if_none_match, lambda: load_layout(db, user_id))
+
+# ✅ 위젯 단위 부분 수정: If-Match 버전이 그대로일 때만 한 번의 UPDATE로 반영
+@router.patch("/profile/layout/{user_id}")
+def patch_layout(
+    user_id: int,
+    request: LayoutPatchRequest,
+    response: Response,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user),
+    if_match: Optional[str] = Header(None)
+):
+    if current_user.id != user_id:
+        raise HTTPException(status_code=403, detail="Not allowed to edit this layout")
+    if if_match is None:
+        raise HTTPException(status_code=428, detail="If-Match header is required")
+
+    existing = db.query(WidgetLayout).filter_by(user_id=user_id).first()
+    version = existing.version if existing else 0
+    _check_if_match(if_match, user_id, version)
+
+    layout = [dict(w) for w in (existing.layout_json if existing else [])]
+    for op in request.ops:
+        layout = _apply_op(layout, op)
+
+    version = _write_layout(db, user_id, layout, existing, version)
+
+    bump_version(CACHE_NAMESPACE, user_id, version)
+
+    response.headers["ETag"] = layout_etag(user_id, version)
+    return {"status": "ok", "version": version}
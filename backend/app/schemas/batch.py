@@ -0,0 +1,19 @@
+from typing import Any, List, Optional
+from pydantic import BaseModel
+
+# ✅ /batch 하위 요청 (GET만 허용)
+class BatchItem(BaseModel):
+    id: Optional[str] = None   # 응답에서 요청을 구분하기 위한 클라이언트 지정 ID
+    path: str                  # 예: "/basic-info/3", "/follow/3?x=1"
+
+class BatchRequest(BaseModel):
+    requests: List[BatchItem]
+
+class BatchResult(BaseModel):
+    id: Optional[str] = None
+    path: str
+    status: int
+    body: Any = None
+
+class BatchResponse(BaseModel):
+    results: List[BatchResult]
@@ -1,5 +1,6 @@
 from pydantic import BaseModel
 from typing import Optional
+from datetime import datetime
 
 class CommentCreate(BaseModel):
     content: str
@@ -11,6 +12,7 @@ class CommentResponse(BaseModel):
     user_nickname: str  # ✅ 이미 존재
     user_name: str      # ✅ 이거 추가해야 함
     user_profile_image: Optional[str] 
+    created_at: Optional[datetime] = None
 
     class Config:
         from_attributes = True
\ No newline at end of file
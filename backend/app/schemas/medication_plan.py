@@ -0,0 +1,72 @@
+from datetime import date, time
+from typing import List, Literal, Optional
+from pydantic import BaseModel, validator
+
+class MedicationPlanCreate(BaseModel):
+    title: str
+    frequency: Literal["daily", "weekly", "interval"]
+    interval_days: int = 1
+    weekdays: Optional[List[int]] = None   # 0=월 ~ 6=일
+    times: List[str]                       # ["08:00", "20:00"]
+    start_date: date
+    end_date: Optional[date] = None
+
+    @validator("times")
+    def check_times(cls, v):
+        if not v:
+            raise ValueError("times must not be empty")
+        for t in v:
+            hour, _, minute = t.partition(":")
+            if not (hour.isdigit() and minute.isdigit() and int(hour) < 24 and int(minute) < 60):
+                raise ValueError(f"invalid time: {t} (HH:MM)")
+        return [f"{int(t.split(':')[0]):02d}:{int(t.split(':')[1]):02d}" for t in v]
+
+    @validator("weekdays")
+    def check_weekdays(cls, v):
+        if v is not None and any(d < 0 or d > 6 for d in v):
+            raise ValueError("weekdays must be between 0 (Mon) and 6 (Sun)")
+        return v
+
+    @validator("interval_days")
+    def check_interval(cls, v):
+        if v < 1:
+            raise ValueError("interval_days must be at least 1")
+        return v
+
+    @validator("end_date")
+    def check_end(cls, v, values):
+        if v is not None and "start_date" in values and v < values["start_date"]:
+            raise ValueError("end_date must not be before start_date")
+        return v
+
+class MedicationPlanOut(BaseModel):
+    id: int
+    title: str
+    frequency: str
+    interval_days: int
+    weekdays: Optional[List[int]] = None
+    times: List[str]
+    start_date: date
+    end_date: Optional[date] = None
+
+    class Config:
+        from_attributes = True
+
+# ✅ 펼쳐진 복용 1회
+class DoseOut(BaseModel):
+    plan_id: int
+    title: str
+    date: date
+    time: time
+    status: str   # pending / taken / skipped
+
+class DoseStatusUpdate(BaseModel):
+    date: date
+    time: time
+    status: Literal["pending", "taken", "skipped"]   # pending이면 기록 삭제
+
+class DoseDaySummary(BaseModel):
+    date: date
+    count: int
+    taken: int
+    skipped: int
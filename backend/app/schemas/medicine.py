@@ -13,4 +13,10 @@ class MedicineOut(BaseModel):
     title: str
 
     class Config:
-        from_attributes = True  # Pydantic v2 이상에서는 orm_mode 대신 사용
\ No newline at end of file
+        from_attributes = True  # Pydantic v2 이상에서는 orm_mode 대신 사용
+
+# ✅ 월간 캘린더: 날짜별 요약
+class MedicineDaySummary(BaseModel):
+    date: date
+    count: int
+    first_time: time
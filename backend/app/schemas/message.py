@@ -43,4 +43,9 @@ class MessageUser(BaseModel):
     unread_count: int
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+# ✅ 읽음 처리 요청용 (스크롤 중 본 마지막 메시지 ID 하나만 전송)
+class ReadReceiptRequest(BaseModel):
+    peer_id: int
+    last_read_message_id: int
@@ -57,6 +57,27 @@ class PostResponse(BaseModel):
     likes: int
     comments: List[CommentResponse]
     user_name: Optional[str]  # ✅ 여기 추가!
+    comment_count: int = 0
+    next_comment_cursor: Optional[str] = None  # 다음 댓글 페이지 (GET /posts/{post_id}/comments?cursor=)
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+# ✅ 피드용 경량 게시글 스키마 (전체 댓글 대신 댓글 수 + 최근 댓글 몇 개만)
+class PostFeedItem(BaseModel):
+    id: int
+    user_id: int
+    phrase: Optional[str]
+    hashtags: Optional[str]
+    location: Optional[str]
+    person_tag: Optional[str]
+    disclosure: Optional[str]
+    image_url: Optional[str]
+    likes: int
+    comment_count: int
+    comments: List[CommentResponse]  # 최근 댓글 미리보기 (전체는 GET /posts/{post_id}/comments)
+    user_name: Optional[str]
+    created_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
@@ -1,4 +1,4 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Literal
 from pydantic import BaseModel
 
 class WidgetSection(BaseModel):
@@ -10,4 +10,16 @@ class WidgetSection(BaseModel):
 
 class SaveLayoutRequest(BaseModel):
     user_id: int
-    layout: List[WidgetSection]
\ No newline at end of file
+    layout: List[WidgetSection]
+
+# ✅ 레이아웃 부분 수정 (위젯 단위 add / move / update / remove)
+class LayoutOperation(BaseModel):
+    op: Literal["add", "move", "update", "remove"]
+    id: str
+    widget: WidgetSection | None = None          # add
+    position: Dict[str, int] | None = None       # move
+    size: Dict[str, int] | None = None           # move
+    config: Dict[str, Any] | None = None         # update
+
+class LayoutPatchRequest(BaseModel):
+    ops: List[LayoutOperation]
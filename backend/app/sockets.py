@@ -3,12 +3,15 @@
 from socketio import AsyncServer
 from fastapi_socketio import SocketManager # This import might not be needed if not using SocketManager
 from fastapi import Request, WebSocket # These imports might not be needed if not using Request/WebSocket directly here
-import redis
 import json
+import logging
 from typing import List
 
-# ✅ Redis 클라이언트 설정
-redis_client = redis.Redis(host='localhost', port=6379, decode_responses=True)
+from app import presence
+from app.typing_indicator import typing_tracker
+from app.utils.redis import publish_to_redis
+
+logger = logging.getLogger(__name__)
 
 # Removed Redis에서 받은 post 이벤트 처리 (listen_to_redis function)
 # Because post events are now handled directly by Go server's Redis subscriber
@@ -16,7 +19,7 @@ redis_client = redis.Redis(host='localhost', port=6379, decode_responses=True)
 # ✅ Redis를 통해 Go 서버로 메시지 전달 (assuming this is for general chat, not posts)
 def broadcast_to_go(user: str, message: str):
     payload = json.dumps({"user": user, "msg": message})
-    redis_client.publish("chat_channel", payload)
+    publish_to_redis("chat_channel", payload)
 
 # ✅ Socket.IO 서버 인스턴스
 sio = AsyncServer(async_mode="asgi", cors_allowed_origins="*")
@@ -27,7 +30,7 @@ sio = AsyncServer(async_mode="asgi", cors_allowed_origins="*")
 @sio.event
 async def join_feed(sid):
     await sio.enter_room(sid, "feed")
-    print(f"✅ {sid} joined feed room")
+    logger.debug("%s joined feed room", sid)
 
 # NOTE: decode_jwt function is not provided, assuming it exists elsewhere or JWT handling is for another part
 def decode_jwt(token: str):
@@ -38,7 +41,7 @@ def decode_jwt(token: str):
         decoded = jwt.decode(token, "your-secret-key", algorithms=["HS256"]) # Replace "your-secret-key" with your actual secret
         return decoded.get("user_id")
     except Exception as e:
-        print(f"❌ JWT decoding error: {e}")
+        logger.info("JWT decoding error: %s", e)
         return None
 
 @sio.event
@@ -54,9 +57,14 @@ async def connect(sid, environ, auth):
         room = f"user_{user_id}"
         await sio.save_session(sid, {'user_id': user_id})
         await sio.enter_room(sid, room)
-        print(f"✅ {sid} joined room {room} with user ID {user_id}")
+        try:
+            await presence.register(int(user_id), conn_id=sid)  # ✅ Socket.IO 연결도 presence에 등록
+        except Exception as e:
+            # presence 기록 실패로 연결 자체를 끊지는 않음 (room 전달은 그대로 동작, 다음 하트비트 대상에서만 빠짐)
+            logger.warning("Presence register failed: %s", e, extra={"sid": sid, "user_id": user_id})
+        logger.info("Socket.IO connected", extra={"sid": sid, "room": room, "user_id": user_id})
     else:
-        print(f"⚠️ {sid} connected without a valid user ID or token.")
+        logger.warning("Socket.IO connected without a valid user ID or token", extra={"sid": sid})
         # Optionally, you might want to disconnect clients without valid auth immediately
         # await sio.disconnect(sid)
 
@@ -68,9 +76,10 @@ async def disconnect(sid):
     if user_id:
         room = f"user_{user_id}"
         await sio.leave_room(sid, room)
-        print(f"❌ {sid} left room {room}")
+        await presence.unregister(int(user_id), sid)
+        logger.info("Socket.IO disconnected", extra={"sid": sid, "room": room})
     else:
-        print(f"❌ {sid} disconnected (no user ID in session).")
+        logger.info("Socket.IO disconnected (no user ID in session)", extra={"sid": sid})
 
 
 @sio.event
@@ -79,38 +88,41 @@ async def join(sid, data):
     if room:
         await sio.save_session(sid, {'room': room}) # This might overwrite user_id if both are saved in 'room' session
         await sio.enter_room(sid, room)
-        print(f"📦 {sid} joined room: {room}")
+        logger.debug("Socket.IO joined room", extra={"sid": sid, "room": room})
 
 @sio.event
 async def leave(sid, data):
     room = data.get("room")
     if room:
         await sio.leave_room(sid, room)
-        print(f"👋 {sid} left room: {room}")
+        logger.debug("Socket.IO left room", extra={"sid": sid, "room": room})
 
 @sio.on("leave")
 async def handle_leave(sid, data):
     room = data.get("room")
     if room:
         await sio.leave_room(sid, room)
-        print(f"👋 User with sid {sid} left room: {room}")
+        logger.debug("Socket.IO left room", extra={"sid": sid, "room": room})
 
 @sio.on("join")
 async def handle_join(sid, data):
     room = data.get("room")
     if room:
         await sio.enter_room(sid, room)
-        print(f"✅ User with sid {sid} joined room: {room}")
+        logger.debug("Socket.IO joined room", extra={"sid": sid, "room": room})
 
 @sio.event
 async def typing(sid, data):
     receiver_id = data.get('receiverId')
     sender_id = data.get('senderId')
     if receiver_id and sender_id: # Ensure IDs exist
-        room = f"user_{receiver_id}"
-        await sio.emit("typing", sender_id, room=room)
+        # ✅ 키 입력마다 보내지 않고 started/stopped 상태 변화만 전달
+        if data.get('state') == 'stopped':
+            await typing_tracker.stop(int(sender_id), int(receiver_id))
+        else:
+            await typing_tracker.typing(int(sender_id), int(receiver_id))
     else:
-        print("⚠️ Missing receiverId or senderId for typing event.")
+        logger.warning("Missing receiverId or senderId for typing event")
 
 
 @sio.on("send_message")
@@ -120,4 +132,4 @@ async def handle_send_message(sid, data):
         receiver_room = f"user_{receiver_id}"
         await sio.emit("message", data, room=receiver_room)
     else:
-        print("⚠️ Missing receiver_id for send_message event.")
\ No newline at end of file
+        logger.warning("Missing receiver_id for send_message event")
\ No newline at end of file
@@ -0,0 +1,109 @@
+# app/typing_indicator.py
+# ✅ 타이핑 표시 상태 추적기
+#
+# 키 입력마다 오는 typing 이벤트를 (보낸 사람, 받는 사람) 쌍 단위로 모아서
+# 상태가 바뀔 때(started / stopped)만 전송한다.
+# - started: 쌍의 첫 typing 이벤트
+# - 계속 입력 중이면 KEEPALIVE 주기마다 한 번만 started를 다시 보냄
+#   (클라이언트는 3초 동안 이벤트가 없으면 표시를 끄기 때문)
+# - stopped: TYPING_TIMEOUT 동안 입력이 없거나 stop() 호출 시 (메시지 전송 등)
+# - is_online을 넘기면 started를 보내기 직전에만 수신자 접속 여부를 확인 (키 입력마다 Redis 조회하지 않음)
+#   오프라인이라 started를 보내지 않은 쌍은 stopped도 보내지 않는다
+
+import asyncio
+import json
+import logging
+import time
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from app.utils.redis import publish_to_redis_async
+
+logger = logging.getLogger(__name__)
+
+TYPING_TIMEOUT = 4.0    # 마지막 입력 후 stopped까지 걸리는 시간(초)
+KEEPALIVE = 2.5         # 입력 중 started 재전송 최소 간격(초)
+
+Pair = Tuple[int, int]
+OnlineCheck = Callable[[int], Awaitable[bool]]
+
+
+class _TypingState:
+    __slots__ = ("last_seen", "last_emit", "announced", "task")
+
+    def __init__(self, now: float):
+        self.last_seen = now
+        self.last_emit = now
+        self.announced = False   # started를 한 번이라도 보냈는지
+        self.task: Optional[asyncio.Task] = None
+
+
+class TypingTracker:
+    def __init__(self):
+        self._states: Dict[Pair, _TypingState] = {}
+        self.stats = {"received": 0, "emitted": 0}
+
+    async def typing(self, sender_id: int, receiver_id: int, is_online: Optional[OnlineCheck] = None):
+        self.stats["received"] += 1
+        pair = (sender_id, receiver_id)
+        now = time.monotonic()
+        state = self._states.get(pair)
+
+        if state is None:
+            state = _TypingState(now)
+            self._states[pair] = state
+            state.task = asyncio.create_task(self._expire(pair))
+            await self._announce(state, sender_id, receiver_id, is_online)
+            return
+
+        state.last_seen = now
+        if now - state.last_emit >= KEEPALIVE:
+            state.last_emit = now
+            await self._announce(state, sender_id, receiver_id, is_online)
+
+    async def stop(self, sender_id: int, receiver_id: int):
+        state = self._states.pop((sender_id, receiver_id), None)
+        if state is None:
+            return
+        if state.task is not None and state.task is not asyncio.current_task():
+            state.task.cancel()
+        if state.announced:
+            await self._emit(sender_id, receiver_id, "stopped")
+
+    async def _announce(self, state: _TypingState, sender_id: int, receiver_id: int,
+                        is_online: Optional[OnlineCheck]):
+        if is_online is not None:
+            try:
+                if not await is_online(receiver_id):
+                    return
+            except Exception as e:
+                logger.warning("Typing presence check error: %s", e)
+        state.announced = True
+        await self._emit(sender_id, receiver_id, "started")
+
+    async def _expire(self, pair: Pair):
+        # 쌍마다 하나의 타이머: 입력이 이어지면 남은 시간만큼 다시 대기
+        while True:
+            state = self._states.get(pair)
+            if state is None:
+                return
+            remaining = state.last_seen + TYPING_TIMEOUT - time.monotonic()
+            if remaining <= 0:
+                await self.stop(*pair)
+                return
+            await asyncio.sleep(remaining)
+
+    async def _emit(self, sender_id: int, receiver_id: int, state: str):
+        self.stats["emitted"] += 1
+        try:
+            await publish_to_redis_async("chat_channel", json.dumps({
+                "type": "typing",
+                "room": f"user_{receiver_id}",
+                "senderId": sender_id,
+                "state": state,
+            }))
+        except Exception as e:
+            logger.warning("Typing publish error: %s", e)
+
+
+# ✅ 워커당 하나의 추적기
+typing_tracker = TypingTracker()
@@ -0,0 +1,28 @@
+# app/utils/etag.py
+# ✅ ETag / 조건부 요청(If-Match, If-None-Match) 헬퍼
+
+from typing import Optional
+
+
+def make_etag(*parts) -> str:
+    # 강한(strong) ETag: 내용 버전이 같으면 바이트 단위로 같은 응답
+    return '"' + "-".join(str(p) for p in parts) + '"'
+
+
+def _tags(header: Optional[str]):
+    if not header:
+        return []
+    tags = []
+    for tag in header.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag:
+            tags.append(tag)
+    return tags
+
+
+def matches(header: Optional[str], etag: str) -> bool:
+    """True when an If-Match / If-None-Match header lists etag (or '*')."""
+    tags = _tags(header)
+    return "*" in tags or etag in tags
@@ -0,0 +1,53 @@
+# app/utils/fast_json.py
+# ✅ 조회량 많은 목록 API용 빠른 JSON 응답 경로
+#
+# 기본 경로: dict → response_model(Pydantic) 재검증 → jsonable_encoder → json.dumps
+# 빠른 경로: ORM 행에서 스키마 모양 그대로 만든 dict → orjson.dumps (재검증 생략)
+# 엔드포인트는 response_model을 그대로 두므로 OpenAPI 문서는 바뀌지 않는다.
+# settings.fast_json=False 이면 기존 경로로 돌아가고,
+# settings.fast_json_validate=True 이면 미리 만들어 둔 TypeAdapter로 모양을 검증한다 (개발용).
+
+from typing import Any, List, Optional
+
+import orjson
+from fastapi.responses import Response
+from pydantic import TypeAdapter
+
+from app.config import settings
+from app.schemas.comment import CommentResponse
+from app.schemas.message import MessageSchema, MessageUser
+from app.schemas.post import PostFeedItem
+
+# Pydantic과 같은 UTC 표기("Z")를 쓰도록 설정
+ORJSON_OPTIONS = orjson.OPT_UTC_Z
+
+# ✅ 미리 만들어 둔 어댑터 (요청마다 스키마를 다시 만들지 않음)
+FEED_ADAPTER = TypeAdapter(List[PostFeedItem])
+COMMENTS_ADAPTER = TypeAdapter(List[CommentResponse])
+MESSAGES_ADAPTER = TypeAdapter(List[MessageSchema])
+MESSAGE_USERS_ADAPTER = TypeAdapter(List[MessageUser])
+
+
+class FastJSONResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=ORJSON_OPTIONS)
+
+
+def fast_response(content: Any, adapter: Optional[TypeAdapter] = None, response: Optional[Response] = None):
+    """
+    Returns content through the fast path, or unchanged when fast_json is off.
+    Headers already set on an injected `response` are carried over.
+    """
+    if not settings.fast_json:
+        return content
+    if settings.fast_json_validate and adapter is not None:
+        adapter.validate_python(content)
+
+    fast = FastJSONResponse(content)
+    if response is not None:
+        for key, value in response.headers.items():
+            if key.lower() != "content-length":
+                fast.headers[key] = value
+    return fast
@@ -0,0 +1,157 @@
+# app/utils/log.py
+# ✅ 비동기 구조화 로깅
+#
+# - 요청 처리 스레드는 QueueHandler로 레코드를 큐에 넣기만 하고,
+#   실제 stdout 쓰기는 QueueListener의 백그라운드 스레드가 한다.
+# - 한 줄에 JSON 하나: ts, level, logger, msg, request_id + extra 필드.
+# - JWT / Bearer 토큰 / password 값은 쓰기 전에 가린다.
+# - WARNING 미만은 settings.log_sample_rate 비율만 남긴다 (부하 시 INFO 줄이기).
+# - 요청 ID: X-Request-ID 헤더를 그대로 쓰거나 새로 만들고, 응답 헤더로 돌려준다.
+#
+# 모듈에서는 표준대로 logger = logging.getLogger(__name__) 로 사용 ("app.*" 로거).
+
+import copy
+import json
+import logging
+import logging.handlers
+import queue
+import random
+import re
+import sys
+import uuid
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Optional
+
+from app.config import settings
+
+request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+_REDACTIONS = [
+    (re.compile(r"eyJ[\w-]+\.[\w-]+\.[\w-]*"), "[REDACTED_JWT]"),
+    (re.compile(r"(?i)(bearer\s+)[^\s\"',]+"), r"\1[REDACTED]"),
+    (re.compile(r"(?i)([\"']?(?:password|token|secret)[\"']?\s*[:=]\s*)[\"']?[^\s\"',}]+[\"']?"), r"\1[REDACTED]"),
+]
+
+_SENSITIVE_KEY = re.compile(r"(?i)password|token|secret|authorization")
+
+# LogRecord 기본 속성 (이 외의 속성은 extra로 보고 JSON에 포함)
+_RESERVED = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "request_id"}
+
+
+def redact(text: str) -> str:
+    for pattern, replacement in _REDACTIONS:
+        text = pattern.sub(replacement, text)
+    return text
+
+
+class RequestIdFilter(logging.Filter):
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get()
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """Keeps every WARNING+ record and a `rate` fraction of the rest."""
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno >= logging.WARNING or self.rate >= 1 or random.random() < self.rate
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": redact(record.getMessage()),
+        }
+        if getattr(record, "request_id", None):
+            entry["request_id"] = record.request_id
+        for key, value in record.__dict__.items():
+            if key in _RESERVED or key.startswith("_"):
+                continue
+            if _SENSITIVE_KEY.search(key):
+                entry[key] = "[REDACTED]"
+            else:
+                entry[key] = redact(value) if isinstance(value, str) else value
+        if record.exc_info:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc"] = redact(record.exc_text)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class _StructuredQueueHandler(logging.handlers.QueueHandler):
+    # 기본 prepare는 메시지를 문자열로 합쳐 버리므로, extra 필드를 살린 채 메시지/예외만 미리 계산
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def setup_logging():
+    """Routes the "app" logger through a queue to a background writer thread."""
+    global _listener
+    if _listener is not None:
+        return
+
+    writer = logging.StreamHandler(sys.stdout)
+    writer.setFormatter(JsonFormatter())
+
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    handler = _StructuredQueueHandler(records)
+    # 필터는 요청 컨텍스트(ContextVar)가 살아 있는 쪽, 즉 큐에 넣기 전에 적용
+    handler.addFilter(RequestIdFilter())
+    handler.addFilter(SamplingFilter(settings.log_sample_rate))
+
+    logger = logging.getLogger("app")
+    logger.handlers = [handler]
+    logger.setLevel(settings.log_level.upper())
+    logger.propagate = False
+
+    _listener = logging.handlers.QueueListener(records, writer)
+    _listener.start()
+
+
+def shutdown_logging():
+    """Flushes queued records and stops the writer thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+class RequestIdMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        incoming = dict(scope.get("headers") or []).get(b"x-request-id", b"").decode("latin-1")
+        request_id = incoming[:64] if incoming else uuid.uuid4().hex[:16]
+        token = request_id_var.set(request_id)
+
+        async def send_with_id(message):
+            if message["type"] == "http.response.start":
+                message = {**message, "headers": [*message.get("headers", []), (b"x-request-id", request_id.encode())]}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            request_id_var.reset(token)
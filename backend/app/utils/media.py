@@ -0,0 +1,15 @@
+# app/utils/media.py
+# ✅ 업로드 파일 저장 디렉토리 (import 시점이 아니라 lifespan 시작 시 한 번 생성)
+
+import os
+
+MEDIA_DIRS = (
+    "media/profiles",   # basic_info / lifestyle / post 프로필 이미지
+    "media/posts",      # 게시글 이미지
+    "static/uploads",   # upload / mood 이미지
+)
+
+
+def ensure_media_dirs():
+    for path in MEDIA_DIRS:
+        os.makedirs(path, exist_ok=True)
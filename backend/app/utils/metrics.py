@@ -0,0 +1,267 @@
+# app/utils/metrics.py
+# ✅ Prometheus 텍스트 형식 지표 (외부 라이브러리 없이)
+#
+# - 카운터/히스토그램은 스레드마다 자기 dict에만 더하고(기록 시 락 없음),
+#   /metrics 수집 때 모든 스레드의 값을 합친다. 락은 새 스레드가 처음 기록할 때만 잡는다.
+#   anyio는 쉬는 워커 스레드를 정리하므로, 끝난 스레드의 dict는 기본 dict에 합치고 목록에서 뺀다.
+# - 게이지는 이벤트 루프에서만 바꾸거나(in-flight), 수집 시점에 콜백으로 계산한다(풀, 웹소켓 수).
+# - 라벨에는 라우트 템플릿(/posts/{post_id})만 쓰고 실제 경로는 쓰지 않는다 (시계열 폭증 방지).
+
+import bisect
+import logging
+import threading
+import time
+import weakref
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+LabelValues = Tuple[str, ...]
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class _Sharded:
+    """스레드별 dict에 누적, 읽을 때 합산"""
+
+    def __init__(self):
+        self._local = threading.local()
+        self._shards: List[Tuple[weakref.ref, dict]] = []
+        self._base: dict = {}   # 끝난 스레드들의 값
+        self._lock = threading.Lock()
+
+    def _shard(self) -> dict:
+        try:
+            return self._local.values
+        except AttributeError:
+            values = {}
+            with self._lock:
+                self._fold_dead()
+                self._shards.append((weakref.ref(threading.current_thread()), values))
+            self._local.values = values
+            return values
+
+    def _fold_dead(self):
+        # self._lock 안에서 호출. 끝난 스레드는 더 이상 자기 dict에 쓰지 않으므로 옮겨도 안전하다.
+        alive = []
+        for ref, shard in self._shards:
+            thread = ref()
+            if thread is not None and thread.is_alive():
+                alive.append((ref, shard))
+                continue
+            for key, value in shard.items():
+                self._base[key] = self._base.get(key, 0) + value
+        self._shards = alive
+
+    def add(self, key, amount: float = 1.0):
+        shard = self._shard()
+        shard[key] = shard.get(key, 0) + amount
+
+    def merged(self) -> dict:
+        with self._lock:
+            self._fold_dead()
+            shards = [shard for _, shard in self._shards]
+            total = dict(self._base)
+        for shard in shards:
+            for key, value in shard.copy().items():
+                total[key] = total.get(key, 0) + value
+        return total
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Iterable[str], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(int(value)) if float(value).is_integer() else repr(value)
+
+
+class Metric:
+    type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        REGISTRY.register(self)
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type}"]
+
+    def samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values = _Sharded()
+
+    def inc(self, *labels: str, amount: float = 1.0):
+        self._values.add(labels, amount)
+
+    def samples(self) -> List[str]:
+        return [
+            f"{self.name}{_labels(self.labelnames, labels)} {_number(value)}"
+            for labels, value in sorted(self._values.merged().items())
+        ]
+
+
+class Histogram(Metric):
+    type = "histogram"
+
+    def __init__(self, *args, buckets: Sequence[float] = DEFAULT_BUCKETS, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.buckets = tuple(sorted(buckets))
+        self._values = _Sharded()
+
+    def observe(self, *labels: str, value: float):
+        shard = self._values._shard()
+        index = bisect.bisect_left(self.buckets, value)
+        key = (labels, index)
+        shard[key] = shard.get(key, 0) + 1
+        key = (labels, "sum")
+        shard[key] = shard.get(key, 0) + value
+
+    def samples(self) -> List[str]:
+        merged = self._values.merged()
+        series: Dict[LabelValues, Dict] = {}
+        for (labels, slot), value in merged.items():
+            series.setdefault(labels, {})[slot] = value
+
+        lines = []
+        for labels in sorted(series):
+            slots = series[labels]
+            cumulative = 0
+            for i, bound in enumerate(self.buckets + (float("inf"),)):
+                cumulative += slots.get(i, 0)
+                le = 'le="' + _number(bound) + '"'
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, labels, le)} {_number(cumulative)}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, labels)} {_number(slots.get('sum', 0))}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, labels)} {_number(cumulative)}")
+        return lines
+
+
+class Gauge(Metric):
+    """
+    Either set from one thread (the event loop) or computed at scrape time
+    via a callback returning {label_values: value}.
+    """
+    type = "gauge"
+
+    def __init__(self, *args, collect: Optional[Callable[[], Dict[LabelValues, float]]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: Dict[LabelValues, float] = {}
+        self._collect = collect
+
+    def inc(self, *labels: str, amount: float = 1.0):
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def dec(self, *labels: str, amount: float = 1.0):
+        self.inc(*labels, amount=-amount)
+
+    def set_function(self, collect: Callable[[], Dict[LabelValues, float]]):
+        self._collect = collect
+
+    def samples(self) -> List[str]:
+        values = dict(self._values)
+        if self._collect is not None:
+            try:
+                values.update(self._collect())
+            except Exception as e:
+                logger.warning("Metric collect error (%s): %s", self.name, e)
+        return [
+            f"{self.name}{_labels(self.labelnames, labels)} {_number(value)}"
+            for labels, value in sorted(values.items())
+        ]
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: List[Metric] = []
+
+    def register(self, metric: Metric):
+        self._metrics.append(metric)
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.header())
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+# ✅ HTTP
+HTTP_REQUESTS = Counter(
+    "carering_http_requests_total", "HTTP requests by route template and status.", ["method", "route", "status"])
+HTTP_LATENCY = Histogram(
+    "carering_http_request_duration_seconds", "HTTP request latency by route template.", ["method", "route"])
+HTTP_IN_FLIGHT = Gauge(
+    "carering_http_requests_in_flight", "HTTP requests currently being served.", ["method"])
+
+# ✅ DB (요청별 집계는 app/utils/query_stats.py에서 기록)
+DB_QUERIES = Counter(
+    "carering_db_queries_total", "SQL statements executed, by route template.", ["method", "route"])
+DB_TIME = Counter(
+    "carering_db_time_seconds_total", "Time spent in SQL statements, by route template.", ["method", "route"])
+DB_N_PLUS_ONE = Counter(
+    "carering_db_n_plus_one_total", "Requests with a repeated statement shape (suspected N+1).", ["method", "route"])
+DB_POOL = Gauge(
+    "carering_db_pool_connections", "SQLAlchemy pool connections by state.", ["state"])
+
+# ✅ Redis
+REDIS_PUBLISH_LATENCY = Histogram(
+    "carering_redis_publish_duration_seconds", "Redis PUBLISH latency by channel.", ["channel"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0))
+
+# ✅ 응답 캐시 (app/utils/response_cache.py)
+RESPONSE_CACHE = Counter(
+    "carering_response_cache_total", "Cached GET lookups by route and result (hit/wait/miss/bypass).",
+    ["route", "result"])
+
+# ✅ 실시간 연결
+WEBSOCKET_CONNECTIONS = Gauge(
+    "carering_websocket_connections", "Open realtime connections on this worker by transport and room.",
+    ["transport", "room"])
+
+
+class MetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = {"code": 500}
+
+        async def send_with_status(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        HTTP_IN_FLIGHT.inc(method)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - start
+            HTTP_IN_FLIGHT.dec(method)
+            route = getattr(scope.get("route"), "path", None) or "unmatched"
+            HTTP_REQUESTS.inc(method, route, str(status["code"]))
+            HTTP_LATENCY.observe(method, route, value=elapsed)
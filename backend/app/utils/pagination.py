@@ -0,0 +1,24 @@
+# app/utils/pagination.py
+# ✅ 키셋(커서) 페이지네이션용 커서 인코딩
+#
+# 커서는 마지막으로 받은 행의 (created_at, id)를 URL-safe base64로 감싼 문자열이다.
+# OFFSET 없이 인덱스 (…, created_at, id) 를 이어서 읽으므로 페이지 위치와 관계없이 비용이 일정하다.
+
+import base64
+from datetime import datetime
+from typing import Optional, Tuple
+
+from fastapi import HTTPException
+
+
+def encode_cursor(created_at: Optional[datetime], row_id: int) -> str:
+    stamp = created_at.isoformat() if created_at else ""
+    return base64.urlsafe_b64encode(f"{stamp}|{row_id}".encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[Optional[datetime], int]:
+    try:
+        stamp, row_id = base64.urlsafe_b64decode(cursor.encode()).decode().rsplit("|", 1)
+        return (datetime.fromisoformat(stamp) if stamp else None), int(row_id)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
@@ -0,0 +1,163 @@
+# app/utils/profile_cache.py
+# ✅ 프로필 꾸미기 / 위젯 레이아웃 조회용 읽기 캐시 (user_id + 버전 키)
+#
+# - {ns}:ver:{user_id}      → 현재 버전 번호 (쓰기 때마다 더 큰 버전으로만 갱신)
+# - {ns}:{user_id}:v{ver}  → 그 버전의 직렬화된 JSON 본문
+# 버전 포인터만 읽으면 ETag를 알 수 있으므로, If-None-Match가 맞으면 DB 없이 304.
+# 본문 키에 버전이 들어가므로 오래된 본문이 새 버전으로 잘못 나가는 일은 없다.
+# Redis 장애 시에는 DB에서 바로 응답한다.
+# 쓰기 후 포인터를 못 옮기면 포인터를 지우고, 그것도 실패하면 이 워커가 기억해 두었다가
+# Redis가 돌아오는 대로 지운다 (그동안 이 워커는 해당 키를 캐시 없이 응답) → 오래된 304 대신 미스.
+
+import logging
+import threading
+from typing import Any, Callable, Optional, Set, Tuple
+
+import orjson
+from fastapi.responses import Response
+from redis.exceptions import RedisError
+
+from app.utils.etag import make_etag, matches
+from app.utils.fast_json import ORJSON_OPTIONS
+from app.utils.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+CACHE_TTL = 24 * 3600   # 방문이 없는 프로필은 하루 뒤 캐시에서 제거
+FILL_POINTER_TTL = 300  # 읽기가 채운 포인터는 짧게 (쓰기와 경합해 옛 버전을 가리켜도 곧 사라짐)
+
+# 포인터는 앞으로만 옮긴다: 커밋 순서와 bump 도착 순서가 달라도 v3 뒤에 v2로 돌아가지 않음
+_BUMP_LUA = """
+local current = tonumber(redis.call('GET', KEYS[1]))
+if current and current >= tonumber(ARGV[1]) then
+    return 0
+end
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+return 1
+"""
+_bump_script = None
+
+# 무효화하지 못한 버전 포인터 키 (워커별)
+_pending_deletes: Set[str] = set()
+_pending_lock = threading.Lock()
+
+
+def _version_key(namespace: str, user_id: int) -> str:
+    return f"{namespace}:ver:{user_id}"
+
+
+def _body_key(namespace: str, user_id: int, version: int) -> str:
+    return f"{namespace}:{user_id}:v{version}"
+
+
+def content_etag(namespace: str, user_id: int, version: int) -> str:
+    return make_etag(namespace, user_id, f"v{version}")
+
+
+def _respond(body: bytes, etag: str, if_none_match: Optional[str]) -> Response:
+    if matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+
+def _flush_pending() -> bool:
+    # 밀린 포인터 삭제를 먼저 처리. 아직 못 지웠으면 False
+    if not _pending_deletes:
+        return True
+    with _pending_lock:
+        keys = list(_pending_deletes)
+    try:
+        get_redis().delete(*keys)
+    except RedisError as e:
+        logger.warning("Profile cache invalidate retry error: %s", e)
+        return False
+    with _pending_lock:
+        _pending_deletes.difference_update(keys)
+    return True
+
+
+def _usable(namespace: str, user_id: int) -> bool:
+    return _flush_pending() or _version_key(namespace, user_id) not in _pending_deletes
+
+
+def read_through(namespace: str, user_id: int, load: Callable[[], Tuple[int, Any]]) -> Tuple[int, bytes]:
+    """
+    Returns (version, serialized JSON body). `load()` returns (version, content)
+    from the database and is only called when the current version is not cached.
+    """
+    if not _usable(namespace, user_id):
+        version, content = load()
+        return version, orjson.dumps(content, option=ORJSON_OPTIONS)
+
+    try:
+        cached_version = get_redis().get(_version_key(namespace, user_id))
+        if cached_version is not None:
+            version = int(cached_version)
+            body = get_redis().get(_body_key(namespace, user_id, version))
+            if body is not None:
+                return version, body.encode()
+    except RedisError as e:
+        logger.warning("Profile cache read error: %s", e)
+
+    version, content = load()
+    body = orjson.dumps(content, option=ORJSON_OPTIONS)
+    try:
+        pipe = get_redis().pipeline()
+        pipe.set(_body_key(namespace, user_id, version), body, ex=CACHE_TTL)
+        # nx: 그 사이 쓰기가 더 새 버전을 기록했다면 덮어쓰지 않음
+        pipe.set(_version_key(namespace, user_id), version, ex=FILL_POINTER_TTL, nx=True)
+        pipe.execute()
+    except RedisError as e:
+        logger.warning("Profile cache write error: %s", e)
+    return version, body
+
+
+def cached_read(
+    namespace: str,
+    user_id: int,
+    if_none_match: Optional[str],
+    load: Callable[[], Tuple[int, Any]],
+) -> Response:
+    """
+    Read-through GET with ETag handling. A matching If-None-Match is answered
+    from the version pointer alone.
+    """
+    if if_none_match and _usable(namespace, user_id):
+        try:
+            cached_version = get_redis().get(_version_key(namespace, user_id))
+            if cached_version is not None:
+                etag = content_etag(namespace, user_id, int(cached_version))
+                if matches(if_none_match, etag):
+                    return Response(status_code=304, headers={"ETag": etag})
+        except RedisError as e:
+            logger.warning("Profile cache read error: %s", e)
+
+    version, body = read_through(namespace, user_id, load)
+    return _respond(body, content_etag(namespace, user_id, version), if_none_match)
+
+
+def _script():
+    # 스크립트 객체도 클라이언트처럼 처음 사용할 때 등록
+    global _bump_script
+    if _bump_script is None:
+        _bump_script = get_redis().register_script(_BUMP_LUA)
+    return _bump_script
+
+
+def bump_version(namespace: str, user_id: int, version: int):
+    # 커밋 직후 호출: 포인터를 새 버전으로 옮기면 이전 본문은 TTL로 사라진다
+    key = _version_key(namespace, user_id)
+    for attempt in range(2):
+        try:
+            _script()(keys=[key], args=[version, CACHE_TTL])
+            return
+        except RedisError as e:
+            logger.warning("Profile cache invalidate error (attempt %d): %s", attempt + 1, e)
+
+    # 포인터를 못 옮기면 지워서 다음 읽기가 DB로 가게 함
+    try:
+        get_redis().delete(key)
+    except RedisError as e:
+        logger.warning("Profile cache pointer delete failed, retrying later: %s", e)
+        with _pending_lock:
+            _pending_deletes.add(key)
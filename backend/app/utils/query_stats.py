@@ -0,0 +1,197 @@
+# app/utils/query_stats.py
+# ✅ 요청별 SQL 실행 횟수 / DB 시간 집계 + N+1 감지 + 쿼리 예산
+#
+# - 엔진의 before/after_cursor_execute 이벤트에서 현재 요청의 QueryStats에 기록한다.
+#   (동기 라우트는 스레드풀에서 돌지만 ContextVar가 복사되므로 같은 객체에 쌓인다)
+# - 같은 SQL 모양(파라미터 자리표시자 그대로의 문장)이 N_PLUS_ONE_THRESHOLD번 이상 나오면 N+1로 표시.
+# - 개발(settings.sql_stats_headers)에서는 X-DB-Queries / X-DB-Time-Ms / X-DB-N-Plus-One 응답 헤더,
+#   운영에서는 라우트별 누적값을 route_query_stats.snapshot()으로 노출 (/realtime/metrics).
+# - query_budget(n): 블록 안의 쿼리가 n개를 넘으면 QueryBudgetExceeded.
+
+import logging
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import settings
+from app.utils.metrics import DB_N_PLUS_ONE, DB_QUERIES, DB_TIME
+
+logger = logging.getLogger(__name__)
+
+N_PLUS_ONE_THRESHOLD = settings.n_plus_one_threshold
+
+
+class QueryStats:
+    __slots__ = ("count", "total_ms", "shapes", "parent", "scope")
+
+    def __init__(self, parent: Optional["QueryStats"] = None):
+        self.count = 0
+        self.total_ms = 0.0
+        self.shapes: Counter = Counter()
+        self.parent = parent   # /batch 하위 요청 등 중첩 측정은 바깥에도 합산
+        self.scope: Optional[dict] = None   # 미들웨어가 설정 (라우트 이름 확인용)
+
+    def record(self, statement: str, elapsed_ms: float):
+        stats = self
+        while stats is not None:
+            stats.count += 1
+            stats.total_ms += elapsed_ms
+            stats.shapes[statement] += 1
+            stats = stats.parent
+
+    def repeated(self, threshold: int = N_PLUS_ONE_THRESHOLD) -> List[Tuple[str, int]]:
+        return [(shape, n) for shape, n in self.shapes.most_common() if n >= threshold]
+
+
+_current: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+@contextmanager
+def track_queries():
+    stats = QueryStats(parent=_current.get())
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+def current_route() -> Optional[str]:
+    """"GET /posts/{post_id}" for the request being served, if any."""
+    stats = _current.get()
+    while stats is not None:
+        if stats.scope is not None:
+            route = stats.scope.get("route")
+            return f"{stats.scope['method']} {getattr(route, 'path', None) or stats.scope['path']}"
+        stats = stats.parent
+    return None
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+@contextmanager
+def query_budget(max_queries: int):
+    """
+    Fails when the block runs more than max_queries statements.
+
+        with query_budget(5):
+            client.get("/posts")
+    """
+    with track_queries() as stats:
+        yield stats
+    if stats.count > max_queries:
+        top = "\n".join(f"  {n}x {shape[:200]}" for shape, n in stats.shapes.most_common(5))
+        raise QueryBudgetExceeded(f"{stats.count} queries (budget {max_queries})\n{top}")
+
+
+# ------------------------
+# 엔진 이벤트
+# ------------------------
+
+def _before_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current.get() is not None:
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    if stats is None:
+        return
+    starts = conn.info.get("query_start")
+    if not starts:
+        return
+    stats.record(statement, (time.perf_counter() - starts.pop()) * 1000)
+
+
+def instrument_engine(engine: Engine):
+    if not event.contains(engine, "before_cursor_execute", _before_execute):
+        event.listen(engine, "before_cursor_execute", _before_execute)
+        event.listen(engine, "after_cursor_execute", _after_execute)
+
+
+# ------------------------
+# 라우트별 누적 (운영 지표)
+# ------------------------
+
+class RouteQueryStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._routes: Dict[str, Dict[str, float]] = {}
+
+    def add(self, route: str, stats: QueryStats, n_plus_one: int):
+        with self._lock:
+            entry = self._routes.setdefault(route, {
+                "requests": 0, "queries": 0, "max_queries": 0, "db_ms": 0.0, "n_plus_one": 0,
+            })
+            entry["requests"] += 1
+            entry["queries"] += stats.count
+            entry["max_queries"] = max(entry["max_queries"], stats.count)
+            entry["db_ms"] += stats.total_ms
+            entry["n_plus_one"] += n_plus_one
+
+    def snapshot(self) -> Dict[str, dict]:
+        with self._lock:
+            return {
+                route: {
+                    **entry,
+                    "db_ms": round(entry["db_ms"], 2),
+                    "avg_queries": round(entry["queries"] / entry["requests"], 2),
+                }
+                for route, entry in self._routes.items()
+            }
+
+
+route_query_stats = RouteQueryStats()
+
+
+# ------------------------
+# ASGI 미들웨어
+# ------------------------
+
+class QueryStatsMiddleware:
+    def __init__(self, app, headers: bool = False):
+        self.app = app
+        self.headers = headers
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+            stats.scope = scope
+
+            async def send_with_stats(message):
+                if message["type"] == "http.response.start" and self.headers:
+                    headers = list(message.get("headers", []))
+                    headers.append((b"x-db-queries", str(stats.count).encode()))
+                    headers.append((b"x-db-time-ms", f"{stats.total_ms:.1f}".encode()))
+                    repeated = stats.repeated()
+                    if repeated:
+                        headers.append((b"x-db-n-plus-one", str(len(repeated)).encode()))
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            await self.app(scope, receive, send_with_stats)
+
+        # 라우터가 매칭한 경로 템플릿 (/posts/{post_id}) 기준으로 집계
+        route = scope.get("route")
+        path = getattr(route, "path", None) or "unmatched"
+        repeated = stats.repeated()
+        if repeated:
+            shape, n = repeated[0]
+            logger.warning("N+1 suspected on %s %s: %dx %s", scope["method"], path, n, shape[:200],
+                           extra={"route": path, "queries": stats.count})
+        route_query_stats.add(f"{scope['method']} {path}", stats, len(repeated))
+        DB_QUERIES.inc(scope["method"], path, amount=stats.count)
+        DB_TIME.inc(scope["method"], path, amount=stats.total_ms / 1000)
+        if repeated:
+            DB_N_PLUS_ONE.inc(scope["method"], path)
@@ -0,0 +1,141 @@
+# app/utils/read_receipts.py
+# ✅ 대화별 읽음 위치(high-water mark) 관리
+#
+# 메시지마다 is_read를 갱신하는 대신, (읽은 사람, 상대방) 쌍마다
+# last_read_message_id 하나만 단조 증가시키며 저장한다.
+# 안 읽은 개수는 id > last_read_message_id 인 메시지 수로 계산한다.
+# (이 방식 도입 전에 is_read=True로 처리된 메시지는 계속 읽은 것으로 취급)
+# is_read 컬럼을 보는 다른 곳(응답, Go 서버)을 위해 위치가 앞으로 갈 때
+# 새로 읽은 구간 (이전 위치, 새 위치]만 UPDATE 한 번으로 맞춰 둔다.
+
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import and_, func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.conversation_read import ConversationRead
+from app.models.message import Message
+
+
+def get_read_marker(db: Session, user_id: int, peer_id: int) -> int:
+    marker = db.query(ConversationRead.last_read_message_id).filter(
+        ConversationRead.user_id == user_id,
+        ConversationRead.peer_id == peer_id
+    ).scalar()
+    return marker or 0
+
+
+def _upsert_marker(db: Session, user_id: int, peer_id: int, message_id: int):
+    # 한 번의 쓰기로 "더 클 때만 갱신" (동시 요청이 와도 값이 뒤로 가지 않음)
+    values = {"user_id": user_id, "peer_id": peer_id, "last_read_message_id": message_id}
+    dialect = db.get_bind().dialect.name
+
+    if dialect == "mysql":
+        from sqlalchemy.dialects.mysql import insert
+        stmt = insert(ConversationRead).values(**values)
+        stmt = stmt.on_duplicate_key_update(
+            last_read_message_id=func.greatest(
+                ConversationRead.last_read_message_id, stmt.inserted.last_read_message_id
+            ),
+            updated_at=func.now(),
+        )
+    elif dialect in ("postgresql", "sqlite"):
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+            greatest = func.greatest
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+            greatest = func.max  # SQLite의 다중 인자 max()
+        stmt = insert(ConversationRead).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id", "peer_id"],
+            set_={
+                "last_read_message_id": greatest(
+                    ConversationRead.last_read_message_id, stmt.excluded.last_read_message_id
+                ),
+                "updated_at": func.now(),
+            },
+        )
+    else:
+        _upsert_marker_locked(db, user_id, peer_id, message_id)
+        return
+
+    db.execute(stmt)
+
+
+def _upsert_marker_locked(db: Session, user_id: int, peer_id: int, message_id: int):
+    # 그 밖의 DB: 행을 잠그고 읽은 뒤 UPDATE, 없으면 INSERT (동시에 INSERT 되면 다시 잠그고 UPDATE)
+    def locked_row():
+        return db.query(ConversationRead).filter(
+            ConversationRead.user_id == user_id,
+            ConversationRead.peer_id == peer_id
+        ).with_for_update().first()
+
+    row = locked_row()
+    if row is None:
+        try:
+            with db.begin_nested():
+                db.add(ConversationRead(user_id=user_id, peer_id=peer_id, last_read_message_id=message_id))
+            return
+        except IntegrityError:
+            row = locked_row()
+
+    if row.last_read_message_id < message_id:
+        row.last_read_message_id = message_id
+        row.updated_at = datetime.utcnow()
+        db.flush()
+
+
+def advance_read_marker(
+    db: Session, user_id: int, peer_id: int, up_to_message_id: Optional[int] = None
+) -> Tuple[bool, int]:
+    """
+    Moves the reader's high-water mark for a conversation forward.
+    up_to_message_id=None marks everything received so far as read.
+    Returns (advanced, marker).
+    """
+    # 클라이언트가 보낸 id는 실제로 받은 마지막 메시지 id로 보정
+    query = db.query(func.max(Message.id)).filter(
+        Message.sender_id == peer_id,
+        Message.receiver_id == user_id
+    )
+    if up_to_message_id is not None:
+        query = query.filter(Message.id <= up_to_message_id)
+    target = query.scalar() or 0
+
+    current = get_read_marker(db, user_id, peer_id)
+    if target <= current:
+        return False, current
+
+    _upsert_marker(db, user_id, peer_id, target)
+    db.query(Message).filter(
+        Message.receiver_id == user_id,
+        Message.sender_id == peer_id,
+        Message.is_read == False,
+        Message.id > current,
+        Message.id <= target
+    ).update({Message.is_read: True}, synchronize_session=False)
+    db.commit()
+    return True, target
+
+
+def unread_counts(db: Session, user_id: int, peer_ids: Optional[Iterable[int]] = None) -> Dict[int, int]:
+    """
+    Unread message counts per sender for the given receiver, in one grouped query.
+    """
+    query = db.query(Message.sender_id, func.count(Message.id)).outerjoin(
+        ConversationRead,
+        and_(
+            ConversationRead.user_id == Message.receiver_id,
+            ConversationRead.peer_id == Message.sender_id
+        )
+    ).filter(
+        Message.receiver_id == user_id,
+        Message.id > func.coalesce(ConversationRead.last_read_message_id, 0),
+        Message.is_read == False
+    )
+    if peer_ids is not None:
+        query = query.filter(Message.sender_id.in_(list(peer_ids)))
+    return dict(query.group_by(Message.sender_id).all())
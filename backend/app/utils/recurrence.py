@@ -0,0 +1,63 @@
+# app/utils/recurrence.py
+# ✅ 복용 계획(반복 규칙) → 실제 복용 시각 펼치기
+#
+# 요청된 날짜 범위 [start, end) 안의 발생만 그때그때 계산한다.
+# - daily: 매일 (interval 1과 같음)
+# - interval: start_date부터 N일마다 — 범위 시작 전 날짜는 나눗셈으로 건너뜀
+# - weekly: 지정한 요일 (0=월 ~ 6=일)
+# 여러 계획의 발생은 heapq.merge로 (날짜, 시각) 순으로 합쳐 제너레이터로 돌려준다.
+
+import heapq
+from datetime import date, datetime, time, timedelta
+from typing import Iterable, Iterator, List, Tuple
+
+from app.models.medication_plan import MedicationPlan
+
+FREQUENCIES = ("daily", "weekly", "interval")
+
+Occurrence = Tuple[date, time, MedicationPlan]
+
+
+def parse_times(values: Iterable[str]) -> List[time]:
+    return sorted({datetime.strptime(v, "%H:%M").time() for v in values})
+
+
+def occurrence_dates(plan: MedicationPlan, start: date, end: date) -> Iterator[date]:
+    first = max(start, plan.start_date)
+    last = min(end, plan.end_date + timedelta(days=1)) if plan.end_date else end
+    if first >= last:
+        return
+
+    if plan.frequency == "weekly":
+        weekdays = set(plan.weekdays or [])
+        day = first
+        while day < last:
+            if day.weekday() in weekdays:
+                yield day
+            day += timedelta(days=1)
+        return
+
+    step = 1 if plan.frequency == "daily" else max(1, plan.interval_days or 1)
+    offset = (first - plan.start_date).days
+    day = first + timedelta(days=(-offset) % step)  # 범위 안의 첫 발생일로 바로 이동
+    while day < last:
+        yield day
+        day += timedelta(days=step)
+
+
+def plan_occurrences(plan: MedicationPlan, start: date, end: date) -> Iterator[Occurrence]:
+    times = parse_times(plan.times)
+    for day in occurrence_dates(plan, start, end):
+        for t in times:
+            yield day, t, plan
+
+
+def expand(plans: Iterable[MedicationPlan], start: date, end: date) -> Iterator[Occurrence]:
+    """
+    Lazily yields (date, time, plan) for every dose of the given plans in
+    [start, end), ordered by date and time.
+    """
+    return heapq.merge(
+        *(plan_occurrences(plan, start, end) for plan in plans),
+        key=lambda occ: (occ[0], occ[1], occ[2].id),
+    )
@@ -1,6 +1,57 @@
-from redis import Redis
+import time
+from typing import Optional
 
-redis_client = Redis(host="localhost", port=6379, decode_responses=True)
+import redis
+import redis.asyncio as aioredis
+
+from app.config import settings
+from app.utils.metrics import REDIS_PUBLISH_LATENCY
+
+# ✅ 클라이언트는 처음 사용할 때 생성 (import 시점에는 아무 연결도 만들지 않음)
+_client: Optional[redis.Redis] = None
+_async_client: Optional[aioredis.Redis] = None
+
+# ✅ 동기 코드(라우트)용 Redis 클라이언트
+def get_redis() -> redis.Redis:
+    global _client
+    if _client is None:
+        _client = redis.from_url(settings.redis_url, decode_responses=True)
+    return _client
 
 def publish_to_redis(channel: str, message: str):
-    redis_client.publish(channel, message)
\ No newline at end of file
+    start = time.perf_counter()
+    try:
+        get_redis().publish(channel, message)
+    finally:
+        REDIS_PUBLISH_LATENCY.observe(channel, value=time.perf_counter() - start)
+
+# ✅ asyncio 코드용 Redis 클라이언트
+#    연결이 몰리면 기본 풀(100개)은 MaxConnectionsError를 내므로, 상한을 두고 빈 연결을 기다리는 풀을 쓴다
+def get_async_redis() -> aioredis.Redis:
+    global _async_client
+    if _async_client is None:
+        pool = aioredis.BlockingConnectionPool.from_url(
+            settings.redis_url,
+            decode_responses=True,
+            max_connections=settings.redis_max_connections,
+            timeout=settings.redis_pool_timeout,
+        )
+        _async_client = aioredis.Redis(connection_pool=pool)
+    return _async_client
+
+async def publish_to_redis_async(channel: str, message: str):
+    start = time.perf_counter()
+    try:
+        await get_async_redis().publish(channel, message)
+    finally:
+        REDIS_PUBLISH_LATENCY.observe(channel, value=time.perf_counter() - start)
+
+# ✅ lifespan 종료 시 연결 정리
+async def close_redis():
+    global _client, _async_client
+    if _async_client is not None:
+        await _async_client.aclose()
+        _async_client = None
+    if _client is not None:
+        _client.close()
+        _client = None
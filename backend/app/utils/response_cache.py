@@ -0,0 +1,164 @@
+# app/utils/response_cache.py
+# ✅ 공개 GET 응답 캐시 (Redis, TTL + 태그 무효화 + single-flight)
+#
+# - rc:gen:{tag}                   → 태그 세대 번호. invalidate(tag)가 INCR 한다.
+# - rc:body:{라우트}:{인자}:{세대}  → 직렬화된 JSON 본문 (TTL)
+#   본문 키에 태그 세대가 들어가므로 무효화는 INCR 한 번이고, 이전 본문은 TTL로 사라진다.
+#   (profile_cache의 버전 키와 같은 방식이라 무효화 직후 옛 본문이 나가는 일이 없다)
+# - rc:lock:{본문 키}              → 미스일 때 DB에서 만드는 요청을 하나로 (SET NX PX).
+#   잠금을 못 잡은 요청은 잠금이 풀리거나 본문이 생길 때까지 LOCK_WAIT 동안 기다리고, 그래도 없으면 직접 만든다.
+#
+#     @router.get("/users/{user_id}", response_model=UserResponse)
+#     @cached_response(ttl=300, tags=("user:{user_id}",), model=UserResponse)
+#     def get_user_by_id(user_id: int, db: Session = Depends(get_db)): ...
+#
+#   쓰기 라우트는 커밋한 뒤 invalidate(f"user:{user.id}")
+# 적중 시 get_db 세션 객체는 만들어지지만 쿼리를 하지 않으므로 DB 연결은 쓰지 않는다.
+# HTTPException(404 등)과 Response를 직접 돌려준 경우는 캐시하지 않는다.
+# Redis 장애 시에는 캐시 없이 라우트를 그대로 실행. 동기(def) 라우트 전용.
+
+import functools
+import logging
+import time
+from typing import Any, Callable, List, Optional, Sequence
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import Response
+from pydantic import TypeAdapter
+from redis.exceptions import RedisError
+
+from app.config import settings
+from app.utils.fast_json import ORJSON_OPTIONS
+from app.utils.metrics import RESPONSE_CACHE
+from app.utils.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+GEN_TTL = 7 * 24 * 3600   # 세대 번호 보존 기간 (본문 TTL보다 충분히 길어야 함)
+LOCK_TTL_MS = 5000        # 만드는 요청이 죽어도 이 시간 뒤에는 잠금이 풀림
+LOCK_WAIT = 1.0           # 다른 요청이 만드는 동안 기다리는 최대 시간(초)
+LOCK_POLL = 0.02
+
+_SCALARS = (int, float, str, bool)
+
+
+def _gen_key(tag: str) -> str:
+    return f"rc:gen:{tag}"
+
+
+def invalidate(*tags: str):
+    """Drops every cached response carrying one of the tags. Call after commit."""
+    if not tags:
+        return
+    try:
+        pipe = get_redis().pipeline(transaction=False)
+        for tag in tags:
+            pipe.incr(_gen_key(tag))
+            pipe.expire(_gen_key(tag), GEN_TTL)
+        pipe.execute()
+    except RedisError as e:
+        logger.warning("Response cache invalidate error: %s", e)
+
+
+def _body_key(r, name: str, kwargs: dict, tags: List[str]) -> str:
+    args = ",".join(f"{k}={v}" for k, v in sorted(kwargs.items()) if isinstance(v, _SCALARS))
+    generations = r.mget([_gen_key(tag) for tag in tags]) if tags else []
+    return f"rc:body:{name}:{args}:" + ".".join(g or "0" for g in generations)
+
+
+def _respond(body: bytes, status: str) -> Response:
+    return Response(content=body, media_type="application/json", headers={"X-Cache": status})
+
+
+def _serialize(result: Any, adapter: Optional[TypeAdapter]) -> bytes:
+    # response_model이 있으면 FastAPI와 같은 필드만 남도록 모델을 거쳐 직렬화
+    if adapter is not None:
+        return adapter.dump_json(adapter.validate_python(result, from_attributes=True))
+    return orjson.dumps(jsonable_encoder(result), option=ORJSON_OPTIONS)
+
+
+def cached_response(ttl: int, tags: Sequence[str] = (), model: Any = None, namespace: Optional[str] = None):
+    """
+    Caches a sync GET route's JSON body in Redis for `ttl` seconds.
+    `tags` are formatted with the route's arguments ("post:{post_id}").
+    """
+    if ttl * 2 > GEN_TTL:
+        raise ValueError("ttl must stay well below GEN_TTL")
+    adapter = TypeAdapter(model) if model is not None else None
+
+    def decorator(func: Callable):
+        name = namespace or f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not settings.response_cache:
+                return func(*args, **kwargs)
+
+            try:
+                r = get_redis()
+                key = _body_key(r, name, kwargs, [tag.format(**kwargs) for tag in tags])
+                body = r.get(key)
+            except RedisError as e:
+                logger.warning("Response cache read error: %s", e)
+                return func(*args, **kwargs)
+            if body is not None:
+                RESPONSE_CACHE.inc(name, "hit")
+                return _respond(body.encode(), "HIT")
+
+            return _fill(r, name, key, ttl, adapter, func, args, kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _fill(r, name: str, key: str, ttl: int, adapter, func, args, kwargs):
+    lock_key = f"rc:lock:{key}"
+    try:
+        owner = bool(r.set(lock_key, "1", nx=True, px=LOCK_TTL_MS))
+    except RedisError as e:
+        logger.warning("Response cache lock error: %s", e)
+        owner = False
+
+    if not owner:
+        body = _wait_for(r, key, lock_key)
+        if body is not None:
+            RESPONSE_CACHE.inc(name, "wait")
+            return _respond(body.encode(), "HIT")
+
+    try:
+        result = func(*args, **kwargs)
+        if isinstance(result, Response):
+            RESPONSE_CACHE.inc(name, "bypass")
+            return result
+        body = _serialize(result, adapter)
+        try:
+            r.set(key, body, ex=ttl)
+        except RedisError as e:
+            logger.warning("Response cache write error: %s", e)
+        RESPONSE_CACHE.inc(name, "miss")
+        return _respond(body, "MISS")
+    finally:
+        if owner:
+            try:
+                r.delete(lock_key)
+            except RedisError:
+                pass   # LOCK_TTL_MS 뒤에 스스로 풀림
+
+
+def _wait_for(r, key: str, lock_key: str) -> Optional[str]:
+    # 동기 라우트는 스레드풀에서 돌므로 짧게 sleep하며 기다려도 이벤트 루프를 막지 않는다
+    deadline = time.monotonic() + LOCK_WAIT
+    try:
+        while time.monotonic() < deadline:
+            time.sleep(LOCK_POLL)
+            pipe = r.pipeline(transaction=False)
+            pipe.get(key)
+            pipe.exists(lock_key)
+            body, locked = pipe.execute()
+            if body is not None or not locked:
+                return body   # 본문이 생겼거나, 만드는 쪽이 실패(예: 404)하고 잠금을 풀었음
+    except RedisError as e:
+        logger.warning("Response cache read error: %s", e)
+    return None
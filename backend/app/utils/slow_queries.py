@@ -0,0 +1,230 @@
+# app/utils/slow_queries.py
+# ✅ SQL 지문(fingerprint)별 실행 시간 통계 + 느린 쿼리 EXPLAIN 수집
+#
+# - 리터럴/바인드 자리표시자/IN 목록을 ?로 바꾼 문장을 지문으로 삼아 같은 모양끼리 묶는다.
+# - 지문마다 최근 ROLLING_WINDOW개의 실행 시간으로 p50/p95를, 전체 기간으로 count/total/max를 유지.
+# - settings.slow_query_ms를 넘은 SELECT는 지문당 한 번 EXPLAIN을 떠 둔다
+#   (요청을 막지 않도록 별도 스레드 + 별도 연결에서 같은 파라미터로 실행).
+# - 어느 라우트에서 나왔는지는 app/utils/query_stats.py의 요청 컨텍스트로 기록.
+# 보고서: GET /metrics/slow-queries, CLI: python -m scripts.slow_queries
+
+import functools
+import hashlib
+import logging
+import re
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Deque, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import settings
+from app.utils.query_stats import current_route
+
+logger = logging.getLogger(__name__)
+
+ROLLING_WINDOW = 500      # 백분위 계산에 쓰는 최근 실행 수 (지문별)
+MAX_FINGERPRINTS = 2000   # 지문 수 상한 (넘으면 새 지문은 세기만 하고 버림)
+MAX_ROUTES = 20           # 지문별로 기억하는 라우트 수
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%\(\w+\)s|%s|(?<!:):\w+|\?")
+_IN_LIST = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_VALUES_LIST = re.compile(r"\bVALUES\s*\(\s*\?(?:\s*,\s*\?)*\s*\)(?:\s*,\s*\(\s*\?(?:\s*,\s*\?)*\s*\))*", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+# SQLAlchemy는 컴파일된 문장 문자열을 재사용하므로 같은 원문이 반복된다 → 정규식 다섯 번을 원문당 한 번으로
+@functools.lru_cache(maxsize=MAX_FINGERPRINTS)
+def fingerprint(statement: str) -> str:
+    text = _STRING.sub("?", statement)
+    text = _PLACEHOLDER.sub("?", text)
+    text = _NUMBER.sub("?", text)
+    text = _IN_LIST.sub("IN (...)", text)
+    text = _VALUES_LIST.sub("VALUES (...)", text)
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def fingerprint_id(text: str) -> str:
+    return hashlib.md5(text.encode()).hexdigest()[:12]
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class _Entry:
+    __slots__ = ("id", "text", "count", "total_ms", "max_ms", "slow", "recent", "routes", "explain", "explained_at", "last_seen")
+
+    def __init__(self, text: str):
+        self.id = fingerprint_id(text)
+        self.text = text
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.slow = 0
+        self.recent: Deque[float] = deque(maxlen=ROLLING_WINDOW)
+        self.routes: Counter = Counter()
+        self.explain: Optional[str] = None
+        self.explained_at: Optional[datetime] = None
+        self.last_seen: Optional[datetime] = None
+
+    def report(self) -> dict:
+        recent = sorted(self.recent)
+        return {
+            "id": self.id,
+            "fingerprint": self.text,
+            "count": self.count,
+            "slow": self.slow,
+            "total_ms": round(self.total_ms, 2),
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "p50_ms": round(_percentile(recent, 0.50), 3),
+            "p95_ms": round(_percentile(recent, 0.95), 3),
+            "max_ms": round(self.max_ms, 3),
+            "routes": dict(self.routes.most_common(5)),
+            "explain": self.explain,
+            "explained_at": self.explained_at.isoformat() if self.explained_at else None,
+            "last_seen": self.last_seen.isoformat() if self.last_seen else None,
+        }
+
+
+class SlowQueryLog:
+    def __init__(self, threshold_ms: float, explain: bool = True):
+        self.threshold_ms = threshold_ms
+        self.explain_enabled = explain
+        self._entries: Dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+        self._engine: Optional[Engine] = None
+        self._explainer: Optional[ThreadPoolExecutor] = None
+        self._explaining = threading.local()
+        self.dropped = 0
+
+    # ------------------------
+    # 엔진 이벤트
+    # ------------------------
+
+    def install(self, engine: Engine):
+        if event.contains(engine, "before_cursor_execute", self._before_execute):
+            return
+        self._engine = engine
+        event.listen(engine, "before_cursor_execute", self._before_execute)
+        event.listen(engine, "after_cursor_execute", self._after_execute)
+
+    def _before_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("slowlog_start", []).append(time.perf_counter())
+
+    def _after_execute(self, conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get("slowlog_start")
+        if not starts:
+            return
+        elapsed_ms = (time.perf_counter() - starts.pop()) * 1000
+        if getattr(self._explaining, "active", False):
+            return
+        self.record(statement, elapsed_ms, parameters if not executemany else None)
+
+    # ------------------------
+    # 기록
+    # ------------------------
+
+    def record(self, statement: str, elapsed_ms: float, parameters=None):
+        text = fingerprint(statement)
+        route = current_route() or "background"
+        with self._lock:
+            entry = self._entries.get(text)
+            if entry is None:
+                if len(self._entries) >= MAX_FINGERPRINTS:
+                    self.dropped += 1
+                    return
+                entry = self._entries[text] = _Entry(text)
+            entry.count += 1
+            entry.total_ms += elapsed_ms
+            entry.max_ms = max(entry.max_ms, elapsed_ms)
+            entry.recent.append(elapsed_ms)
+            entry.last_seen = datetime.utcnow()
+            if route in entry.routes or len(entry.routes) < MAX_ROUTES:
+                entry.routes[route] += 1
+
+            slow = elapsed_ms >= self.threshold_ms
+            if slow:
+                entry.slow += 1
+            needs_explain = slow and entry.explain is None and self._can_explain(statement, parameters)
+            if needs_explain:
+                entry.explain = "pending"
+
+        if slow:
+            logger.warning("Slow query %.1fms [%s] %s", elapsed_ms, entry.id, text[:300],
+                           extra={"fingerprint_id": entry.id, "elapsed_ms": round(elapsed_ms, 2), "route": route})
+        if needs_explain:
+            self._submit_explain(entry, statement, parameters)
+
+    def _can_explain(self, statement: str, parameters) -> bool:
+        return (
+            self.explain_enabled
+            and self._engine is not None
+            and parameters is not None
+            and statement.lstrip()[:6].upper() == "SELECT"
+        )
+
+    def _submit_explain(self, entry: _Entry, statement: str, parameters):
+        # 여러 스레드가 동시에 첫 EXPLAIN을 내도 실행기는 하나만 만들어지도록 락 안에서 생성
+        with self._lock:
+            if self._explainer is None:
+                self._explainer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="slow-query-explain")
+            explainer = self._explainer
+        explainer.submit(self._capture_explain, entry, statement, parameters)
+
+    def _capture_explain(self, entry: _Entry, statement: str, parameters):
+        dialect = self._engine.dialect.name
+        prefix = "EXPLAIN QUERY PLAN " if dialect == "sqlite" else "EXPLAIN "
+        self._explaining.active = True
+        try:
+            with self._engine.connect() as conn:
+                result = conn.exec_driver_sql(prefix + statement, parameters)
+                columns = list(result.keys())
+                lines = [" | ".join(columns)] + [" | ".join(str(v) for v in row) for row in result]
+            plan = "\n".join(lines)
+        except Exception as e:
+            plan = f"EXPLAIN failed: {e}"
+        finally:
+            self._explaining.active = False
+        with self._lock:
+            entry.explain = plan
+            entry.explained_at = datetime.utcnow()
+
+    # ------------------------
+    # 보고서
+    # ------------------------
+
+    def report(self, limit: int = 20, sort: str = "total_ms") -> dict:
+        with self._lock:
+            entries = [entry.report() for entry in self._entries.values()]
+        entries.sort(key=lambda e: e.get(sort, 0), reverse=True)
+        return {
+            "threshold_ms": self.threshold_ms,
+            "fingerprints": len(entries),
+            "dropped": self.dropped,
+            "top": entries[:limit],
+        }
+
+    def reset(self):
+        with self._lock:
+            self._entries.clear()
+            self.dropped = 0
+
+    def shutdown(self):
+        with self._lock:
+            explainer, self._explainer = self._explainer, None
+        if explainer is not None:
+            explainer.shutdown(wait=False, cancel_futures=True)
+
+
+# ✅ 워커당 하나
+slow_query_log = SlowQueryLog(settings.slow_query_ms, explain=settings.slow_query_explain)
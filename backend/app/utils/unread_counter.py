@@ -0,0 +1,97 @@
+# app/utils/unread_counter.py
+# ✅ 사용자별 안 읽은 메시지 수 (메시지 탭 배지용)
+#
+# Redis 해시 unread:{user_id} 에 상대별 안 읽은 개수를 유지한다.
+# - send_message: 받는 사람 해시의 보낸 사람 필드 +1
+# - 읽음 처리: 해당 상대 필드를 남은 개수로 덮어씀
+# - 해시가 없으면(최초 조회, 만료, 대화 삭제 후) DB에서 한 번의 그룹 쿼리로 재구성
+# 배지 조회는 해시 합계만 읽으므로 받은 편지함을 스캔하지 않는다.
+
+import json
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from app.utils.redis import get_redis, publish_to_redis
+from app.utils.read_receipts import unread_counts
+
+UNREAD_TTL = 7 * 24 * 3600   # 주기적으로 DB 기준으로 다시 맞추도록 만료 시간 설정
+_INIT_FIELD = "_init"        # 재구성된 해시 표시 (안 읽은 메시지가 0개여도 키 유지)
+
+# 해시가 이미 있을 때만 갱신하고 합계를 반환 (없으면 nil → 호출 측에서 재구성)
+_UPDATE_LUA = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return false
+end
+if ARGV[1] == 'incr' then
+    redis.call('HINCRBY', KEYS[1], ARGV[2], ARGV[3])
+else
+    redis.call('HSET', KEYS[1], ARGV[2], ARGV[3])
+end
+local total = 0
+local vals = redis.call('HVALS', KEYS[1])
+for i = 1, #vals do
+    total = total + tonumber(vals[i])
+end
+return total
+"""
+_update_script = None
+
+
+def _script():
+    # 스크립트 객체도 클라이언트처럼 처음 사용할 때 등록
+    global _update_script
+    if _update_script is None:
+        _update_script = get_redis().register_script(_UPDATE_LUA)
+    return _update_script
+
+
+def _key(user_id: int) -> str:
+    return f"unread:{user_id}"
+
+
+def rebuild(db: Session, user_id: int) -> int:
+    counts = unread_counts(db, user_id)
+    mapping = {str(peer_id): count for peer_id, count in counts.items()}
+    mapping[_INIT_FIELD] = 0
+    pipe = get_redis().pipeline()
+    pipe.delete(_key(user_id))
+    pipe.hset(_key(user_id), mapping=mapping)
+    pipe.expire(_key(user_id), UNREAD_TTL)
+    pipe.execute()
+    return sum(counts.values())
+
+
+def get_total(db: Session, user_id: int) -> int:
+    values = get_redis().hvals(_key(user_id))
+    if not values:
+        return rebuild(db, user_id)
+    return sum(int(v) for v in values)
+
+
+def _update(db: Session, user_id: int, op: str, peer_id: int, value: int) -> int:
+    total: Optional[int] = _script()(keys=[_key(user_id)], args=[op, str(peer_id), value])
+    if total is None:
+        return rebuild(db, user_id)
+    return int(total)
+
+
+def increment(db: Session, receiver_id: int, sender_id: int) -> int:
+    return _update(db, receiver_id, "incr", sender_id, 1)
+
+
+def set_for_peer(db: Session, user_id: int, peer_id: int, count: int) -> int:
+    return _update(db, user_id, "set", peer_id, count)
+
+
+def invalidate(user_id: int):
+    get_redis().delete(_key(user_id))
+
+
+# ✅ 배지 변경을 사용자의 모든 디바이스로 푸시
+def push_total(user_id: int, total: int):
+    publish_to_redis("chat_channel", json.dumps({
+        "type": "unread_count",
+        "room": f"user_{user_id}",
+        "unread_count": total,
+    }))
@@ -5,38 +5,64 @@ from app.dependencies import get_token
 
 from fastapi.routing import APIRouter
 import json
+import logging
 
-# from app.sockets import sio as socketio # Removed Socket.IO import
+from redis.exceptions import RedisError
+
+from app import presence
+from app.typing_indicator import typing_tracker
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
-user_socket = {}  # ✅ 사용자별 연결 저장
+
+
+# presence 기록 실패로 /ws 연결을 끊지 않음: 이 워커로의 전달은 Redis 없이도 동작한다
+async def _register(user_id: int, websocket: WebSocket, conn_id):
+    try:
+        return await presence.register(user_id, websocket, conn_id)
+    except RedisError as e:
+        logger.warning("Presence register failed, delivering locally only: %s", e, extra={"user_id": user_id})
+        return presence.register_local(user_id, websocket, conn_id)
+
+
+async def _unregister(user_id: int, conn_id: str):
+    try:
+        await presence.unregister(user_id, conn_id)  # local 레지스트리는 Redis보다 먼저 정리됨
+    except RedisError as e:
+        logger.warning("Presence unregister failed: %s", e, extra={"user_id": user_id})
+
 
 @router.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     await websocket.accept()
     
     user_id = None
+    conn_id = None
     try:
         while True:
             data = await websocket.receive_text()
             message = json.loads(data)
 
             if message["type"] == "join":
-                # The Go server is now handling room registration directly based on the initial join message.
-                # If this Python backend still needs to manage user-specific WebSocket connections,
-                # this logic can remain, but it's separate from the post broadcasting.
-                user_id = message.get("userId") # Use .get() for safer access
-                if user_id:
-                    user_socket[user_id] = websocket
-                    print(f"✅ 유저 {user_id} 연결됨 (Python WS)")
+                # ✅ 사용자별 연결을 presence 레지스트리에 등록 (여러 디바이스 동시 접속 가능)
+                joined_id = message.get("userId") # Use .get() for safer access
+                if joined_id:
+                    if user_id and conn_id and int(joined_id) != user_id:
+                        await _unregister(user_id, conn_id)
+                    user_id = int(joined_id)
+                    conn_id = await _register(user_id, websocket, conn_id)
+                    logger.info("WS connected", extra={"user_id": user_id, "conn_id": conn_id})
 
             elif message["type"] == "typing":
-                receiver_id = message["receiverId"]
-                if receiver_id in user_socket:
-                    await user_socket[receiver_id].send_text(json.dumps({
-                        "type": "typing",
-                        "senderId": user_id # Ensure sender_id is passed
-                    }))
+                # ✅ 수신자가 온라인일 때만 상태 변화(started/stopped)를 chat_channel로 publish
+                #    → 각 워커의 브릿지가 수신자의 모든 연결(웹소켓/Socket.IO)에 전달
+                #    접속 확인은 추적기가 started를 보내기 직전에만 함 (키 입력마다 Redis 조회 X)
+                receiver_id = int(message["receiverId"])
+                if user_id and message.get("state") == "stopped":
+                    await typing_tracker.stop(user_id, receiver_id)
+                elif user_id:
+                    await typing_tracker.typing(user_id, receiver_id, is_online=presence.is_online)
             elif message["type"] == "message":
                 # 메시지 처리 로직 - assuming this is for direct chat messages
                 pass
@@ -52,10 +78,10 @@ async def websocket_endpoint(websocket: WebSocket):
             # Therefore, we remove the `handle_new_post` etc. that were tied to Socket.IO.
             
     except Exception as e:
-        print("❌ WebSocket error (Python):", e)
+        logger.warning("WebSocket error (Python): %r", e)
     finally:
-        if user_id and user_id in user_socket:
-            del user_socket[user_id]
-            print(f"🔌 유저 {user_id} 연결 해제됨 (Python WS)")
+        if user_id and conn_id:
+            await _unregister(user_id, conn_id)
+            logger.info("WS disconnected", extra={"user_id": user_id, "conn_id": conn_id})
 
-# Removed @socketio.on("new_post") as Socket.IO is no longer used for post broadcasting
\ No newline at end of file
+# Removed @socketio.on("new_post") as Socket.IO is no longer used for post broadcasting
@@ -0,0 +1,217 @@
+# benchmarks/api_bench.py
+# ✅ 주요 조회 API 부하 벤치마크 (처리량 / p50 / p95 / p99, 결과는 JSON)
+#
+# - 기본: SQLite 파일 DB + fakeredis로 app.main을 프로세스 안에서 실행 (httpx ASGITransport, lifespan 포함)
+# - --database-url로 로컬 MySQL 컨테이너, --redis-url로 로컬 Redis 사용 가능
+# - --base-url을 주면 이미 떠 있는 서버(uvicorn)로 요청 (시딩은 --database-url DB에)
+# - 데이터는 benchmarks/datagen.py로 생성 (--users로 규모 조절, 1k 사용자 ≈ 8만 행, 100k ≈ 800만 행)
+#
+# 실행: cd backend && pip install -r benchmarks/requirements.txt
+#       python -m benchmarks.api_bench [--users 1000] [--requests 300] [--concurrency 16] [--output result.json]
+# 커밋 간 비교: 같은 옵션으로 돌린 JSON 두 개의 endpoints.*.p99_ms / rps를 비교.
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+from benchmarks.datagen import DEFAULT_SEED, create_schema, generate
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="API hot endpoint benchmark")
+    parser.add_argument("--users", type=int, default=1000, help="seeded users (other tables scale with it)")
+    parser.add_argument("--requests", type=int, default=300, help="measured requests per endpoint")
+    parser.add_argument("--warmup", type=int, default=20, help="unmeasured requests per endpoint")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--endpoints", default="", help="comma separated subset, e.g. posts,search")
+    parser.add_argument("--database-url", default=None, help="default: a fresh SQLite file in a temp dir")
+    parser.add_argument("--redis-url", default=None, help="default: in-process fakeredis")
+    parser.add_argument("--base-url", default=None, help="benchmark a running server instead of in-process")
+    parser.add_argument("--no-seed", action="store_true", help="reuse data already in --database-url")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--output", default=None, help="write the JSON result here as well as stdout")
+    return parser.parse_args()
+
+
+def configure_environment(args):
+    """Must run before anything imports app.config."""
+    if args.database_url is None:
+        args.database_url = "sqlite:///" + os.path.join(tempfile.mkdtemp(prefix="carering-bench-"), "bench.db")
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ.setdefault("LOG_LEVEL", "ERROR")   # 결과 JSON과 섞이지 않도록
+    if args.redis_url:
+        os.environ["REDIS_URL"] = args.redis_url
+    else:
+        use_fake_redis()
+
+
+def use_fake_redis():
+    import fakeredis
+    import redis
+    import redis.asyncio
+
+    server = fakeredis.FakeServer()
+    redis.from_url = lambda url, **kw: fakeredis.FakeRedis(
+        server=server, decode_responses=kw.get("decode_responses", False))
+    redis.asyncio.from_url = lambda url, **kw: fakeredis.aioredis.FakeRedis(
+        server=server, decode_responses=kw.get("decode_responses", False))
+    # 앱의 비동기 클라이언트는 BlockingConnectionPool.from_url로 풀을 직접 만든다
+    redis.asyncio.BlockingConnectionPool.from_url = classmethod(
+        lambda cls, url, **kw: fakeredis.aioredis.FakeRedis(server=server, connection_pool_class=cls, **kw).connection_pool)
+
+
+# ------------------------
+# 요청 정의
+# ------------------------
+
+def endpoint_factories(users: int, conversations, rng: random.Random):
+    from app.auth.utils import create_access_token
+
+    tokens = {}
+
+    def auth(uid):
+        if uid not in tokens:
+            tokens[uid] = {"Authorization": f"Bearer {create_access_token(data={'user_id': uid})}"}
+        return tokens[uid]
+
+    def any_user():
+        return rng.randint(1, users)
+
+    def chat():
+        a, b = rng.choice(conversations) if conversations else (1, 2)
+        return f"/messages/chat/{b}", auth(a)
+
+    return {
+        "posts": lambda: ("/posts", {}),
+        "messages_users": lambda: ("/messages/users", auth(any_user())),
+        "messages_chat": chat,
+        "mood_stories": lambda: ("/mood/stories", auth(any_user())),
+        "search": lambda: (f"/search?query={rng.choice(['user1', 'user2', '건강', '산책', 'xyz'])}", {}),
+        "follow": lambda: (f"/follow/{any_user()}", auth(any_user())),
+    }
+
+
+def _percentile(sorted_values, q):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1))))
+    return round(sorted_values[index], 3)
+
+
+async def run_endpoint(client, make_request, requests: int, warmup: int, concurrency: int) -> dict:
+    latencies = []
+    statuses = {}
+    pending = list(range(warmup + requests))
+    started = None
+
+    async def worker():
+        nonlocal started
+        while pending:
+            i = pending.pop()
+            path, headers = make_request()
+            if i < requests and started is None:
+                started = time.perf_counter()
+            t0 = time.perf_counter()
+            resp = await client.get(path, headers=headers)
+            elapsed = (time.perf_counter() - t0) * 1000
+            if i < requests:
+                latencies.append(elapsed)
+                statuses[resp.status_code] = statuses.get(resp.status_code, 0) + 1
+
+    # pop()은 뒤에서부터 꺼내므로 인덱스 warmup 이상(먼저 나가는 요청)이 워밍업, 처리량은 첫 측정 요청부터 계산
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall = time.perf_counter() - started if started else 0.0
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "rps": round(len(latencies) / wall, 1) if wall else None,
+        "mean_ms": round(statistics.mean(latencies), 3) if latencies else None,
+        "p50_ms": _percentile(latencies, 0.50),
+        "p95_ms": _percentile(latencies, 0.95),
+        "p99_ms": _percentile(latencies, 0.99),
+        "max_ms": round(latencies[-1], 3) if latencies else None,
+        "status": {str(k): v for k, v in sorted(statuses.items())},
+    }
+
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except Exception:
+        return None
+
+
+async def bench(args, seeded: dict) -> dict:
+    import httpx
+    import app.main
+
+    rng = random.Random(args.seed)
+    factories = endpoint_factories(args.users, seeded.get("conversations", []), rng)
+    selected = [name.strip() for name in args.endpoints.split(",") if name.strip()] or list(factories)
+
+    async def run_all(client):
+        results = {}
+        for name in selected:
+            results[name] = await run_endpoint(client, factories[name], args.requests, args.warmup, args.concurrency)
+        return results
+
+    if args.base_url:
+        async with httpx.AsyncClient(base_url=args.base_url, timeout=60) as client:
+            return await run_all(client)
+
+    fastapi_app = app.main.fastapi_app
+    async with fastapi_app.router.lifespan_context(fastapi_app):
+        transport = httpx.ASGITransport(app=fastapi_app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60) as client:
+            return await run_all(client)
+
+
+def main():
+    args = parse_args()
+    configure_environment(args)
+
+    from sqlalchemy import create_engine
+    engine = create_engine(args.database_url)
+    seeded = {}
+    seed_seconds = None
+    if not args.no_seed:
+        create_schema(engine)
+        seeded = generate(engine, args.users, args.seed)
+        seed_seconds = seeded["seconds"]
+    engine.dispose()
+
+    endpoints = asyncio.run(bench(args, seeded))
+    result = {
+        "benchmark": "api",
+        "revision": git_revision(),
+        "timestamp": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+        "python": platform.python_version(),
+        "database": args.database_url.split(":", 1)[0],
+        "redis": "url" if args.redis_url else "fakeredis",
+        "target": args.base_url or "in-process",
+        "users": args.users,
+        "rows": seeded.get("rows"),
+        "seed_seconds": seed_seconds,
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "endpoints": endpoints,
+    }
+    text = json.dumps(result, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    print(text)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
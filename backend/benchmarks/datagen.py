@@ -0,0 +1,300 @@
+# benchmarks/datagen.py
+# ✅ 벤치마크 / 용량 산정용 합성 데이터 생성기 (같은 --seed면 같은 데이터)
+#
+# 분포
+#   - 인기도: 사용자마다 Zipf 순위(1/rank^zipf)를 섞어 배정 → 팔로워 수, 글 작성량, 대화 상대가 멱법칙
+#   - 팔로우: 사용자별 팔로잉 수는 꼬리가 긴 분포(평균 --follows), 대상은 인기도 가중 샘플링
+#   - 게시글: 작성자는 인기도 가중, 좋아요 수·댓글 수는 꼬리가 긴 분포 (대부분 0~몇 개, 일부 수백 개)
+#   - 메시지: 대화 상대별로 몇 번의 버스트(수 초 간격으로 주고받음)가 몇 시간~며칠 간격으로 이어짐,
+#             마지막 버스트만 안 읽음
+#   - 무드: 사용자별 여러 개, 일부 사용자는 최근 12시간 안에 남김 (/mood/stories 대상)
+# 삽입: 테이블별로 행을 생성기에서 --batch개씩 꺼내 executemany (SQLite는 PRAGMA, MySQL은 체크 끄기)
+# id를 직접 매겨서 다른 테이블이 되읽기 없이 참조한다. 그래서 비어 있는 DB에만 넣는다.
+#
+# 실행: cd backend && python -m benchmarks.datagen --users 100000 [--database-url mysql+pymysql://...]
+#       (MySQL은 먼저 alembic upgrade head, SQLite 파일은 테이블을 직접 만든다)
+# 코드에서: generate(engine, users=1000, seed=...) → {"rows": {...}, "seconds": ..., "conversations": [...]}
+
+import argparse
+import bisect
+import itertools
+import json
+import random
+import sys
+import time
+from array import array
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.engine import Engine
+
+DEFAULT_SEED = 20250701
+
+# 모든 사용자의 비밀번호는 "bench-password" (bcrypt 솔트를 고정해 두어야 실행마다 같은 행이 나옴)
+PASSWORD_HASH = "$2b$12$CareRingBenchSaltValueI9Vot/gCO0IjuIFjWpIT1h3IGGAPAWe"
+
+
+@dataclass
+class Profile:
+    """사용자 1명당 평균값 (실제 값은 꼬리가 긴 분포로 흩어짐)"""
+    follows: float = 20.0             # 팔로잉 수
+    posts: float = 3.0                # 작성 글 수 (총 글 수 = users * posts)
+    likes: float = 8.0                # 글당 좋아요 수
+    comments: float = 3.0             # 글당 댓글 수
+    comment_likes: float = 1.0        # 댓글당 좋아요 수
+    chats: float = 2.0                # 먼저 말을 건 대화 상대 수
+    bursts: float = 3.0               # 대화당 버스트 수
+    burst_messages: float = 6.0       # 버스트당 메시지 수
+    moods: float = 4.0                # 무드 기록 수
+    recent_mood_share: float = 0.1    # 최근 12시간 안에 무드를 남긴 사용자 비율
+    zipf: float = 1.0                 # 인기도 지수 (클수록 소수에게 몰림)
+    days: int = 90                    # 데이터가 퍼지는 기간
+
+
+def skewed(rng: random.Random, mean: float, cap: int, alpha: float = 2.0) -> int:
+    """Non-negative integer with the given mean and a Pareto tail."""
+    if mean <= 0 or cap <= 0:
+        return 0
+    value = mean * (alpha - 1) * (rng.paretovariate(alpha) - 1)
+    return min(cap, int(value + rng.random()))   # 확률적 반올림으로 평균 유지
+
+
+class Popularity:
+    """Zipf weights over a shuffled user order, sampled in O(log n)."""
+
+    def __init__(self, users: int, exponent: float, rng: random.Random):
+        self.order = list(range(1, users + 1))
+        rng.shuffle(self.order)
+        self.cum = list(itertools.accumulate(1.0 / (rank ** exponent) for rank in range(1, users + 1)))
+        self.total = self.cum[-1]
+
+    def pick(self, rng: random.Random) -> int:
+        return self.order[bisect.bisect_left(self.cum, rng.random() * self.total)]
+
+    def pick_many(self, rng: random.Random, k: int, exclude: int) -> List[int]:
+        chosen = {}
+        attempts = 0
+        while len(chosen) < k and attempts < k * 4:   # 인기 사용자가 반복해서 뽑히면 그만큼 더 시도
+            uid = self.pick(rng)
+            if uid != exclude:
+                chosen[uid] = None
+            attempts += 1
+        return list(chosen)
+
+
+# ------------------------
+# 테이블별 행 생성기
+# ------------------------
+
+class Generator:
+    def __init__(self, users: int, seed: int, profile: Profile, anchor: datetime):
+        self.users = users
+        self.seed = seed
+        self.profile = profile
+        self.anchor = anchor
+        self.start = anchor - timedelta(days=profile.days)
+        self.span = profile.days * 86400
+        self.popularity = Popularity(users, profile.zipf, self.rng("popularity"))
+        self.post_count = int(round(users * profile.posts))
+        self.post_comments = array("I")      # 글별 댓글 수 (posts에서 정하고 comments가 사용)
+        self.comment_likes = array("I")      # 댓글별 좋아요 수
+        self.conversations: List[Tuple[int, int]] = []
+
+    def rng(self, table: str) -> random.Random:
+        # 테이블마다 독립된 난수열 → 한 테이블의 설정을 바꿔도 다른 테이블은 그대로
+        return random.Random(f"{self.seed}:{table}")
+
+    def at(self, offset_seconds: float) -> datetime:
+        return self.start + timedelta(seconds=offset_seconds)
+
+    def users_rows(self) -> Iterator[dict]:
+        rng = self.rng("users")
+        for uid in range(1, self.users + 1):
+            yield {"id": uid, "nickname": f"user{uid}", "email": f"user{uid}@bench.local", "password": PASSWORD_HASH,
+                   "about": None, "created_at": self.at(rng.random() * self.span * 0.5)}
+
+    def basic_info_rows(self) -> Iterator[dict]:
+        rng = self.rng("basic_info")
+        for uid in range(1, self.users + 1):
+            yield {"user_id": uid, "name": f"User {uid}", "gender": rng.choice(("M", "F")),
+                   "height": round(rng.gauss(168, 9), 1), "weight": round(rng.gauss(65, 12), 1)}
+
+    def follows_rows(self) -> Iterator[dict]:
+        rng = self.rng("follows")
+        for uid in range(1, self.users + 1):
+            k = skewed(rng, self.profile.follows, self.users - 1)
+            for target in self.popularity.pick_many(rng, k, exclude=uid):
+                yield {"follower_id": uid, "following_id": target,
+                       "created_at": self.at(self.span * 0.5 + rng.random() * self.span * 0.5)}
+
+    def posts_rows(self) -> Iterator[dict]:
+        rng = self.rng("posts")
+        step = self.span / max(1, self.post_count)
+        # id 순서 = 시간 순서 (피드 정렬과 일치)
+        for pid in range(1, self.post_count + 1):
+            comments = skewed(rng, self.profile.comments, 5000)
+            self.post_comments.append(comments)
+            yield {"id": pid, "user_id": self.popularity.pick(rng),
+                   "phrase": f"오늘의 건강 기록 #{pid} 산책 {rng.randint(10, 90)}분",
+                   "hashtags": rng.choice(("#health,#walk", "#diet", "#sleep,#health", "#run", None)),
+                   "disclosure": "public" if rng.random() < 0.9 else "followers",
+                   "likes": skewed(rng, self.profile.likes, 100000), "comment_count": comments,
+                   "created_at": self.at((pid - 1 + rng.random()) * step)}
+
+    def comments_rows(self) -> Iterator[dict]:
+        rng = self.rng("comments")
+        step = self.span / max(1, self.post_count)
+        cid = 0
+        for index, count in enumerate(self.post_comments):
+            posted = (index + 1) * step
+            for _ in range(count):
+                cid += 1
+                likes = skewed(rng, self.profile.comment_likes, self.users)
+                self.comment_likes.append(likes)
+                yield {"id": cid, "post_id": index + 1, "user_id": self.popularity.pick(rng),
+                       "content": rng.choice(("좋아요!", "화이팅", "저도 해볼게요", "대단해요 👍", "오늘도 수고했어요")),
+                       "created_at": self.at(min(self.span, posted + rng.expovariate(1 / 3600)))}
+
+    def comment_likes_rows(self) -> Iterator[dict]:
+        rng = self.rng("comment_likes")
+        for index, count in enumerate(self.comment_likes):
+            for uid in rng.sample(range(1, self.users + 1), count):
+                yield {"comment_id": index + 1, "user_id": uid}
+
+    def messages_rows(self) -> Iterator[dict]:
+        rng = self.rng("messages")
+        p = self.profile
+        for uid in range(1, self.users + 1):
+            for peer in self.popularity.pick_many(rng, skewed(rng, p.chats, self.users - 1), exclude=uid):
+                if len(self.conversations) < 1000:
+                    self.conversations.append((uid, peer))
+                bursts = 1 + skewed(rng, p.bursts - 1, 200)
+                # 대화 시작 시각부터 버스트 간격(평균 하루)만큼씩 진행, 기간을 넘기면 끝
+                clock = rng.random() * self.span * 0.8
+                for burst in range(bursts):
+                    last_burst = burst == bursts - 1
+                    for _ in range(1 + skewed(rng, p.burst_messages - 1, 500)):
+                        sender, receiver = (uid, peer) if rng.random() < 0.5 else (peer, uid)
+                        ts = self.at(min(self.span, clock))
+                        yield {"sender_id": sender, "receiver_id": receiver, "content": "메시지",
+                               "timestamp": ts, "created_at": ts,
+                               "is_read": not last_burst or rng.random() < 0.5}
+                        clock += rng.expovariate(1 / 20)          # 버스트 안: 평균 20초
+                    clock += rng.expovariate(1 / 86400)           # 버스트 사이: 평균 하루
+                    if clock >= self.span:
+                        break
+
+    def moods_rows(self) -> Iterator[dict]:
+        rng = self.rng("moods")
+        for uid in range(1, self.users + 1):
+            for _ in range(skewed(rng, self.profile.moods, 365)):
+                yield {"user_id": uid, "emoji": rng.choice(("🙂", "😀", "😴", "😢", "💪")), "memo": None,
+                       "created_at": self.at(rng.random() * (self.span - 86400))}
+            if rng.random() < self.profile.recent_mood_share:
+                yield {"user_id": uid, "emoji": "🙂", "memo": "오늘 기분",
+                       "created_at": self.anchor - timedelta(seconds=rng.random() * 12 * 3600)}
+
+
+# ------------------------
+# 삽입
+# ------------------------
+
+def create_schema(engine: Engine):
+    from app.database import Base
+    import app.models  # noqa: F401
+    from app.models import medicines, widget_layout, profile_customization  # noqa: F401
+    Base.metadata.create_all(engine)
+
+
+def _bulk_session(conn):
+    # 대량 적재 동안만 내구성/제약 검사를 늦춤 (연결 단위 설정)
+    if conn.dialect.name == "sqlite":
+        conn.exec_driver_sql("PRAGMA synchronous = OFF")
+    elif conn.dialect.name == "mysql":
+        conn.exec_driver_sql("SET unique_checks = 0, foreign_key_checks = 0")
+
+
+def _insert(engine: Engine, table, rows: Iterable[dict], batch: int) -> int:
+    statement = insert(table)
+    total = 0
+    with engine.begin() as conn:
+        _bulk_session(conn)
+        for chunk in iter(lambda: list(itertools.islice(rows, batch)), []):
+            conn.execute(statement, chunk)
+            total += len(chunk)
+    return total
+
+
+def generate(engine: Engine, users: int, seed: int = DEFAULT_SEED, profile: Optional[Profile] = None,
+             batch: int = 10000, anchor: Optional[datetime] = None, progress=None) -> dict:
+    from app.models import BasicInfo, Comment, CommentLike, Follow, Message, Mood, Post, User
+
+    with engine.connect() as conn:
+        if conn.execute(select(func.count()).select_from(User.__table__)).scalar():
+            raise RuntimeError("users table is not empty; datagen assigns ids itself and needs an empty database")
+
+    gen = Generator(users, seed, profile or Profile(), anchor or datetime.utcnow().replace(microsecond=0))
+    # 순서가 중요: posts가 댓글 수를, comments가 댓글 좋아요 수를 정해 둔다
+    plan = [
+        (User, gen.users_rows),
+        (BasicInfo, gen.basic_info_rows),
+        (Follow, gen.follows_rows),
+        (Post, gen.posts_rows),
+        (Comment, gen.comments_rows),
+        (CommentLike, gen.comment_likes_rows),
+        (Message, gen.messages_rows),
+        (Mood, gen.moods_rows),
+    ]
+    rows: Dict[str, int] = {}
+    started = time.perf_counter()
+    for model, make_rows in plan:
+        t0 = time.perf_counter()
+        rows[model.__tablename__] = _insert(engine, model.__table__, make_rows(), batch)
+        if progress:
+            progress(model.__tablename__, rows[model.__tablename__], time.perf_counter() - t0)
+    return {
+        "rows": rows,
+        "total_rows": sum(rows.values()),
+        "seconds": round(time.perf_counter() - started, 2),
+        "conversations": gen.conversations,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Synthetic social graph / chat data generator")
+    parser.add_argument("--users", type=int, default=10000)
+    parser.add_argument("--database-url", default="sqlite:///./datagen.db")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--batch", type=int, default=10000, help="rows per executemany")
+    parser.add_argument("--anchor", default=None, help="ISO time the data ends at (default: now)")
+    for field, default in asdict(Profile()).items():
+        parser.add_argument(f"--{field.replace('_', '-')}", type=type(default), default=default,
+                            help=f"per-user average (default {default})" if field != "zipf" else None)
+    args = parser.parse_args()
+
+    from sqlalchemy import create_engine
+
+    engine = create_engine(args.database_url)
+    if engine.dialect.name == "sqlite":
+        create_schema(engine)
+    profile = Profile(**{field: getattr(args, field) for field in asdict(Profile())})
+    anchor = datetime.fromisoformat(args.anchor) if args.anchor else None
+
+    def progress(table, count, seconds):
+        print(f"{table:<15} {count:>12,} rows {seconds:8.1f}s  {count / max(seconds, 1e-9):>10,.0f} rows/s",
+              file=sys.stderr)
+
+    try:
+        result = generate(engine, args.users, args.seed, profile, args.batch, anchor, progress)
+    except RuntimeError as e:
+        raise SystemExit(str(e))
+    finally:
+        engine.dispose()
+    result.pop("conversations")
+    print(json.dumps({"users": args.users, "seed": args.seed, "profile": asdict(profile), **result}, indent=2))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
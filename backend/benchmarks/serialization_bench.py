@@ -0,0 +1,97 @@
+# benchmarks/serialization_bench.py
+# ✅ 피드 응답 직렬화 마이크로벤치마크 (게시글 100개당 시간)
+#
+# 기존 경로: response_model 재검증 → jsonable_encoder → json.dumps (FastAPI 기본 동작과 동일)
+# 빠른 경로: 스키마 모양의 dict → orjson.dumps (app/utils/fast_json.py)
+#
+# 실행: cd backend && python -m benchmarks.serialization_bench [--posts 100] [--repeat 200]
+
+import argparse
+import json
+import statistics
+import time
+from datetime import datetime, timedelta
+
+from fastapi.encoders import jsonable_encoder
+
+from app.utils.fast_json import FEED_ADAPTER, FastJSONResponse
+
+
+def make_feed(n_posts: int, comments_per_post: int = 3):
+    now = datetime(2025, 1, 1, 12, 0, 0)
+    feed = []
+    for i in range(n_posts):
+        feed.append({
+            "id": i + 1,
+            "user_id": i % 50 + 1,
+            "phrase": f"오늘의 건강 기록 #{i} " + "산책 30분, 물 2L. " * 3,
+            "hashtags": "#health,#walk,#water",
+            "location": "Seoul",
+            "person_tag": None,
+            "disclosure": "public",
+            "image_url": f"/media/posts/{i:032x}.jpg",
+            "likes": i * 3,
+            "comment_count": i * 2,
+            "comments": [
+                {
+                    "id": i * 10 + j,
+                    "user_id": j + 1,
+                    "user_name": f"user{j}",
+                    "content": "좋아요! 저도 해볼게요 🙌",
+                    "created_at": now + timedelta(minutes=j),
+                    "profile_image": None,
+                }
+                for j in range(comments_per_post)
+            ],
+            "user_name": f"user{i % 50}",
+            "created_at": now - timedelta(hours=i),
+        })
+    return feed
+
+
+def baseline(feed) -> bytes:
+    validated = FEED_ADAPTER.validate_python(feed)
+    content = jsonable_encoder(FEED_ADAPTER.dump_python(validated, mode="json"))
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def fast(feed) -> bytes:
+    return FastJSONResponse(feed).body
+
+
+def measure(fn, feed, repeat: int):
+    fn(feed)  # 워밍업
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(feed)
+        samples.append((time.perf_counter() - start) * 1000)
+    return {
+        "median_ms": round(statistics.median(samples), 4),
+        "p95_ms": round(sorted(samples)[int(len(samples) * 0.95) - 1], 4),
+        "bytes": len(fn(feed)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Feed serialization microbenchmark")
+    parser.add_argument("--posts", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    feed = make_feed(args.posts)
+    assert json.loads(baseline(feed)) == json.loads(fast(feed)), "fast path output differs from baseline"
+
+    before = measure(baseline, feed, args.repeat)
+    after = measure(fast, feed, args.repeat)
+    result = {
+        "posts": args.posts,
+        "baseline": before,
+        "fast": after,
+        "speedup": round(before["median_ms"] / after["median_ms"], 1) if after["median_ms"] else None,
+    }
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
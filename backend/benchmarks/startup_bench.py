@@ -0,0 +1,93 @@
+# benchmarks/startup_bench.py
+# ✅ 앱 시작 시간 벤치마크 (매번 새 인터프리터에서 측정)
+#
+# - import_ms: `import app.main` 시간 (DB/Redis 연결 없이 끝나야 함)
+# - first_request_ms: import 직후 첫 요청(GET /openapi.json, 라우트 전체 스키마 생성)까지 시간
+# - top_imports: -X importtime 기준 누적 import 시간이 큰 모듈
+#
+# 실행: cd backend && python -m benchmarks.startup_bench [--runs 5] [--top 10]
+# DB/Redis 서버가 없어도 됨 (import 시점에 연결하지 않으므로).
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 자식 프로세스에서 실행: import 시간 → ASGI로 직접 첫 요청 보낸 시간을 JSON으로 출력
+PROBE = r"""
+import asyncio, json, time
+t0 = time.perf_counter()
+import app.main
+t1 = time.perf_counter()
+
+async def first_request():
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": "GET", "scheme": "http", "path": "/openapi.json", "raw_path": b"/openapi.json",
+        "root_path": "", "query_string": b"", "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 0), "server": ("bench", 80),
+    }
+    status = {}
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+    async def send(message):
+        if message["type"] == "http.response.start":
+            status["code"] = message["status"]
+    await app.main.fastapi_app(scope, receive, send)
+    return status.get("code")
+
+code = asyncio.run(first_request())
+t2 = time.perf_counter()
+print(json.dumps({"import_ms": (t1 - t0) * 1000, "first_request_ms": (t2 - t1) * 1000, "status": code}))
+"""
+
+
+def run_probe() -> dict:
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        cwd=BACKEND_DIR, capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def top_imports(limit: int):
+    # -X importtime 출력: "import time: self [us] | cumulative | imported package"
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        cwd=BACKEND_DIR, capture_output=True, text=True, check=True,
+    )
+    rows = []
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = [part.strip() for part in line.split(":", 1)[1].split("|")]
+        if name.startswith("app"):
+            rows.append((int(cumulative_us), int(self_us), name))
+    rows.sort(reverse=True)
+    return [{"module": name, "cumulative_ms": round(cum / 1000, 1), "self_ms": round(own / 1000, 1)}
+            for cum, own, name in rows[:limit]]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="App startup benchmark")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    samples = [run_probe() for _ in range(args.runs)]
+    result = {
+        "runs": args.runs,
+        "import_ms": round(statistics.median(s["import_ms"] for s in samples), 1),
+        "first_request_ms": round(statistics.median(s["first_request_ms"] for s in samples), 1),
+        "first_request_status": samples[-1]["status"],
+        "top_imports": top_imports(args.top),
+    }
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
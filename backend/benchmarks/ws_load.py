@@ -0,0 +1,579 @@
+# benchmarks/ws_load.py
+# ✅ 실시간 전달(fan-out) 부하 도구: 동시 연결 수 / 종단 간 지연 / 유실 메시지
+#
+# 연결 (--clients개를 --mix 비율로 나눔)
+#   - comments: /ws/comments/{post_id}  (--posts개 게시글 방에 고르게)
+#   - ws:       /ws  + {"type": "join", "userId"}  (사용자 room)
+#   - sio:      Socket.IO  + join {"room": "user_{id}"}
+# 이벤트 (--rate건/초, --events 비율)
+#   - comment: POST /posts/{id}/comments      → post_channel → 해당 게시글의 comments 연결
+#   - message: POST /messages/send            → chat_channel → 받는 사람/보낸 사람의 ws·sio 연결
+#   - typing:  /ws 연결에서 {"type": "typing"} → chat_channel → 받는 사람의 ws·sio 연결
+#     (타이핑은 REST 엔드포인트가 없어서 클라이언트가 소켓으로 보냄)
+# 지연 = 이벤트를 보내기 직전 ~ 각 수신 연결이 받은 시각. 보낼 때 붙어 있던 구독자 수를 기대값으로 두고,
+# --drain초 안에 못 받은 만큼을 유실(dropped)로 센다.
+#
+# 기본: fakeredis TCP 서버(로컬 Redis 대용) + SQLite 파일 DB + uvicorn 워커 1개를 이 스크립트가 직접 띄움.
+# --server-url을 주면 이미 떠 있는 서버로 연결 (이때 토큰/사용자는 --database-url DB 기준으로 준비).
+# Socket.IO는 aiohttp 없이 돌리려고 Engine.IO v4 웹소켓 프레임을 직접 처리한다 (연결당 비용도 작음).
+#
+# 실행: cd backend && pip install -r benchmarks/requirements.txt
+#       python -m benchmarks.ws_load [--clients 3000] [--rate 200] [--duration 20] [--output ws.json]
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import resource
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+from benchmarks.api_bench import git_revision, _percentile
+from benchmarks.datagen import DEFAULT_SEED
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Realtime fan-out load generator")
+    parser.add_argument("--clients", type=int, default=3000, help="total socket connections")
+    parser.add_argument("--mix", default="comments=1,ws=1,sio=1", help="connection mix by transport")
+    parser.add_argument("--posts", type=int, default=50, help="comment rooms the comments clients spread over")
+    parser.add_argument("--users", type=int, default=500, help="seeded users (ws/sio clients spread over them)")
+    parser.add_argument("--events", default="comment=1,message=1,typing=1", help="event mix")
+    parser.add_argument("--rate", type=float, default=200, help="events per second")
+    parser.add_argument("--duration", type=float, default=20, help="seconds of event traffic")
+    parser.add_argument("--drain", type=float, default=5, help="seconds to wait for late deliveries")
+    parser.add_argument("--connect-concurrency", type=int, default=50,
+                        help="simultaneous handshakes while ramping up connections")
+    parser.add_argument("--http-concurrency", type=int, default=64)
+    parser.add_argument("--server-url", default=None, help="use a running server instead of spawning one")
+    parser.add_argument("--database-url", default=None, help="default: a fresh SQLite file in a temp dir")
+    parser.add_argument("--redis-url", default=None, help="default: a fakeredis TCP server on localhost")
+    parser.add_argument("--no-seed", action="store_true", help="reuse data already in --database-url")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--output", default=None, help="write the JSON result here as well as stdout")
+    return parser.parse_args()
+
+
+def parse_mix(text: str, allowed) -> dict:
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in allowed:
+            raise SystemExit(f"unknown mix entry {name!r} (expected one of {', '.join(allowed)})")
+        mix[name] = float(weight or 1)
+    return {name: weight for name, weight in mix.items() if weight > 0}
+
+
+def raise_fd_limit(needed: int):
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < needed:
+        target = hard if hard == resource.RLIM_INFINITY else min(hard, max(needed, soft))
+        resource.setrlimit(resource.RLIMIT_NOFILE, (target, hard))
+        soft = target
+    if soft < needed:
+        print(f"warning: open file limit {soft} is below the ~{needed} sockets needed", file=sys.stderr)
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+# ------------------------
+# 로컬 서버 (fakeredis TCP + uvicorn)
+# ------------------------
+
+def start_fake_redis() -> str:
+    import fakeredis
+
+    port = free_port()
+    server = fakeredis.TcpFakeServer(("127.0.0.1", port), server_type="redis")
+    threading.Thread(target=server.serve_forever, name="fake-redis", daemon=True).start()
+    return f"redis://127.0.0.1:{port}/0"
+
+
+def spawn_server(database_url: str, redis_url: str) -> tuple:
+    port = free_port()
+    env = {**os.environ, "DATABASE_URL": database_url, "REDIS_URL": redis_url, "LOG_LEVEL": "ERROR"}
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--log-level", "warning", "--no-access-log"],
+        env=env, stdout=subprocess.DEVNULL,
+    )
+    return proc, f"http://127.0.0.1:{port}"
+
+
+async def wait_until_ready(http, proc, timeout: float = 60.0):
+    # 브릿지가 Redis를 구독한 뒤부터 이벤트를 보내야 초반 유실이 섞이지 않음
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc is not None and proc.poll() is not None:
+            raise SystemExit(f"server exited with code {proc.returncode}")
+        try:
+            resp = await http.get("/realtime/metrics")
+            if resp.status_code == 200 and resp.json().get("connected"):
+                return
+        except Exception:
+            pass
+        await asyncio.sleep(0.25)
+    raise SystemExit("server did not become ready")
+
+
+# ------------------------
+# 전달 기록
+# ------------------------
+
+class DeliveryLog:
+    def __init__(self):
+        self.sent = {}            # token → (kind, sent_at, expected)
+        self.received = {}        # token → 받은 연결 수
+        self.latencies = {}       # kind → [ms]
+        self.unexpected = 0       # 모르는 토큰 / 기대 수보다 많이 받은 경우
+        self.http_errors = {}
+        self.failed = set()       # 요청이 실패한 토큰 (타임아웃이면 서버에서는 처리됐을 수도 있음)
+        self.pending_typing = {}  # (sender, receiver) → token
+
+    def expect(self, token: str, kind: str, sent_at: float, expected: int):
+        self.sent[token] = (kind, sent_at, expected)
+
+    def cancel(self, token: str, kind: str, status):
+        self.sent.pop(token, None)
+        self.failed.add(token)
+        key = f"{kind}:{status}"
+        self.http_errors[key] = self.http_errors.get(key, 0) + 1
+
+    def deliver(self, token: str):
+        now = time.perf_counter()
+        entry = self.sent.get(token)
+        if entry is None:
+            if token not in self.failed:
+                self.unexpected += 1
+            return
+        kind, sent_at, expected = entry
+        got = self.received.get(token, 0) + 1
+        self.received[token] = got
+        if got > expected:
+            self.unexpected += 1
+            return
+        self.latencies.setdefault(kind, []).append((now - sent_at) * 1000)
+
+    def outstanding(self) -> int:
+        return sum(expected - min(expected, self.received.get(token, 0))
+                   for token, (_, _, expected) in self.sent.items())
+
+    def report(self) -> dict:
+        kinds = {}
+        for token, (kind, _, expected) in self.sent.items():
+            entry = kinds.setdefault(kind, {"events": 0, "expected": 0, "delivered": 0})
+            entry["events"] += 1
+            entry["expected"] += expected
+            entry["delivered"] += min(expected, self.received.get(token, 0))
+        for kind, entry in kinds.items():
+            latencies = sorted(self.latencies.get(kind, []))
+            entry["dropped"] = entry["expected"] - entry["delivered"]
+            entry["drop_rate"] = round(entry["dropped"] / entry["expected"], 5) if entry["expected"] else 0.0
+            entry["mean_ms"] = round(statistics.mean(latencies), 3) if latencies else None
+            entry["p50_ms"] = _percentile(latencies, 0.50)
+            entry["p95_ms"] = _percentile(latencies, 0.95)
+            entry["p99_ms"] = _percentile(latencies, 0.99)
+            entry["max_ms"] = round(latencies[-1], 3) if latencies else None
+        return kinds
+
+
+# ------------------------
+# 클라이언트
+# ------------------------
+
+class Listener:
+    kind = ""
+
+    def __init__(self, base_ws: str, log: DeliveryLog, key):
+        self.base_ws = base_ws
+        self.log = log
+        self.key = key               # comments: post_id, ws/sio: user_id
+        self.ws = None
+        self.connected = False
+        self.closed_early = False
+        self.connect_ms = None
+
+    async def open(self):
+        from websockets.asyncio.client import connect
+
+        t0 = time.perf_counter()
+        self.ws = await connect(self.url(), open_timeout=30, ping_interval=None, max_size=None)
+        await self.handshake()
+        self.connect_ms = (time.perf_counter() - t0) * 1000
+        self.connected = True
+
+    def url(self) -> str:
+        raise NotImplementedError
+
+    async def handshake(self):
+        pass
+
+    async def run(self):
+        try:
+            async for frame in self.ws:
+                await self.on_frame(frame)
+        except Exception:
+            pass
+        finally:
+            if self.connected and not STOPPING.is_set():
+                self.closed_early = True
+            self.connected = False
+
+    async def on_frame(self, frame: str):
+        raise NotImplementedError
+
+    async def close(self):
+        if self.ws is not None:
+            await self.ws.close()
+
+
+class CommentListener(Listener):
+    kind = "comments"
+
+    def url(self):
+        return f"{self.base_ws}/ws/comments/{self.key}"
+
+    async def on_frame(self, frame):
+        content = json.loads(frame).get("content", "")
+        if content.startswith("lt:"):
+            self.log.deliver(content)
+
+
+class UserSocketListener(Listener):
+    kind = "ws"
+
+    def url(self):
+        return f"{self.base_ws}/ws"
+
+    async def handshake(self):
+        await self.ws.send(json.dumps({"type": "join", "userId": self.key}))
+
+    async def send_typing(self, receiver_id: int, state: str = "started"):
+        await self.ws.send(json.dumps({"type": "typing", "receiverId": receiver_id, "state": state}))
+
+    async def on_frame(self, frame):
+        data = json.loads(frame)
+        if data.get("type") == "typing":
+            if data.get("state") != "stopped":
+                token = self.log.pending_typing.get((data.get("senderId"), self.key))
+                if token:
+                    self.log.deliver(token)
+        elif str(data.get("content", "")).startswith("lt:"):
+            self.log.deliver(data["content"])
+
+
+class SocketIOListener(Listener):
+    """Engine.IO v4 / Socket.IO v5 over a plain websocket: 0=open, 2/3=ping/pong, 40=connect, 42=event."""
+    kind = "sio"
+
+    def url(self):
+        return f"{self.base_ws}/socket.io/?EIO=4&transport=websocket"
+
+    async def handshake(self):
+        opened = await self.ws.recv()
+        if not opened.startswith("0"):
+            raise ConnectionError(f"unexpected engine.io open packet: {opened[:40]}")
+        # auth를 비우면 서버 connect 핸들러가 auth.get()에서 실패하므로 빈 토큰을 보냄 (room은 join으로 입장)
+        await self.ws.send("40" + json.dumps({"token": ""}))
+        while not (await self.ws.recv()).startswith("40"):
+            pass
+        await self.ws.send("42" + json.dumps(["join", {"room": f"user_{self.key}"}]))
+
+    async def on_frame(self, frame):
+        if frame == "2":
+            await self.ws.send("3")
+            return
+        if not frame.startswith("42"):
+            return
+        event, *args = json.loads(frame[2:])
+        if event == "typing" and args:
+            token = self.log.pending_typing.get((args[0], self.key))
+            if token:
+                self.log.deliver(token)
+        elif event == "receive_message" and args and isinstance(args[0], dict):
+            content = str(args[0].get("content", ""))
+            if content.startswith("lt:"):
+                self.log.deliver(content)
+
+
+LISTENERS = {"comments": CommentListener, "ws": UserSocketListener, "sio": SocketIOListener}
+STOPPING = asyncio.Event()
+
+
+def build_listeners(args, base_ws: str, log: DeliveryLog, rng: random.Random):
+    mix = parse_mix(args.mix, LISTENERS)
+    total = sum(mix.values())
+    listeners = []
+    for kind, weight in mix.items():
+        count = int(round(args.clients * weight / total))
+        for i in range(count):
+            key = 1 + i % args.posts if kind == "comments" else 1 + i % args.users
+            listeners.append(LISTENERS[kind](base_ws, log, key))
+    rng.shuffle(listeners)
+    return listeners
+
+
+async def open_all(listeners, concurrency: int) -> dict:
+    gate = asyncio.Semaphore(concurrency)
+    failures = {}
+
+    async def open_one(listener):
+        async with gate:
+            try:
+                await listener.open()
+            except Exception as e:
+                failures[type(e).__name__] = failures.get(type(e).__name__, 0) + 1
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(open_one(listener) for listener in listeners))
+    return {"seconds": round(time.perf_counter() - t0, 2), "failures": failures}
+
+
+# ------------------------
+# 이벤트 발생
+# ------------------------
+
+class EventDriver:
+    def __init__(self, args, http, listeners, log: DeliveryLog, rng: random.Random):
+        from app.auth.utils import create_access_token
+
+        self.args = args
+        self.http = http
+        self.log = log
+        self.rng = rng
+        self.mix = parse_mix(args.events, ("comment", "message", "typing"))
+        self.gate = asyncio.Semaphore(args.http_concurrency)
+        self.seq = 0
+        self.tokens = {}
+        self._token = create_access_token
+        self.by_post = {}
+        self.by_user = {}
+        for listener in listeners:
+            if listener.kind == "comments":
+                self.by_post.setdefault(listener.key, []).append(listener)
+            else:
+                self.by_user.setdefault(listener.key, []).append(listener)
+        self.typers = [l for l in listeners if l.kind == "ws"]
+
+    def auth(self, uid: int) -> dict:
+        if uid not in self.tokens:
+            self.tokens[uid] = {"Authorization": f"Bearer {self._token(data={'user_id': uid})}"}
+        return self.tokens[uid]
+
+    def subscribers(self, listeners) -> int:
+        return sum(1 for listener in listeners or () if listener.connected)
+
+    def next_token(self) -> str:
+        self.seq += 1
+        return f"lt:{self.seq}"
+
+    async def run(self):
+        kinds, weights = list(self.mix), list(self.mix.values())
+        interval = 1.0 / self.args.rate
+        tasks = set()
+        start = time.perf_counter()
+        n = 0
+        while time.perf_counter() - start < self.args.duration:
+            kind = self.rng.choices(kinds, weights)[0]
+            task = asyncio.create_task(getattr(self, f"send_{kind}")())
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            n += 1
+            # 누적 기준으로 간격을 맞춤 (한 번 늦어져도 평균 속도는 유지)
+            delay = start + n * interval - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        elapsed = time.perf_counter() - start
+        await asyncio.gather(*tasks, return_exceptions=True)
+        return {"events": n, "achieved_rate": round(n / elapsed, 1)}
+
+    async def _post(self, kind: str, token: str, path: str, uid: int, body: dict):
+        async with self.gate:
+            try:
+                resp = await self.http.post(path, json=body, headers=self.auth(uid))
+                status = resp.status_code
+            except Exception as e:
+                status = type(e).__name__
+        if status != 200:
+            self.log.cancel(token, kind, status)
+
+    async def send_comment(self):
+        post_id = self.rng.randint(1, self.args.posts)
+        token = self.next_token()
+        self.log.expect(token, "comment", time.perf_counter(), self.subscribers(self.by_post.get(post_id)))
+        await self._post("comment", token, f"/posts/{post_id}/comments", self.rng.randint(1, self.args.users),
+                         {"content": token})
+
+    async def send_message(self):
+        sender = self.rng.randint(1, self.args.users)
+        receiver = self.rng.randint(1, self.args.users)
+        if receiver == sender:
+            receiver = receiver % self.args.users + 1
+        token = self.next_token()
+        # 보낸 사람 room에도 같은 내용이 가므로 양쪽 구독자 모두 기대
+        expected = self.subscribers(self.by_user.get(receiver)) + self.subscribers(self.by_user.get(sender))
+        self.log.expect(token, "message", time.perf_counter(), expected)
+        await self._post("message", token, "/messages/send", sender,
+                         {"receiver_id": receiver, "content": token})
+
+    async def send_typing(self):
+        if not self.typers:
+            return
+        typer = self.rng.choice(self.typers)
+        receiver = self.rng.randint(1, self.args.users)
+        pair = (typer.key, receiver)
+        # 서버는 쌍마다 started를 한 번만 보내므로 진행 중인 쌍은 건너뜀
+        if not typer.connected or receiver == typer.key or pair in self.log.pending_typing:
+            return
+        expected = self.subscribers(self.by_user.get(receiver))
+        if not expected:
+            return   # 받는 사람이 오프라인이면 서버가 보내지 않음
+        token = self.next_token()
+        self.log.pending_typing[pair] = token
+        self.log.expect(token, "typing", time.perf_counter(), expected)
+        try:
+            await typer.send_typing(receiver)
+            await asyncio.sleep(self.args.drain)
+            await typer.send_typing(receiver, "stopped")
+        except Exception as e:
+            self.log.cancel(token, "typing", type(e).__name__)
+        finally:
+            await asyncio.sleep(0.5)   # stopped가 전달된 뒤에 같은 쌍을 다시 쓰도록
+            self.log.pending_typing.pop(pair, None)
+
+
+async def drain(log: DeliveryLog, seconds: float):
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline and log.outstanding():
+        await asyncio.sleep(0.1)
+
+
+async def load(args, base_url: str, proc) -> dict:
+    import httpx
+
+    rng = random.Random(args.seed)
+    log = DeliveryLog()
+    base_ws = "ws" + base_url[len("http"):]
+    limits = httpx.Limits(max_connections=args.http_concurrency, max_keepalive_connections=args.http_concurrency)
+    async with httpx.AsyncClient(base_url=base_url, timeout=30, limits=limits) as http:
+        await wait_until_ready(http, proc)
+
+        listeners = build_listeners(args, base_ws, log, rng)
+        connect = await open_all(listeners, args.connect_concurrency)
+        readers = [asyncio.create_task(l.run()) for l in listeners if l.connected]
+        await asyncio.sleep(1.0)   # join / presence 등록이 끝나도록
+
+        driver = EventDriver(args, http, listeners, log, rng)
+        traffic = await driver.run()
+        await drain(log, args.drain)
+
+        try:
+            server = (await http.get("/realtime/metrics")).json()
+            bridge = {key: server.get(key) for key in
+                      ("received", "dispatched", "dropped", "dispatch_errors", "queue_depth", "p50_lag_ms",
+                       "p99_lag_ms", "max_lag_ms")}
+        except Exception:
+            bridge = None
+
+        STOPPING.set()
+        connected = sum(1 for l in listeners if l.connected)
+        closed_early = sum(1 for l in listeners if l.closed_early)
+        connect_ms = sorted(l.connect_ms for l in listeners if l.connect_ms is not None)
+        await asyncio.gather(*(l.close() for l in listeners), return_exceptions=True)
+        await asyncio.gather(*readers, return_exceptions=True)
+
+    by_kind = {}
+    for l in listeners:
+        entry = by_kind.setdefault(l.kind, {"requested": 0, "opened": 0})
+        entry["requested"] += 1
+        entry["opened"] += l.connect_ms is not None
+    return {
+        "connections": {
+            "requested": len(listeners),
+            "opened": len(connect_ms),
+            "open_at_end": connected,
+            "closed_early": closed_early,
+            "open_seconds": connect["seconds"],
+            "open_failures": connect["failures"],
+            "connect_p50_ms": _percentile(connect_ms, 0.50),
+            "connect_p99_ms": _percentile(connect_ms, 0.99),
+            "by_transport": by_kind,
+        },
+        "traffic": {**traffic, "http_errors": log.http_errors, "unexpected_deliveries": log.unexpected},
+        "delivery": log.report(),
+        "server_bridge": bridge,
+    }
+
+
+def main():
+    args = parse_args()
+    raise_fd_limit(args.clients + args.http_concurrency + 256)
+
+    if args.database_url is None:
+        args.database_url = "sqlite:///" + os.path.join(tempfile.mkdtemp(prefix="carering-ws-"), "bench.db")
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ.setdefault("LOG_LEVEL", "ERROR")
+
+    if not args.no_seed:
+        from sqlalchemy import create_engine
+        from benchmarks.datagen import create_schema, generate
+
+        engine = create_engine(args.database_url)
+        create_schema(engine)
+        generate(engine, max(args.users, (args.posts + 2) // 3), args.seed)
+        engine.dispose()
+
+    proc = None
+    base_url = args.server_url
+    redis = "external"
+    if base_url is None:
+        redis = args.redis_url or start_fake_redis()
+        proc, base_url = spawn_server(args.database_url, redis)
+        redis = "url" if args.redis_url else "fakeredis-tcp"
+    try:
+        outcome = asyncio.run(load(args, base_url.rstrip("/"), proc))
+    finally:
+        if proc is not None:
+            proc.terminate()
+            try:
+                proc.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+
+    result = {
+        "benchmark": "ws_load",
+        "revision": git_revision(),
+        "timestamp": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+        "python": platform.python_version(),
+        "database": args.database_url.split(":", 1)[0],
+        "redis": redis,
+        "target": args.server_url or "local uvicorn (1 worker)",
+        "clients": args.clients,
+        "mix": args.mix,
+        "events": args.events,
+        "rate": args.rate,
+        "duration": args.duration,
+        **outcome,
+    }
+    text = json.dumps(result, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    print(text)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,13 @@
+-- migrations/manual/0031_posts_comment_count.sql
+-- ✅ posts.comment_count 핫픽스 (Alembic 도입 전 트리 배포용)
+--
+-- [user-031]부터 Post 모델이 comment_count를 읽지만, create_all은 기존 posts 테이블을
+-- 변경하지 않으므로 Alembic(0002)이 들어오기 전 트리를 배포할 때는 먼저 이 파일을 실행한다.
+--     mysql carering < migrations/manual/0031_posts_comment_count.sql
+-- 나중에 alembic stamp 0001 && alembic upgrade head를 해도 0002는 이미 있는 컬럼을 건너뛰고 값만 다시 채운다.
+
+ALTER TABLE posts ADD COLUMN comment_count INT NOT NULL DEFAULT 0;
+
+UPDATE posts SET comment_count = (
+    SELECT COUNT(*) FROM comments WHERE comments.post_id = posts.id
+);
@@ -0,0 +1,238 @@
+"""baseline schema
+
+기존에 Base.metadata.create_all로 만들던 테이블 구조.
+이미 create_all로 만들어진 DB는 이 리비전을 실행하지 말고 표시만 한다:
+    alembic stamp 0001 && alembic upgrade head
+
+Revision ID: 0001
+Revises:
+Create Date: 2025-06-15 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('medicines',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=100), nullable=True),
+    sa.Column('date', sa.String(length=20), nullable=True),
+    sa.Column('time', sa.String(length=20), nullable=False),
+    sa.Column('title', sa.String(length=100), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('medicines', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_medicines_id'), ['id'], unique=False)
+
+    op.create_table('users',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('nickname', sa.String(length=100), nullable=False),
+    sa.Column('email', sa.String(length=100), nullable=False),
+    sa.Column('password', sa.String(length=100), nullable=False),
+    sa.Column('about', sa.String(length=500), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('profile_image', sa.String(length=255), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_users_email'), ['email'], unique=True)
+        batch_op.create_index(batch_op.f('ix_users_id'), ['id'], unique=False)
+
+    op.create_table('basic_info',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=100), nullable=True),
+    sa.Column('birth_date', sa.String(length=20), nullable=True),
+    sa.Column('gender', sa.String(length=10), nullable=True),
+    sa.Column('height', sa.Float(), nullable=True),
+    sa.Column('weight', sa.Float(), nullable=True),
+    sa.Column('image_url', sa.String(length=200), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('user_id')
+    )
+    with op.batch_alter_table('basic_info', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_basic_info_id'), ['id'], unique=False)
+
+    op.create_table('follows',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('follower_id', sa.Integer(), nullable=False),
+    sa.Column('following_id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['follower_id'], ['users.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['following_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('follows', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_follows_id'), ['id'], unique=False)
+
+    op.create_table('lifestyle',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('medical_history', sa.String(length=255), nullable=False),
+    sa.Column('health_goals', sa.String(length=255), nullable=False),
+    sa.Column('diet_tracking', sa.String(length=255), nullable=False),
+    sa.Column('sleep_habits', sa.String(length=255), nullable=False),
+    sa.Column('smoking_alcohol', sa.String(length=255), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('lifestyle', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_lifestyle_id'), ['id'], unique=False)
+
+    op.create_table('messages',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('sender_id', sa.Integer(), nullable=False),
+    sa.Column('receiver_id', sa.Integer(), nullable=False),
+    sa.Column('content', sa.Text(), nullable=False),
+    sa.Column('timestamp', sa.DateTime(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('is_read', sa.Boolean(), nullable=True),
+    sa.ForeignKeyConstraint(['receiver_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['sender_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('messages', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_messages_id'), ['id'], unique=False)
+
+    op.create_table('moods',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('emoji', sa.String(length=10), nullable=False),
+    sa.Column('memo', sa.Text(), nullable=True),
+    sa.Column('image', sa.String(length=255), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('moods', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_moods_id'), ['id'], unique=False)
+
+    op.create_table('posts',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('image', sa.Text(), nullable=True),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('phrase', sa.String(length=500), nullable=True),
+    sa.Column('text', sa.Text(), nullable=True),
+    sa.Column('hashtags', sa.String(length=500), nullable=True),
+    sa.Column('image_url', sa.String(length=1000), nullable=True),
+    sa.Column('location', sa.String(length=255), nullable=True),
+    sa.Column('person_tag', sa.String(length=255), nullable=True),
+    sa.Column('disclosure', sa.String(length=50), nullable=True),
+    sa.Column('likes', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('posts', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_posts_id'), ['id'], unique=False)
+
+    op.create_table('profile_customizations',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=True),
+    sa.Column('background_url', sa.String(length=255), nullable=True),
+    sa.Column('widgets_json', sa.Text(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('user_id')
+    )
+    with op.batch_alter_table('profile_customizations', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_profile_customizations_id'), ['id'], unique=False)
+
+    op.create_table('widget_layouts',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('layout_json', sa.JSON(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('widget_layouts', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_widget_layouts_id'), ['id'], unique=False)
+
+    op.create_table('comments',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('content', sa.String(length=500), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('post_id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.ForeignKeyConstraint(['post_id'], ['posts.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('comments', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_comments_id'), ['id'], unique=False)
+
+    op.create_table('comment_likes',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=True),
+    sa.Column('comment_id', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['comment_id'], ['comments.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('user_id', 'comment_id', name='unique_user_comment_like')
+    )
+    with op.batch_alter_table('comment_likes', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_comment_likes_id'), ['id'], unique=False)
+
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('comment_likes', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_comment_likes_id'))
+
+    op.drop_table('comment_likes')
+    with op.batch_alter_table('comments', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_comments_id'))
+
+    op.drop_table('comments')
+    with op.batch_alter_table('widget_layouts', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_widget_layouts_id'))
+
+    op.drop_table('widget_layouts')
+    with op.batch_alter_table('profile_customizations', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_profile_customizations_id'))
+
+    op.drop_table('profile_customizations')
+    with op.batch_alter_table('posts', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_posts_id'))
+
+    op.drop_table('posts')
+    with op.batch_alter_table('moods', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_moods_id'))
+
+    op.drop_table('moods')
+    with op.batch_alter_table('messages', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_messages_id'))
+
+    op.drop_table('messages')
+    with op.batch_alter_table('lifestyle', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_lifestyle_id'))
+
+    op.drop_table('lifestyle')
+    with op.batch_alter_table('follows', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_follows_id'))
+
+    op.drop_table('follows')
+    with op.batch_alter_table('basic_info', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_basic_info_id'))
+
+    op.drop_table('basic_info')
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_users_id'))
+        batch_op.drop_index(batch_op.f('ix_users_email'))
+
+    op.drop_table('users')
+    with op.batch_alter_table('medicines', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_medicines_id'))
+
+    op.drop_table('medicines')
@@ -0,0 +1,227 @@
+"""schema changes since baseline
+
+- conversation_reads: 대화별 읽음 위치
+- posts.comment_count (+ 기존 댓글 수로 채움, 핫픽스 SQL로 이미 추가된 경우 값만 채움), comments (post_id, created_at, id) 인덱스
+- widget_layouts / profile_customizations 버전 컬럼
+- medicines: 문자열 date/time → DATE/TIME, user_id, (user_id, date) 인덱스
+- medication_plans / medication_doses: 반복 복용 계획과 복용 기록
+- reminder_deliveries: 복용 알림 전송 기록
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2025-06-30 00:00:00
+
+"""
+from datetime import datetime, time
+from typing import Optional, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+DATE_FORMATS = ("%Y-%m-%d", "%Y/%m/%d", "%Y.%m.%d", "%Y%m%d")
+TIME_FORMATS = ("%H:%M:%S", "%H:%M", "%I:%M %p", "%I:%M%p", "%p %I:%M")
+
+
+def _parse(value: Optional[str], formats):
+    if not value:
+        return None
+    value = value.strip().upper().replace("오전", "AM").replace("오후", "PM")
+    for fmt in formats:
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def _convert_medicines():
+    # 문자열 값을 여러 형식으로 파싱해서 새 컬럼에 채움 (파싱 실패: date → NULL, time → 00:00)
+    if op.get_context().as_sql:
+        # --sql(오프라인) 모드에서는 행을 읽을 수 없으므로 ISO 형식 문자열만 DB 캐스팅에 맡김
+        op.execute("UPDATE medicines SET date_value = date, time_value = time")
+        return
+
+    conn = op.get_bind()
+    rows = conn.execute(sa.text("SELECT id, date, time FROM medicines")).all()
+    updates = []
+    for row_id, raw_date, raw_time in rows:
+        parsed_date = _parse(raw_date, DATE_FORMATS)
+        parsed_time = _parse(raw_time, TIME_FORMATS)
+        if parsed_date is None or parsed_time is None:
+            print(f"⚠️ medicines id={row_id}: unparseable date={raw_date!r} time={raw_time!r}")
+        updates.append({
+            "id": row_id,
+            "date_value": parsed_date.date() if parsed_date else None,
+            "time_value": parsed_time.time() if parsed_time else time(0, 0),
+        })
+    if updates:
+        conn.execute(
+            sa.text(
+                "UPDATE medicines SET date_value = :date_value, time_value = :time_value WHERE id = :id"
+            ).bindparams(sa.bindparam("date_value", type_=sa.Date()), sa.bindparam("time_value", type_=sa.Time())),
+            updates
+        )
+
+
+def _has_column(table: str, column: str) -> bool:
+    if op.get_context().as_sql:
+        return False
+    return any(c["name"] == column for c in sa.inspect(op.get_bind()).get_columns(table))
+
+
+def upgrade() -> None:
+    op.create_table('conversation_reads',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('peer_id', sa.Integer(), nullable=False),
+    sa.Column('last_read_message_id', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['peer_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('user_id', 'peer_id', name='unique_conversation_read')
+    )
+    with op.batch_alter_table('conversation_reads', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_conversation_reads_id'), ['id'], unique=False)
+
+    op.create_table('medication_plans',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(length=100), nullable=False),
+    sa.Column('frequency', sa.String(length=10), nullable=False),
+    sa.Column('interval_days', sa.Integer(), nullable=False),
+    sa.Column('weekdays', sa.JSON(), nullable=True),
+    sa.Column('times', sa.JSON(), nullable=False),
+    sa.Column('start_date', sa.Date(), nullable=False),
+    sa.Column('end_date', sa.Date(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('medication_plans', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_medication_plans_id'), ['id'], unique=False)
+        batch_op.create_index('ix_medication_plans_user_start', ['user_id', 'start_date'], unique=False)
+
+    op.create_table('reminder_deliveries',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('source_key', sa.String(length=64), nullable=False),
+    sa.Column('due_at', sa.DateTime(), nullable=False),
+    sa.Column('status', sa.String(length=10), nullable=False),
+    sa.Column('sent_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('source_key')
+    )
+    with op.batch_alter_table('reminder_deliveries', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_reminder_deliveries_id'), ['id'], unique=False)
+        batch_op.create_index('ix_reminder_deliveries_user_due', ['user_id', 'due_at'], unique=False)
+
+    op.create_table('medication_doses',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('plan_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('date', sa.Date(), nullable=False),
+    sa.Column('time', sa.Time(), nullable=False),
+    sa.Column('status', sa.String(length=10), nullable=False),
+    sa.Column('recorded_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['plan_id'], ['medication_plans.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('plan_id', 'date', 'time', name='unique_medication_dose')
+    )
+    with op.batch_alter_table('medication_doses', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_medication_doses_id'), ['id'], unique=False)
+        batch_op.create_index('ix_medication_doses_user_date', ['user_id', 'date'], unique=False)
+
+    with op.batch_alter_table('comments', schema=None) as batch_op:
+        batch_op.create_index('ix_comments_post_created_id', ['post_id', 'created_at', 'id'], unique=False)
+
+    # medicines: 새 컬럼에 변환해서 채운 뒤 기존 문자열 컬럼과 교체
+    # (이전 데이터에는 소유자가 없으므로 user_id는 NULL로 남음)
+    with op.batch_alter_table('medicines', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('user_id', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('date_value', sa.Date(), nullable=True))
+        batch_op.add_column(sa.Column('time_value', sa.Time(), nullable=True))
+    _convert_medicines()
+    with op.batch_alter_table('medicines', schema=None) as batch_op:
+        batch_op.drop_column('date')
+        batch_op.drop_column('time')
+    with op.batch_alter_table('medicines', schema=None) as batch_op:
+        batch_op.alter_column('date_value', new_column_name='date', existing_type=sa.Date(), existing_nullable=True)
+        batch_op.alter_column('time_value', new_column_name='time', existing_type=sa.Time(), nullable=False)
+    with op.batch_alter_table('medicines', schema=None) as batch_op:
+        batch_op.create_index('ix_medicines_user_date', ['user_id', 'date'], unique=False)
+        batch_op.create_foreign_key('fk_medicines_user', 'users', ['user_id'], ['id'], ondelete='CASCADE')
+
+    # migrations/manual/0031_posts_comment_count.sql로 먼저 추가한 DB는 컬럼을 건너뛰고 값만 다시 채움
+    if not _has_column('posts', 'comment_count'):
+        with op.batch_alter_table('posts', schema=None) as batch_op:
+            batch_op.add_column(sa.Column('comment_count', sa.Integer(), server_default='0', nullable=False))
+    op.execute(
+        "UPDATE posts SET comment_count = "
+        "(SELECT COUNT(*) FROM comments WHERE comments.post_id = posts.id)"
+    )
+
+    with op.batch_alter_table('profile_customizations', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+    with op.batch_alter_table('widget_layouts', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+        batch_op.add_column(sa.Column('updated_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('widget_layouts', schema=None) as batch_op:
+        batch_op.drop_column('updated_at')
+        batch_op.drop_column('version')
+
+    with op.batch_alter_table('profile_customizations', schema=None) as batch_op:
+        batch_op.drop_column('version')
+
+    with op.batch_alter_table('posts', schema=None) as batch_op:
+        batch_op.drop_column('comment_count')
+
+    # DATE/TIME 값은 "YYYY-MM-DD" / "HH:MM:SS" 문자열로 되돌림
+    with op.batch_alter_table('medicines', schema=None) as batch_op:
+        batch_op.drop_constraint('fk_medicines_user', type_='foreignkey')
+        batch_op.drop_index('ix_medicines_user_date')
+        batch_op.alter_column('time',
+               existing_type=sa.Time(),
+               type_=sa.VARCHAR(length=20),
+               existing_nullable=False)
+        batch_op.alter_column('date',
+               existing_type=sa.Date(),
+               type_=sa.VARCHAR(length=20),
+               existing_nullable=True)
+        batch_op.drop_column('user_id')
+
+    with op.batch_alter_table('comments', schema=None) as batch_op:
+        batch_op.drop_index('ix_comments_post_created_id')
+
+    with op.batch_alter_table('medication_doses', schema=None) as batch_op:
+        batch_op.drop_index('ix_medication_doses_user_date')
+        batch_op.drop_index(batch_op.f('ix_medication_doses_id'))
+
+    op.drop_table('medication_doses')
+    with op.batch_alter_table('reminder_deliveries', schema=None) as batch_op:
+        batch_op.drop_index('ix_reminder_deliveries_user_due')
+        batch_op.drop_index(batch_op.f('ix_reminder_deliveries_id'))
+
+    op.drop_table('reminder_deliveries')
+    with op.batch_alter_table('medication_plans', schema=None) as batch_op:
+        batch_op.drop_index('ix_medication_plans_user_start')
+        batch_op.drop_index(batch_op.f('ix_medication_plans_id'))
+
+    op.drop_table('medication_plans')
+    with op.batch_alter_table('conversation_reads', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_conversation_reads_id'))
+
+    op.drop_table('conversation_reads')
@@ -0,0 +1,70 @@
+"""index pack for foreign keys and hot filters
+
+라우트에서 실제로 쓰는 조건/정렬에 맞춘 보조 인덱스.
+
+- messages (sender_id, receiver_id, timestamp): /messages/sent, /received, /chat, 대화 삭제,
+  읽음 위치 계산(max(id) — InnoDB 보조 인덱스에는 PK가 포함됨)
+- messages (receiver_id, sender_id, is_read): 상대별 안 읽은 개수, 대화 목록의 받은 메시지 쪽
+- moods (user_id, created_at): 팔로잉 사용자별 최신 무드 / moods (created_at): 12시간 지난 무드 정리
+- follows (follower_id, following_id): 팔로잉 목록·여부 / follows (following_id): 팔로워 수
+- lifestyle.user_id, widget_layouts.user_id, posts.user_id, comment_likes.comment_id
+- comments.post_id는 0002의 (post_id, created_at, id) 인덱스가 이미 담당
+
+MySQL(InnoDB)은 인덱스가 없는 FK 컬럼에 자동 인덱스를 만들어 두는데,
+같은 컬럼으로 시작하는 인덱스가 생기면 그 자동 인덱스는 알아서 정리된다.
+인덱스 사용 여부는 scripts/check_indexes.py로 EXPLAIN 확인.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2025-07-02 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (테이블, 인덱스 이름, 컬럼)
+INDEXES = [
+    ('messages', 'ix_messages_sender_receiver_ts', ['sender_id', 'receiver_id', 'timestamp']),
+    ('messages', 'ix_messages_receiver_sender_read', ['receiver_id', 'sender_id', 'is_read']),
+    ('moods', 'ix_moods_user_created', ['user_id', 'created_at']),
+    ('moods', 'ix_moods_created_at', ['created_at']),
+    ('follows', 'ix_follows_follower_following', ['follower_id', 'following_id']),
+    ('follows', 'ix_follows_following_id', ['following_id']),
+    ('lifestyle', 'ix_lifestyle_user_id', ['user_id']),
+    ('widget_layouts', 'ix_widget_layouts_user_id', ['user_id']),
+    ('posts', 'ix_posts_user_id', ['user_id']),
+    ('comment_likes', 'ix_comment_likes_comment_id', ['comment_id']),
+]
+
+
+def upgrade() -> None:
+    for table, name, columns in INDEXES:
+        op.create_index(name, table, columns, unique=False)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    for table, name, columns in reversed(INDEXES):
+        if bind.dialect.name == 'mysql' and not op.get_context().as_sql:
+            _keep_fk_index(bind, table, name, columns[0])
+        op.drop_index(name, table_name=table)
+
+
+def _keep_fk_index(bind, table: str, dropping: str, column: str):
+    # MySQL은 FK가 쓰는 마지막 인덱스를 지울 수 없으므로, 자동 인덱스와 같은 모양을 먼저 만들어 둠
+    inspector = sa.inspect(bind)
+    fk_columns = {c for fk in inspector.get_foreign_keys(table) for c in fk['constrained_columns']}
+    if column not in fk_columns:
+        return
+    others = [ix for ix in inspector.get_indexes(table) if ix['name'] != dropping and ix['column_names'][:1] == [column]]
+    if not others:
+        op.create_index(column, table, [column], unique=False)
@@ -0,0 +1,41 @@
+"""widget_layouts: one row per user
+
+동시에 처음 저장한 디바이스들이 같은 사용자 행을 여러 개 만들 수 있었으므로
+user_id에 유니크 제약을 건다. 중복 행은 라우트가 읽고 고쳐 온 가장 작은 id만 남긴다.
+유니크 인덱스가 FK와 조회를 모두 맡으므로 0003의 ix_widget_layouts_user_id는 지운다.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2025-07-10 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # MySQL은 DELETE 대상 테이블을 서브쿼리에서 바로 읽을 수 없어 파생 테이블로 한 번 감쌈
+    op.execute(
+        "DELETE FROM widget_layouts WHERE id NOT IN ("
+        "SELECT keep_id FROM (SELECT MIN(id) AS keep_id FROM widget_layouts GROUP BY user_id) AS keep)"
+    )
+    with op.batch_alter_table('widget_layouts', schema=None) as batch_op:
+        batch_op.create_unique_constraint('uq_widget_layouts_user_id', ['user_id'])
+    with op.batch_alter_table('widget_layouts', schema=None) as batch_op:
+        batch_op.drop_index('ix_widget_layouts_user_id')
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('widget_layouts', schema=None) as batch_op:
+        batch_op.create_index('ix_widget_layouts_user_id', ['user_id'], unique=False)
+    with op.batch_alter_table('widget_layouts', schema=None) as batch_op:
+        batch_op.drop_constraint('uq_widget_layouts_user_id', type_='unique')
@@ -0,0 +1,55 @@
+"""medicines: assign an owner to rows created before user_id
+
+0002부터 /medicines 조회는 현재 사용자의 행만 돌려주므로, user_id가 NULL인 이전 데이터는
+아무에게도 보이지 않는다. 소유자를 알 수 없으니 다음 순서로 정한다.
+- alembic -x medicine_owner=<user_id> upgrade head 로 지정한 사용자
+- 지정하지 않았고 사용자가 한 명뿐인 DB라면 그 사용자 (예전 목록은 전체 공용이었음)
+- 그 밖에는 NULL로 두고 남은 행 수를 경고로 출력 (지정해서 다시 적용하려면
+  alembic downgrade 0004 && alembic -x medicine_owner=<user_id> upgrade head)
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2025-07-12 00:00:00
+
+"""
+from typing import Optional, Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _owner() -> Optional[int]:
+    value = context.get_x_argument(as_dictionary=True).get("medicine_owner")
+    if value:
+        return int(value)
+    if op.get_context().as_sql:
+        return None   # --sql(오프라인) 모드에서는 사용자 수를 셀 수 없음
+    user_ids = op.get_bind().execute(sa.text("SELECT id FROM users LIMIT 2")).scalars().all()
+    return user_ids[0] if len(user_ids) == 1 else None
+
+
+def upgrade() -> None:
+    owner = _owner()
+    if owner is not None:
+        op.execute(
+            sa.text("UPDATE medicines SET user_id = :owner WHERE user_id IS NULL").bindparams(owner=owner)
+        )
+        return
+    if op.get_context().as_sql:
+        return
+    orphans = op.get_bind().execute(sa.text("SELECT COUNT(*) FROM medicines WHERE user_id IS NULL")).scalar()
+    if orphans:
+        print(f"⚠️ medicines: {orphans} rows have no owner and are hidden from /medicines; "
+              f"rerun with -x medicine_owner=<user_id> to assign them")
+
+
+def downgrade() -> None:
+    # 원래 NULL이던 행을 구분할 수 없으므로 되돌리지 않음
+    pass
@@ -0,0 +1,131 @@
+# scripts/check_indexes.py
+# ✅ 자주 쓰는 쿼리가 인덱스를 타는지 EXPLAIN으로 확인
+#
+# 라우트와 같은 모양의 쿼리를 만들어 EXPLAIN(MySQL) / EXPLAIN QUERY PLAN(SQLite)을 실행하고,
+# 기대한 인덱스가 계획에 없으면 실패(종료 코드 1)로 끝난다. 배포 전이나 마이그레이션 후에 실행.
+#
+# 실행: cd backend && python -m scripts.check_indexes [--url sqlite:///check.db]
+# 테이블이 없으면(마이그레이션 전) 종료 코드 2로 `alembic upgrade head`를 먼저 하라고 안내한다.
+# 같은 검사를 tests/test_indexes.py가 pytest로 돌린다.
+# 빈 테이블에서는 MySQL 옵티마이저가 풀스캔을 고를 수 있으므로, MySQL은 데이터가 있는 DB에서 확인.
+
+import argparse
+import sys
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, desc, func, and_, inspect, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from app.database import DATABASE_URL
+from app.models import Comment, CommentLike, ConversationRead, Follow, Lifestyle, Message, Mood, Post
+from app.models import profile_customization  # noqa: F401  (User 관계 설정용)
+from app.models.widget_layout import WidgetLayout
+
+ME, PEER = 1, 2
+TABLES = ("messages", "conversation_reads", "moods", "follows", "lifestyle",
+          "widget_layouts", "posts", "comments", "comment_likes")
+
+
+def hot_queries(db: Session):
+    """(이름, 기대 인덱스(여럿이면 그중 하나), 쿼리) — routes/*.py, utils/read_receipts.py의 조건 그대로"""
+    return [
+        ("messages: sent / received", "ix_messages_sender_receiver_ts",
+         db.query(Message.id, Message.content, Message.timestamp).filter(
+             Message.sender_id == ME, Message.receiver_id == PEER
+         ).order_by(Message.timestamp)),
+        ("messages: read marker", ("ix_messages_sender_receiver_ts", "ix_messages_receiver_sender_read"),
+         db.query(func.max(Message.id)).filter(Message.sender_id == PEER, Message.receiver_id == ME)),
+        ("messages: unread counts", "ix_messages_receiver_sender_read",
+         db.query(Message.sender_id, func.count(Message.id)).outerjoin(
+             ConversationRead,
+             and_(ConversationRead.user_id == Message.receiver_id, ConversationRead.peer_id == Message.sender_id)
+         ).filter(
+             Message.receiver_id == ME,
+             Message.id > func.coalesce(ConversationRead.last_read_message_id, 0),
+             Message.is_read == False
+         ).group_by(Message.sender_id)),
+        ("moods: latest per user", "ix_moods_user_created",
+         db.query(Mood.user_id, Mood.emoji, Mood.created_at).filter(
+             Mood.user_id.in_([ME, PEER])
+         ).order_by(Mood.user_id, desc(Mood.created_at))),
+        ("moods: expire", "ix_moods_created_at",
+         db.query(Mood.id).filter(Mood.created_at < datetime(2025, 1, 1) - timedelta(hours=12))),
+        ("follows: is following", "ix_follows_follower_following",
+         db.query(Follow.id).filter(Follow.follower_id == ME, Follow.following_id == PEER)),
+        ("follows: follower count", "ix_follows_following_id",
+         db.query(func.count(Follow.id)).filter(Follow.following_id == ME)),
+        ("lifestyle: by user", "ix_lifestyle_user_id",
+         db.query(Lifestyle).filter(Lifestyle.user_id == ME)),
+        # SQLite는 UNIQUE 제약의 인덱스 이름을 sqlite_autoindex_<테이블>_N 으로 붙인다
+        ("widget_layouts: by user", ("uq_widget_layouts_user_id", "sqlite_autoindex_widget_layouts_1"),
+         db.query(WidgetLayout).filter_by(user_id=ME)),
+        ("posts: by user", "ix_posts_user_id",
+         db.query(Post.id).filter(Post.user_id == ME)),
+        ("comments: page by post", "ix_comments_post_created_id",
+         db.query(Comment.id).filter(Comment.post_id == 1).order_by(Comment.created_at, Comment.id).limit(21)),
+        ("comment_likes: by comment", "ix_comment_likes_comment_id",
+         db.query(CommentLike.id).filter(CommentLike.comment_id == 1)),
+    ]
+
+
+def explain(db: Session, query) -> str:
+    dialect = db.get_bind().dialect
+    sql = str(query.statement.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+    prefix = "EXPLAIN QUERY PLAN " if dialect.name == "sqlite" else "EXPLAIN "
+    result = db.execute(text(prefix + sql))
+    columns = list(result.keys())
+    rows = result.all()
+    if dialect.name == "sqlite":
+        return "\n".join(row[-1] for row in rows)
+    # MySQL: 실제로 고른 인덱스(key) 컬럼만 봄
+    key = columns.index("key")
+    return "\n".join(f"{row[columns.index('table')]}: {row[key]}" for row in rows)
+
+
+def missing_tables(engine) -> list:
+    """hot_queries가 쓰는 테이블 중 DB에 없는 것 (연결 실패는 OperationalError 그대로)"""
+    existing = set(inspect(engine).get_table_names())
+    return [table for table in TABLES if table not in existing]
+
+
+def check(db: Session):
+    """(이름, 기대 인덱스 튜플, 계획, 통과 여부)를 쿼리마다 돌려준다"""
+    for name, expected, query in hot_queries(db):
+        indexes = (expected,) if isinstance(expected, str) else expected
+        plan = explain(db, query)
+        yield name, indexes, plan, any(index in plan for index in indexes)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that hot queries use their indexes")
+    parser.add_argument("--url", default=DATABASE_URL)
+    parser.add_argument("-v", "--verbose", action="store_true", help="print every plan")
+    args = parser.parse_args()
+
+    engine = create_engine(args.url)
+    try:
+        missing = missing_tables(engine)
+    except OperationalError as e:
+        print(f"❌ cannot connect to the database: {e.orig}")
+        sys.exit(2)
+    if missing:
+        print(f"❌ missing tables: {', '.join(missing)} — run `alembic upgrade head` first")
+        sys.exit(2)
+
+    failures = 0
+    with Session(engine) as db:
+        for name, indexes, plan, ok in check(db):
+            failures += not ok
+            print(f"{'✅' if ok else '❌'} {name} → {' / '.join(indexes)}")
+            if args.verbose or not ok:
+                print("    " + plan.replace("\n", "\n    "))
+    engine.dispose()
+
+    if failures:
+        print(f"❌ {failures} queries do not use the expected index")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
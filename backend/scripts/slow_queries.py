@@ -0,0 +1,47 @@
+# scripts/slow_queries.py
+# ✅ 실행 중인 서버의 SQL 지문 통계를 표로 보기 (GET /metrics/slow-queries)
+#
+# 실행: cd backend && python -m scripts.slow_queries [--url http://localhost:51235] [--sort p95_ms] [--limit 20] [--explain]
+# 통계는 워커 프로세스마다 따로 쌓이므로 워커가 여럿이면 각 워커 주소로 확인.
+
+import argparse
+import json
+import sys
+from urllib.parse import urlencode
+from urllib.request import urlopen
+
+
+def fetch(base_url: str, limit: int, sort: str) -> dict:
+    query = urlencode({"limit": limit, "sort": sort})
+    with urlopen(f"{base_url.rstrip('/')}/metrics/slow-queries?{query}", timeout=10) as resp:
+        return json.load(resp)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Top SQL fingerprints by time")
+    parser.add_argument("--url", default="http://localhost:51235")
+    parser.add_argument("--sort", default="total_ms", help="total_ms, p95_ms, max_ms, mean_ms, count, slow")
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--explain", action="store_true", help="print captured EXPLAIN plans")
+    parser.add_argument("--json", action="store_true", help="print the raw report")
+    args = parser.parse_args()
+
+    report = fetch(args.url, args.limit, args.sort)
+    if args.json:
+        json.dump(report, sys.stdout, indent=2, ensure_ascii=False)
+        print()
+        return
+
+    print(f"threshold {report['threshold_ms']}ms, {report['fingerprints']} fingerprints, {report['dropped']} dropped")
+    print(f"{'id':12}  {'count':>7}  {'slow':>5}  {'total_ms':>10}  {'p50':>8}  {'p95':>8}  {'max':>8}  top route")
+    for entry in report["top"]:
+        route = next(iter(entry["routes"]), "-")
+        print(f"{entry['id']:12}  {entry['count']:>7}  {entry['slow']:>5}  {entry['total_ms']:>10.1f}  "
+              f"{entry['p50_ms']:>8.2f}  {entry['p95_ms']:>8.2f}  {entry['max_ms']:>8.2f}  {route}")
+        print(f"    {entry['fingerprint'][:160]}")
+        if args.explain and entry["explain"]:
+            print("    " + entry["explain"].replace("\n", "\n    "))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+# tests/conftest.py
+# ✅ 공용 픽스처: 임시 SQLite + fakeredis로 띄운 앱, 쿼리 예산
+#
+# 실행: cd backend && pip install -r tests/requirements.txt && python -m pytest
+# app.config가 import되기 전에 DATABASE_URL을 바꿔야 하므로 환경 설정은 모듈 최상단에서 한다.
+# (실제 .env의 DB에는 절대 연결하지 않음)
+#
+#     def test_posts(client, query_budget):
+#         with query_budget(2):
+#             client.get("/posts")
+
+import os
+import tempfile
+
+os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(tempfile.mkdtemp(prefix="carering-test-"), "test.db")
+os.environ.setdefault("LOG_LEVEL", "ERROR")
+
+import pytest
+
+from benchmarks.api_bench import use_fake_redis
+
+use_fake_redis()
+
+SEED_USERS = 20
+
+
+@pytest.fixture(scope="session")
+def client():
+    from fastapi.testclient import TestClient
+
+    import app.main
+    from app.database import engine
+    from benchmarks.datagen import create_schema, generate
+
+    create_schema(engine)
+    generate(engine, users=SEED_USERS)
+    return TestClient(app.main.app)
+
+
+@pytest.fixture
+def auth():
+    """auth(user_id) → Authorization 헤더"""
+    from app.auth.utils import create_access_token
+
+    return lambda user_id: {"Authorization": f"Bearer {create_access_token(data={'user_id': user_id})}"}
+
+
+@pytest.fixture
+def query_budget(monkeypatch):
+    """
+    Context manager that fails the test when the block runs more SQL statements than allowed.
+    The response cache is turned off so a cached body cannot hide the route's queries.
+    """
+    from app.config import settings
+    from app.utils.query_stats import query_budget
+
+    monkeypatch.setattr(settings, "response_cache", False)
+    return query_budget
@@ -0,0 +1,53 @@
+# tests/test_indexes.py
+# ✅ 자주 쓰는 쿼리가 기대한 인덱스를 타는지 (scripts/check_indexes.py와 같은 검사)
+#
+# CHECK_INDEXES_URL이 있으면 그 DB를 검사한다. 연결이 안 되거나 마이그레이션 전이면 skip.
+# 없으면 임시 SQLite에 `alembic upgrade head`를 적용해 검사하므로 DB 서버 없이도 돈다.
+# (빈 테이블에서 MySQL은 풀스캔을 고를 수 있으니 MySQL은 데이터가 있는 DB로)
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from scripts.check_indexes import check, hot_queries, missing_tables
+
+BACKEND = Path(__file__).resolve().parents[1]
+NAMES = [name for name, _, _ in hot_queries(Session())]
+
+
+def _migrated_sqlite(tmp_dir: Path) -> str:
+    url = f"sqlite:///{tmp_dir / 'indexes.db'}"
+    subprocess.run(
+        [sys.executable, "-m", "alembic", "-x", f"url={url}", "upgrade", "head"],
+        cwd=BACKEND, check=True, capture_output=True,
+    )
+    return url
+
+
+@pytest.fixture(scope="module")
+def plans(tmp_path_factory):
+    url = os.environ.get("CHECK_INDEXES_URL") or _migrated_sqlite(tmp_path_factory.mktemp("db"))
+    engine = create_engine(url)
+    try:
+        missing = missing_tables(engine)
+    except OperationalError as e:
+        pytest.skip(f"no database at CHECK_INDEXES_URL: {e.orig}")
+    if missing:
+        pytest.skip(f"missing tables {missing} — run `alembic upgrade head` first")
+
+    with Session(engine) as db:
+        result = {name: (indexes, plan, ok) for name, indexes, plan, ok in check(db)}
+    engine.dispose()
+    return result
+
+
+@pytest.mark.parametrize("name", NAMES)
+def test_hot_query_uses_index(plans, name):
+    indexes, plan, ok = plans[name]
+    assert ok, f"{name}: expected {' / '.join(indexes)}\n{plan}"
@@ -0,0 +1,36 @@
+# tests/test_metrics.py
+# ✅ 스레드별 샤드 합산: 끝난 스레드의 샤드는 합쳐지고 목록에서 빠진다
+
+import threading
+
+from app.utils.metrics import _Sharded
+
+
+def test_dead_thread_shards_are_folded():
+    values = _Sharded()
+
+    def work():
+        for _ in range(10):
+            values.add(("GET", "/posts"))
+
+    for _ in range(20):
+        thread = threading.Thread(target=work)
+        thread.start()
+        thread.join()
+    values.add(("GET", "/posts"))
+
+    assert values.merged() == {("GET", "/posts"): 201}
+    assert len(values._shards) == 1   # 현재 스레드만 남음
+
+
+def _gauge(body: str, series: str) -> float:
+    for line in body.splitlines():
+        if line.startswith(series + " "):
+            return float(line.rsplit(" ", 1)[1])
+    return 0.0
+
+
+def test_comment_websockets_are_counted(client):
+    series = 'carering_websocket_connections{transport="comment_ws",room="post_*"}'
+    with client.websocket_connect("/ws/comments/1"):
+        assert _gauge(client.get("/metrics").text, series) >= 1
@@ -0,0 +1,51 @@
+# tests/test_migrations.py
+# ✅ 0005: 소유자가 없는 이전 복용약 행을 채운다
+
+import subprocess
+import sys
+from pathlib import Path
+
+from sqlalchemy import create_engine, text
+
+BACKEND = Path(__file__).resolve().parents[1]
+
+
+def _alembic(url: str, *args: str):
+    subprocess.run([sys.executable, "-m", "alembic", "-x", f"url={url}", *args],
+                   cwd=BACKEND, check=True, capture_output=True)
+
+
+def _seed(url: str, users: int):
+    engine = create_engine(url)
+    with engine.begin() as conn:
+        for i in range(1, users + 1):
+            conn.execute(text("INSERT INTO users (id, nickname, email, password) VALUES (:id, 'u', :email, 'x')"),
+                         {"id": i, "email": f"u{i}@example.com"})
+        conn.execute(text("INSERT INTO medicines (title, date, time) VALUES ('vitamin', '2025-07-01', '08:00:00')"))
+    return engine
+
+
+def _owners(engine):
+    with engine.connect() as conn:
+        return conn.execute(text("SELECT user_id FROM medicines")).scalars().all()
+
+
+def test_single_user_database_gets_legacy_medicines(tmp_path):
+    url = f"sqlite:///{tmp_path / 'one.db'}"
+    _alembic(url, "upgrade", "0004")
+    engine = _seed(url, users=1)
+    _alembic(url, "upgrade", "head")
+    assert _owners(engine) == [1]
+
+
+def test_owner_must_be_given_when_several_users(tmp_path):
+    url = f"sqlite:///{tmp_path / 'many.db'}"
+    _alembic(url, "upgrade", "0004")
+    engine = _seed(url, users=2)
+    _alembic(url, "upgrade", "head")
+    assert _owners(engine) == [None]
+
+    _alembic(url, "downgrade", "0004")
+    subprocess.run([sys.executable, "-m", "alembic", "-x", f"url={url}", "-x", "medicine_owner=2",
+                    "upgrade", "head"], cwd=BACKEND, check=True, capture_output=True)
+    assert _owners(engine) == [2]
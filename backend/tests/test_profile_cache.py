@@ -0,0 +1,30 @@
+# tests/test_profile_cache.py
+# ✅ 버전 포인터는 앞으로만 움직이고, 옮기지 못하면 지운다
+
+from redis.exceptions import RedisError
+
+from app.utils import profile_cache
+from app.utils.redis import get_redis
+
+NS = "test_profile"
+
+
+def test_bump_version_never_moves_backwards():
+    key = profile_cache._version_key(NS, 1)
+    profile_cache.bump_version(NS, 1, 3)
+    profile_cache.bump_version(NS, 1, 2)   # 늦게 도착한 이전 커밋
+    assert get_redis().get(key) == "3"
+    profile_cache.bump_version(NS, 1, 4)
+    assert get_redis().get(key) == "4"
+
+
+def test_bump_version_deletes_pointer_when_script_fails(monkeypatch):
+    key = profile_cache._version_key(NS, 2)
+    get_redis().set(key, 1)
+
+    def broken(**kwargs):
+        raise RedisError("down")
+
+    monkeypatch.setattr(profile_cache, "_script", lambda: broken)
+    profile_cache.bump_version(NS, 2, 2)
+    assert get_redis().get(key) is None
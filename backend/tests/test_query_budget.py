@@ -0,0 +1,33 @@
+# tests/test_query_budget.py
+# ✅ 주요 조회 API의 쿼리 수 예산 (N+1이 다시 생기면 실패)
+#
+# 예산은 현재 쿼리 수 그대로다. 라우트를 바꿔 쿼리가 늘었다면 이유를 확인한 뒤 숫자를 고친다.
+# 인증이 필요한 라우트는 get_current_user의 사용자 조회 1개가 포함된다.
+
+import pytest
+
+BUDGETS = [
+    ("/posts", False, 2),
+    ("/posts/1/comments", False, 1),
+    ("/users/2", False, 1),
+    ("/search?query=user1", False, 2),
+    ("/messages/users", True, 3),
+    ("/messages/chat/2", True, 2),
+    ("/follow/2", True, 4),
+]
+
+
+@pytest.mark.parametrize("path, needs_auth, budget", BUDGETS)
+def test_query_budget(client, auth, query_budget, path, needs_auth, budget):
+    headers = auth(1) if needs_auth else {}
+    with query_budget(budget):
+        response = client.get(path, headers=headers)
+    assert response.status_code == 200
+
+
+def test_query_budget_fails_when_exceeded(client, query_budget):
+    from app.utils.query_stats import QueryBudgetExceeded
+
+    with pytest.raises(QueryBudgetExceeded):
+        with query_budget(0):
+            client.get("/posts")
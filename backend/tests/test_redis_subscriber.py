@@ -0,0 +1,39 @@
+# tests/test_redis_subscriber.py
+# ✅ 댓글 fan-out: 실패한 소켓만 빠지고, 전송 중에 새로 붙은 소켓은 유지
+
+import asyncio
+
+from app.redis_subscriber import RedisBridge
+from app.routes.comment import active_connections
+
+POST_ID = 987654
+
+
+class FakeSocket:
+    def __init__(self, fail=False, on_send=None):
+        self.fail = fail
+        self.on_send = on_send
+        self.sent = []
+
+    async def send_text(self, text):
+        if self.on_send:
+            self.on_send()
+        await asyncio.sleep(0)
+        if self.fail:
+            raise RuntimeError("closed")
+        self.sent.append(text)
+
+
+def test_dispatch_post_removes_only_failed_sockets():
+    joined = FakeSocket()
+    ok = FakeSocket(on_send=lambda: active_connections[POST_ID].append(joined))
+    broken = FakeSocket(fail=True)
+    active_connections[POST_ID] = [ok, broken]
+    try:
+        asyncio.run(RedisBridge()._dispatch_post(
+            {"type": "new_comment", "comment": {"post_id": POST_ID, "content": "hi"}}
+        ))
+        assert ok.sent
+        assert active_connections[POST_ID] == [ok, joined]
+    finally:
+        active_connections.pop(POST_ID, None)
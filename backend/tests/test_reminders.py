@@ -0,0 +1,51 @@
+# tests/test_reminders.py
+# ✅ 창 끝이 오래 지나도(DB 장애, 루프 정지) GRACE보다 오래된 알림은 몰아 보내지 않음
+
+import asyncio
+from datetime import datetime, timedelta
+
+from app.reminders import GRACE, ReminderScheduler, _Reminder
+
+
+def _reminder(key: str, due_at: datetime) -> _Reminder:
+    return _Reminder(key, 1, due_at, {"title": key})
+
+
+def test_stale_window_end_is_clamped_to_grace():
+    scheduler = ReminderScheduler()
+    scheduler._window_end = datetime.now() - timedelta(hours=3)
+    loads = []
+
+    def load_window(start, end):
+        loads.append((start, end))
+        return [], {}
+
+    scheduler._load_window = load_window
+
+    async def run():
+        scheduler.start()
+        for _ in range(100):
+            if loads:
+                break
+            await asyncio.sleep(0.01)
+        await scheduler.stop()
+
+    before = datetime.now()
+    asyncio.run(run())
+    start, _ = loads[0]
+    assert start >= before - GRACE
+
+
+def test_pop_due_drops_reminders_older_than_grace():
+    scheduler = ReminderScheduler()
+    now = datetime.now()
+    scheduler._push_many([
+        _reminder("stale", now - timedelta(hours=3)),
+        _reminder("late", now - GRACE / 2),
+    ])
+
+    due = scheduler._pop_due(now.timestamp())
+
+    assert [r.key for r in due] == ["late"]
+    assert scheduler.stats["expired"] == 1
+    assert not scheduler._entries
@@ -0,0 +1,41 @@
+# tests/test_slow_queries.py
+# ✅ SQL 지문 정규화 / 메모이즈, EXPLAIN 실행기는 하나만
+
+import threading
+
+from app.utils.slow_queries import SlowQueryLog, fingerprint
+
+
+def test_fingerprint_normalizes_literals_and_lists():
+    assert fingerprint("SELECT * FROM posts WHERE id IN (%s, %s, %s) AND title = 'a''b'") == \
+        "SELECT * FROM posts WHERE id IN (...) AND title = ?"
+    assert fingerprint("SELECT  1\n FROM users WHERE id = 42") == "SELECT ? FROM users WHERE id = ?"
+
+
+def test_fingerprint_is_memoized():
+    statement = "SELECT users.id FROM users WHERE users.id = ?"
+    fingerprint(statement)
+    hits = fingerprint.cache_info().hits
+    fingerprint(statement)
+    assert fingerprint.cache_info().hits == hits + 1
+
+
+def test_concurrent_submits_share_one_explainer():
+    log = SlowQueryLog(threshold_ms=0, explain=True)
+    log._capture_explain = lambda *args: None
+    created = []
+    barrier = threading.Barrier(8)
+
+    def submit():
+        barrier.wait()
+        log._submit_explain(None, "SELECT 1", ())
+        created.append(log._explainer)
+
+    threads = [threading.Thread(target=submit) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    log.shutdown()
+
+    assert len(set(map(id, created))) == 1
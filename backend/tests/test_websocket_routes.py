@@ -0,0 +1,33 @@
+# tests/test_websocket_routes.py
+# ✅ /ws: presence(Redis) 기록이 실패해도 연결과 이 워커로의 전달은 유지
+
+import json
+import time
+
+from redis.exceptions import RedisError
+
+from app import presence
+
+USER_ID = 424242
+
+
+def test_join_survives_redis_failure(client, monkeypatch):
+    def down(*args, **kwargs):
+        raise RedisError("down")
+
+    async def register_down(*args, **kwargs):
+        down()
+
+    monkeypatch.setattr(presence, "register", register_down)
+    monkeypatch.setattr(presence, "get_async_redis", down)
+
+    with client.websocket_connect("/ws") as ws:
+        ws.send_text(json.dumps({"type": "join", "userId": USER_ID}))
+        ws.send_text(json.dumps({"type": "join", "userId": USER_ID}))
+        # 서버는 다른 스레드에서 돌므로 등록될 때까지 잠깐 기다림
+        for _ in range(100):
+            if presence.local_connections.get(USER_ID):
+                break
+            time.sleep(0.01)
+        assert len(presence.local_connections[USER_ID]) == 1
+    assert USER_ID not in presence.local_connections
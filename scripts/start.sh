@@ -24,6 +24,8 @@ pip install redis
 pip install pydantic-settings
 python -m pip install --break-system-packages -r requirements.txt
 python -m pip install "passlib[bcrypt]" --break-system-packages
+# DB 스키마 최신으로 (기존 DB는 처음 한 번 alembic stamp 0001 후 실행)
+alembic upgrade head
 uvicorn app.main:app --host 0.0.0.0 --port 51235 &
 
 # React Native 실행